@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    Troubleshooter,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count
+from ansible_collections.cloud.aws_troubleshooting.plugins.plugin_utils.describe import (
+    DESCRIBE_ARGUMENT_SPEC,
+    DESCRIBE_REQUIRED_IF,
+    DescribeActionBase,
+)
+
+# Information module returning each resource type, the result key is the resource type
+RESOURCE_MODULES = dict(
+    network_interfaces="amazon.aws.ec2_eni_info",
+    route_tables="amazon.aws.ec2_vpc_route_table_info",
+    nacls="amazon.aws.ec2_vpc_nacl_info",
+    security_groups="amazon.aws.ec2_security_group_info",
+    nat_gateways="amazon.aws.ec2_vpc_nat_gateway_info",
+    vpc_peering_connections="amazon.aws.ec2_vpc_peering_info",
+    transit_gateway_attachments="amazon.aws.ec2_transit_gateway_vpc_attachment_info",
+    transit_gateway_route_tables="cloud.aws_troubleshooting.transit_gateway_route_table_info",
+)
+
+# Result key of the information modules not named after the resource type
+RESULT_KEYS = dict(
+    nat_gateways="result",
+    transit_gateway_attachments="attachments",
+)
+
+
+class ActionModule(DescribeActionBase):
+    argument_spec = dict(
+        destination_ip=dict(type="str", required=True),
+        destination_port=dict(type="int", required=True),
+        source_ip=dict(type="str", required=True),
+        source_vpc=dict(type="str"),
+        source_port_range=dict(type="str"),
+        destination_vpc=dict(type="str"),
+        explain=dict(type="bool", default=False),
+        **PREFIX_LISTS_ARGUMENT_SPEC,
+        **DESCRIBE_ARGUMENT_SPEC,
+    )
+
+    def describe_resources(self, resource, filters):
+        # Each resource is described once per run, e.g. the main route table of a VPC
+        # looked up for both the source and the NAT gateway subnets
+        key = (resource, json.dumps(filters, sort_keys=True))
+        if key in self._described:
+            count("describe_memo_hits")
+            return self._described[key]
+        result = self.describe(RESOURCE_MODULES[resource], dict(filters=filters), self._task_vars, self._params)
+        if result.get("failed"):
+            raise ConnectivityError(result.get("msg"))
+        return self._described.setdefault(key, result[RESULT_KEYS.get(resource, resource)])
+
+    def run(self, tmp=None, task_vars=None):
+        self._supports_check_mode = True
+
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        validation, self._params = self.validate_argument_spec(
+            argument_spec=self.argument_spec,
+            required_if=DESCRIBE_REQUIRED_IF,
+        )
+        self._task_vars = task_vars
+        self._described = {}
+
+        explanation = [] if self._params["explain"] else None
+        if explanation is not None:
+            result["explanation"] = explanation
+
+        with self.collect_timings(result, self._params):
+            try:
+                troubleshooter = Troubleshooter(
+                    self.describe_resources, explanation=explanation, prefix_lists=self._params["prefix_lists"]
+                )
+                next_hop, results = troubleshooter.troubleshoot(self._params)
+            except ConnectivityError as e:
+                result.update(failed=True, msg=str(e))
+                return result
+
+            result.update(changed=False, next_hop=next_hop, result=results)
+        return result
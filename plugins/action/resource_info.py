@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.plugin_utils import describe_memo
+from ansible_collections.cloud.aws_troubleshooting.plugins.plugin_utils.describe import (
+    DESCRIBE_ARGUMENT_SPEC,
+    DESCRIBE_REQUIRED_IF,
+    DescribeActionBase,
+)
+
+RESOURCE_INFO_REQUIRED_IF = [
+    ["run_finished", False, ["module"]],
+    ["run_finished", True, ["run_id"]],
+]
+
+
+class ActionModule(DescribeActionBase):
+    argument_spec = dict(
+        module=dict(type="str"),
+        module_args=dict(type="dict", default={}),
+        run_id=dict(type="str"),
+        run_finished=dict(type="bool", default=False),
+        **DESCRIBE_ARGUMENT_SPEC,
+    )
+
+    def run(self, tmp=None, task_vars=None):
+        self._supports_check_mode = True
+
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        validation, params = self.validate_argument_spec(
+            argument_spec=self.argument_spec,
+            required_if=DESCRIBE_REQUIRED_IF + RESOURCE_INFO_REQUIRED_IF,
+        )
+
+        if params["run_finished"]:
+            describe_memo.remove(params["cache_dir"], params["run_id"], task_vars.get("inventory_hostname"))
+            result["changed"] = False
+            return result
+
+        # Named after the information module, the profile of a run tells which describe calls take time
+        with self.collect_timings(result, params, name=params["module"]):
+            result.update(self.describe(params["module"], params["module_args"], task_vars, params))
+        return result
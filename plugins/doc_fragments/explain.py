@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+class ModuleDocFragment:
+    # Option of the modules explaining their verdict
+    DOCUMENTATION = r"""
+options:
+  explain:
+    description:
+      - Return as RV(explanation) what decided the verdict of each check, i.e. the matched security group rule,
+        network ACL entry or route, and the number of rules scanned to find it.
+    type: bool
+    default: false
+    version_added: 5.0.0
+"""
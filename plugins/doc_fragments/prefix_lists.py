@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+class ModuleDocFragment:
+    # Option of the modules resolving managed prefix lists
+    DOCUMENTATION = r"""
+options:
+  prefix_lists:
+    description:
+      - The entries of the managed prefix lists referenced by routes, through C(destination_prefix_list_id), and by
+        security group rules, through C(prefix_list_ids), keyed by prefix list ID.
+      - Each value is the list of CIDRs of the prefix list, or of its entries as returned by
+        C(aws ec2 get-managed-prefix-list-entries), or a dict with these as C(entries) and the C(version) of the
+        prefix list.
+      - The CIDRs of a prefix list are parsed once per prefix list ID and version, and shared by every lookup.
+      - Routes and security group rules referencing a prefix list missing from O(prefix_lists) are ignored.
+    type: dict
+    default: {}
+    version_added: 5.0.0
+"""
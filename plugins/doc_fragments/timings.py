@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+class ModuleDocFragment:
+    # Option of the modules returning their timings
+    DOCUMENTATION = r"""
+options:
+  collect_timings:
+    description:
+      - Return the wall time of the evaluation phases and the work counters of the run as RV(timings).
+      - Use the P(cloud.aws_troubleshooting.timings_profile#filter) filter to aggregate the timings of several tasks.
+    type: bool
+    default: false
+    version_added: 5.0.0
+"""
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r"""
+name: timings_profile
+short_description: Aggregate the timings of module results into one run profile
+version_added: 5.0.0
+description:
+  - Sum the wall time of the phases and the work counters returned as C(timings) by the modules of the collection
+    when their C(collect_timings) option is set.
+  - Results without timings, e.g. skipped tasks, are ignored.
+options:
+  _input:
+    description:
+      - The registered results of the tasks, the results of a loop are aggregated as well.
+    type: list
+    elements: raw
+    required: true
+  since:
+    description:
+      - Ignore the results of the modules started before this epoch time, e.g. the results registered by a previous run
+        of a role.
+    type: float
+"""
+
+EXAMPLES = r"""
+- name: Aggregate the timings of the evaluation tasks
+  ansible.builtin.set_fact:
+    run_profile: >-
+      {{ [eval_security_groups_result, eval_network_acls_result] | cloud.aws_troubleshooting.timings_profile }}
+
+- name: Aggregate the timings of the tasks registering variables starting with 'troubleshoot_'
+  ansible.builtin.set_fact:
+    run_profile: >-
+      {{ query('ansible.builtin.vars', *query('ansible.builtin.varnames', '^troubleshoot_'))
+      | cloud.aws_troubleshooting.timings_profile(since=run_started) }}
+"""
+
+RETURN = r"""
+_value:
+  description: The run profile.
+  type: dict
+  contains:
+    total_ms:
+      description: The wall time of the modules, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters.
+      type: dict
+    modules:
+      description: The wall time of each module run, in the order of the results.
+      type: list
+      elements: dict
+"""
+
+from ansible.errors import AnsibleFilterError
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import timings_profile
+
+
+def _timings_profile(results, since=None):
+    if not isinstance(results, list):
+        raise AnsibleFilterError("timings_profile expects a list of results, got {0}".format(type(results).__name__))
+    try:
+        return timings_profile(results, since=since)
+    except (TypeError, ValueError) as e:
+        raise AnsibleFilterError("Failed to aggregate the timings: {0}".format(e))
+
+
+class FilterModule:
+    def filters(self):
+        return {"timings_profile": _timings_profile}
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Reverse reachability: the sources allowed to reach a destination port. The
+# security group ingress rules, network ACL ingress entries and route tables of
+# the destination are inverted into sets of address intervals, one per IP
+# version, instead of evaluating candidate sources one by one.
+
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network, summarize_address_range
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_acls import (
+    parse_network_acl_entries,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.port_ranges import (
+    contains,
+    intersect,
+    merge,
+    subtract,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import expand_prefix_list
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.security_groups import (
+    SecurityGroupIndex,
+    rule_allows_port,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count, phase
+
+IP_VERSIONS = (4, 6)
+ADDRESS_SPACE = {4: [(0, 2**32 - 1)], 6: [(0, 2**128 - 1)]}
+
+
+def network_interval(network):
+    return network.version, (int(network.network_address), int(network.broadcast_address))
+
+
+def security_group_sources(security_groups, group_ids, port, protocol="tcp", prefix_lists=None):
+    """Return the address intervals and the group ids the ingress rules of the groups allow on port.
+
+    Each rule is scanned once, its CIDRs and the CIDRs of its managed prefix
+    lists are added to the allowed intervals and its referenced groups to the
+    allowed groups.
+    """
+    index = SecurityGroupIndex(security_groups, prefix_lists)
+    intervals = dict((version, []) for version in IP_VERSIONS)
+    referenced = set()
+    for group_id in group_ids:
+        for rule in index.rules(group_id):
+            count("security_group_rules_scanned")
+            if rule.ip_protocol not in ("-1", protocol) or not rule_allows_port(rule, port):
+                continue
+            for version, first, last in rule.networks:
+                intervals[version].append((first, last))
+            referenced.update(rule.group_ids)
+    return dict((version, merge(intervals[version])) for version in IP_VERSIONS), referenced
+
+
+def network_acl_sources(network_acl, port, protocol="tcp"):
+    """Return the address intervals the ingress entries of the network ACL allow on port.
+
+    The entries are swept once, in order: each entry matching the traffic
+    decides the addresses of its CIDR block no previous entry decided, the
+    addresses no entry matches are denied.
+    """
+    undecided = dict(ADDRESS_SPACE)
+    allowed = dict((version, []) for version in IP_VERSIONS)
+    scanned = 0
+    for rule in parse_network_acl_entries(network_acl.get("ingress") or []):
+        if not any(undecided.values()):
+            break
+        scanned += 1
+        if rule.protocol != "all" and (
+            rule.protocol != protocol
+            or rule.port_from is None
+            or rule.port_to is None
+            or not rule.port_from <= port <= rule.port_to
+        ):
+            continue
+        interval = [(rule.address_from, rule.address_to)]
+        if rule.rule_action == "allow":
+            allowed[rule.version].extend(intersect(undecided[rule.version], interval))
+        undecided[rule.version] = subtract(undecided[rule.version], interval)
+    count("network_acl_rules_scanned", scanned)
+    return dict((version, merge(allowed[version])) for version in IP_VERSIONS)
+
+
+def route_table_sources(route_table, prefix_lists=None):
+    """Return the address intervals the route table has a route back to.
+
+    Blackhole routes are ignored, as by RouteTable.
+    """
+    intervals = dict((version, []) for version in IP_VERSIONS)
+    for route in route_table.get("routes") or []:
+        count("routes_examined")
+        if route.get("state") == "blackhole":
+            continue
+        prefix_list_id = route.get("destination_prefix_list_id")
+        cidr = route.get("destination_cidr_block") or route.get("destination_ipv6_cidr_block")
+        if prefix_list_id:
+            networks = expand_prefix_list(prefix_lists, prefix_list_id) or []
+        elif cidr:
+            networks = [ip_network(cidr, strict=False)]
+        else:
+            networks = []
+        for network in networks:
+            version, interval = network_interval(network)
+            intervals[version].append(interval)
+    return dict((version, merge(intervals[version])) for version in IP_VERSIONS)
+
+
+def summarize(intervals):
+    # The intervals of each IP version as the smallest list of CIDRs, IPv4 first
+    cidrs = []
+    for version, address_class in ((4, IPv4Address), (6, IPv6Address)):
+        for first, last in intervals[version]:
+            cidrs.extend(str(network) for network in summarize_address_range(address_class(first), address_class(last)))
+    return cidrs
+
+
+def network_interface_addresses(network_interface):
+    addresses = [address["private_ip_address"] for address in network_interface.get("private_ip_addresses") or []]
+    addresses.extend(address["ipv6_address"] for address in network_interface.get("ipv6_addresses") or [])
+    if not addresses and network_interface.get("private_ip_address"):
+        addresses.append(network_interface["private_ip_address"])
+    return addresses
+
+
+def allowed_sources(
+    security_groups,
+    port,
+    network_acls=None,
+    route_tables=None,
+    network_interfaces=None,
+    protocol="tcp",
+    prefix_lists=None,
+):
+    """Return the sources allowed to reach port on a destination.
+
+    security_groups are the security groups of the destination, network_acls
+    and route_tables the ones of its subnets: a source must be allowed by
+    every network ACL and routed back by every route table, whichever subnet
+    the destination is in. The result is a dict with
+
+      cidrs: the source CIDRs the security groups, network ACLs and route tables allow
+      security_group_ids: the groups the security groups allow the members of, whose
+                          addresses the network ACLs and route tables must allow too
+      network_interfaces: the network_interfaces allowed, with the address and
+                          what allowed it
+    """
+    with phase("security_group_sources"):
+        group_ids = [group["group_id"] for group in security_groups]
+        sg_intervals, referenced = security_group_sources(
+            security_groups, group_ids, port, protocol=protocol, prefix_lists=prefix_lists
+        )
+
+    # The addresses the network ACLs and route tables let the traffic through for
+    path = dict(ADDRESS_SPACE)
+    with phase("network_acl_sources"):
+        for network_acl in network_acls or []:
+            acl_intervals = network_acl_sources(network_acl, port, protocol=protocol)
+            path = dict((version, intersect(path[version], acl_intervals[version])) for version in IP_VERSIONS)
+    with phase("route_sources"):
+        for route_table in route_tables or []:
+            route_intervals = route_table_sources(route_table, prefix_lists=prefix_lists)
+            path = dict((version, intersect(path[version], route_intervals[version])) for version in IP_VERSIONS)
+
+    allowed = dict((version, intersect(sg_intervals[version], path[version])) for version in IP_VERSIONS)
+    result = dict(
+        cidrs=summarize(allowed),
+        security_group_ids=sorted(referenced),
+        network_interfaces=[],
+    )
+
+    with phase("network_interface_sources"):
+        for network_interface in network_interfaces or []:
+            groups = set(group["group_id"] for group in network_interface.get("groups") or [])
+            for address in network_interface_addresses(network_interface):
+                value = ip_address(address)
+                if not contains(path[value.version], int(value)):
+                    continue
+                if contains(sg_intervals[value.version], int(value)):
+                    allowed_by = "cidr"
+                elif groups & referenced:
+                    allowed_by = "security_group"
+                else:
+                    continue
+                result["network_interfaces"].append(
+                    dict(
+                        network_interface_id=network_interface.get("network_interface_id")
+                        or network_interface.get("id"),
+                        ip_address=address,
+                        allowed_by=allowed_by,
+                    )
+                )
+    return result
@@ -0,0 +1,809 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from functools import wraps
+from ipaddress import ip_address
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_acls import (
+    explain_network_acl_rule,
+    match_rule,
+    parse_network_acl_entries,
+    parse_port_range,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import referenced_prefix_list_ids
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.route_table import (
+    RouteTable,
+    get_route_target,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.security_groups import (
+    SecurityGroupIndex,
+    explain_security_group_rule,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import phase
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.transit_gateway import (
+    associated_route_table,
+    transit_gateway_route_table_index,
+    vpc_attachment,
+)
+
+
+class ConnectivityError(Exception):
+    """The traffic is not allowed or could not be evaluated, the message tells why."""
+
+
+def evaluation(success, failure):
+    # An evaluation returns the success message, or the message the function
+    # returns when it succeeds early, or raises ConnectivityError. Unexpected
+    # errors are reported with the failure prefix. Its time is the phase named
+    # after the function.
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                with phase(func.__name__):
+                    result = func(*args, **kwargs)
+            except ConnectivityError:
+                raise
+            except Exception as e:
+                raise ConnectivityError("{0}: {1}".format(failure, e))
+            return success if result is None else result
+
+        return wrapper
+
+    return decorator
+
+
+def check(evaluation_function, *args, **kwargs):
+    """Run an evaluation and return its outcome instead of raising ConnectivityError.
+
+    The result is a dict with allowed, and the result message when the traffic
+    is allowed or the msg explaining why it is not.
+
+        check(eval_security_groups, security_groups, "10.0.1.15", ["sg-1"], "10.0.2.30", 5432, ["sg-2"])
+    """
+    try:
+        return dict(allowed=True, result=evaluation_function(*args, **kwargs))
+    except ConnectivityError as e:
+        return dict(allowed=False, msg=str(e))
+
+
+def network_acl_rules(network_acls, direction):
+    # network_acls items are {"egress": [...], "ingress": [...]}, the first one with entries is evaluated
+    return parse_network_acl_entries([acl[direction] for acl in network_acls if acl[direction]][0])
+
+
+# When an evaluation is given an explanation list, each check appends what decided
+# its verdict: the matched rule or route and the scan depth, i.e. the number of
+# rules scanned or of route trie nodes walked.
+
+
+def check_network_acl(explanation, subnet_id, direction, rules, ip, port=None, port_range=None):
+    rule, scanned = match_rule(rules, ip, port=port, port_range=port_range)
+    allowed = rule is not None and rule.rule_action == "allow"
+    if explanation is not None:
+        explanation.append(
+            dict(
+                check="network_acl",
+                subnet_id=subnet_id,
+                direction=direction,
+                remote_ip=ip,
+                ports=[int(port), int(port)] if port is not None else list(port_range or []) or None,
+                allowed=allowed,
+                rule=explain_network_acl_rule(rule),
+                scan_depth=scanned,
+            )
+        )
+    return allowed
+
+
+def check_security_groups(explanation, index, direction, group_ids, port, ip=None, peer_group_ids=None):
+    rule, matched, scanned = index.match_rule(
+        group_ids, port, ip=ip, peer_group_ids=peer_group_ids, egress=direction == "egress"
+    )
+    if explanation is not None:
+        explanation.append(
+            dict(
+                check="security_group",
+                security_groups=list(group_ids),
+                direction=direction,
+                remote_ip=ip,
+                remote_security_groups=list(peer_group_ids or []),
+                port=port,
+                allowed=rule is not None,
+                rule=explain_security_group_rule(rule, matched),
+                scan_depth=scanned,
+            )
+        )
+    return rule is not None
+
+
+def explain_route(match):
+    # The matched CIDR is one of the managed prefix list ones for prefix list routes
+    if match is None:
+        return None
+    network, route = match
+    result = dict(destination_cidr_block=str(network), next_hop=get_route_target(route))
+    if route.get("destination_prefix_list_id"):
+        result["destination_prefix_list_id"] = route["destination_prefix_list_id"]
+    return result
+
+
+def match_route(explanation, route_table, ip):
+    match, depth = route_table.match_depth(ip)
+    if explanation is not None:
+        explanation.append(dict(check="route", destination_ip=ip, route=explain_route(match), scan_depth=depth))
+    return match
+
+
+def lookup_route(explanation, route_table, ip):
+    match = match_route(explanation, route_table, ip)
+    return match[1] if match else None
+
+
+def get_next_hop(routes, dst_ip, prefix_lists=None, explanation=None):
+    """Return the target of the route towards dst_ip, raise ConnectivityError when none matches."""
+    with phase("index"):
+        route_table = RouteTable(routes, prefix_lists)
+    with phase("lookup"):
+        route = lookup_route(explanation, route_table, dst_ip)
+    if route is None:
+        raise ConnectivityError("No route found for destination: {0}".format(dst_ip))
+    return get_route_target(route)
+
+
+def get_next_hops(routes, dst_ips, prefix_lists=None, explanation=None):
+    """Return the next hop and the matched route destination of each address, keyed by address.
+
+    Unlike get_next_hop, addresses without a matching route have a None next hop.
+    """
+    with phase("index"):
+        route_table = RouteTable(routes, prefix_lists)
+    next_hops = {}
+    with phase("lookup"):
+        for dst_ip in dst_ips:
+            if dst_ip in next_hops:
+                continue
+            match = match_route(explanation, route_table, dst_ip)
+            if match is None:
+                next_hops[dst_ip] = dict(next_hop=None, destination_cidr_block=None)
+            else:
+                network, route = match
+                next_hops[dst_ip] = dict(next_hop=get_route_target(route), destination_cidr_block=str(network))
+    return next_hops
+
+
+@evaluation("Security Groups rules validation successful", "Security Groups rules validation failed")
+def eval_security_groups(
+    security_groups,
+    src_ip,
+    src_security_groups,
+    dst_ip,
+    dst_port,
+    dst_security_groups,
+    prefix_lists=None,
+    explanation=None,
+):
+    dst_port = int(dst_port)
+    security_groups_index = SecurityGroupIndex(security_groups, prefix_lists)
+
+    # An egress rule matches by destination address or by a destination security group reference
+    if not check_security_groups(
+        explanation,
+        security_groups_index,
+        "egress",
+        src_security_groups,
+        dst_port,
+        ip=dst_ip,
+        peer_group_ids=dst_security_groups,
+    ):
+        raise ConnectivityError(
+            "Egress rules on source do not allow traffic towards destination: {0} : {1}".format(dst_ip, str(dst_port))
+        )
+
+    if not check_security_groups(
+        explanation,
+        security_groups_index,
+        "ingress",
+        dst_security_groups,
+        dst_port,
+        ip=src_ip,
+        peer_group_ids=src_security_groups,
+    ):
+        raise ConnectivityError(
+            "Ingress rules on destination do not allow traffic from source: {0} towards destination port {1}".format(
+                src_ip, str(dst_port)
+            )
+        )
+
+
+@evaluation("Network ACLs evaluation successful", "Network ACLs evaluation failed")
+def eval_network_acls(
+    src_ip,
+    src_subnet_id,
+    dst_ip,
+    dst_subnet_id,
+    dst_port,
+    src_network_acls,
+    dst_network_acls,
+    src_port_range=None,
+    explanation=None,
+):
+    src_port_range = parse_port_range(src_port_range)
+    port = int(dst_port)
+    if src_subnet_id == dst_subnet_id:
+        return
+
+    egress_rules = network_acl_rules(src_network_acls, "egress")
+    ingress_rules = network_acl_rules(src_network_acls, "ingress")
+    if not check_network_acl(explanation, src_subnet_id, "egress", egress_rules, dst_ip, port=port):
+        raise ConnectivityError(
+            "Source Subnet Network Acl Egress Rules do not allow outbound traffic to destination: {0} : {1}".format(
+                dst_ip, str(port)
+            )
+        )
+    if not check_network_acl(explanation, src_subnet_id, "ingress", ingress_rules, dst_ip, port_range=src_port_range):
+        raise ConnectivityError(
+            "Source Subnet Network Acl Ingress Rules do not allow inbound traffic from destination: {0}".format(dst_ip)
+        )
+
+    egress_rules = network_acl_rules(dst_network_acls, "egress")
+    ingress_rules = network_acl_rules(dst_network_acls, "ingress")
+    if not check_network_acl(explanation, dst_subnet_id, "ingress", ingress_rules, src_ip, port=port):
+        raise ConnectivityError(
+            "Destination Subnet Network Acl Ingress Rules do not allow inbound traffic from source: {0} towards destination port {1}".format(
+                src_ip, str(dst_port)
+            )
+        )
+    if not check_network_acl(explanation, dst_subnet_id, "egress", egress_rules, src_ip, port_range=src_port_range):
+        raise ConnectivityError(
+            "Destination Subnet Network Acl Egress Rules do not allow outbound traffic to source: {0}".format(src_ip)
+        )
+
+
+@evaluation("Source evaluation successful", "Source evaluation failed")
+def eval_src_igw_route(
+    src_ip,
+    src_network_interface,
+    src_subnet_id,
+    dst_ip,
+    dst_port,
+    src_security_groups_info,
+    src_network_acls,
+    src_port_range=None,
+    prefix_lists=None,
+    explanation=None,
+):
+    if ip_address(src_ip).version == 6:
+        # IPv6 addresses are globally unique, the source IP must be one of the network interface
+        ipv6_addresses = [address["ipv6_address"] for address in src_network_interface.get("ipv6_addresses") or []]
+        if not any(ip_address(address) == ip_address(src_ip) for address in ipv6_addresses):
+            raise ConnectivityError("IPv6 address {0} is not assigned to the source network interface".format(src_ip))
+    else:
+        # A public IP or an Elastic IP must be associated with the source private IP
+        for private_ip in src_network_interface["private_ip_addresses"]:
+            if private_ip["private_ip_address"] == src_ip and "public_ip" in str(private_ip):
+                break
+        else:
+            raise ConnectivityError(
+                "A public IP or Elastic IP is required at source to connect to a public destination"
+            )
+
+    port = int(dst_port)
+    security_groups_index = SecurityGroupIndex(src_security_groups_info, prefix_lists)
+    src_security_groups = [sg["group_id"] for sg in src_security_groups_info]
+    if not check_security_groups(explanation, security_groups_index, "egress", src_security_groups, port, ip=dst_ip):
+        raise ConnectivityError(
+            "Egress rules on source do not allow traffic towards destination: {0} : {1}".format(dst_ip, str(port))
+        )
+
+    src_port_range = parse_port_range(src_port_range)
+    egress_rules = network_acl_rules(src_network_acls, "egress")
+    ingress_rules = network_acl_rules(src_network_acls, "ingress")
+    if not check_network_acl(explanation, src_subnet_id, "egress", egress_rules, dst_ip, port=port):
+        raise ConnectivityError(
+            "Source Subnet {0} Network Acl Egress Rules do not allow outbound traffic to destination: {1} : {2}".format(
+                src_subnet_id, dst_ip, str(dst_port)
+            )
+        )
+    if not check_network_acl(explanation, src_subnet_id, "ingress", ingress_rules, dst_ip, port_range=src_port_range):
+        raise ConnectivityError(
+            "Source Subnet {0} Network Acl Ingress Rules do not allow inbound traffic from destination: {1}".format(
+                src_subnet_id, dst_ip
+            )
+        )
+
+
+@evaluation("NAT Network ACLs evaluation successful", "NAT Network ACLs evaluation failed")
+def eval_nat_network_acls(
+    src_ip,
+    src_subnet_id,
+    dst_ip,
+    dst_port,
+    nat_subnet_id,
+    nat_network_acls,
+    routes,
+    src_port_range=None,
+    prefix_lists=None,
+    explanation=None,
+):
+    port = int(dst_port)
+    src_port_range = parse_port_range(src_port_range)
+    egress_rules = network_acl_rules(nat_network_acls, "egress")
+    ingress_rules = network_acl_rules(nat_network_acls, "ingress")
+
+    # Check egress towards destination
+    if not check_network_acl(explanation, nat_subnet_id, "egress", egress_rules, dst_ip, port=port):
+        raise ConnectivityError(
+            "NatGateway Subnet {0} Network Acl Egress Rules do not allow outbound traffic to destination: {1} : {2}".format(
+                src_subnet_id, dst_ip, str(port)
+            )
+        )
+    # Check ingress from destination
+    if not check_network_acl(explanation, nat_subnet_id, "ingress", ingress_rules, dst_ip, port_range=src_port_range):
+        raise ConnectivityError(
+            "NatGateway Subnet {0} Network Acl Ingress Rules do not allow inbound traffic from destination: {1}".format(
+                src_subnet_id, dst_ip
+            )
+        )
+
+    if src_subnet_id == nat_subnet_id:
+        raise ConnectivityError(
+            "NatGateway and Source cannot be placed in the same subnet, NatGateway should be in a public subnet"
+        )
+
+    # Check ingress from source
+    if not check_network_acl(explanation, nat_subnet_id, "ingress", ingress_rules, src_ip, port=port):
+        raise ConnectivityError(
+            "NatGateway Subnet Network Acl Ingress Rules do not allow inbound traffic from source {0} towards destination port {1}".format(
+                src_ip, str(port)
+            )
+        )
+    # Check egress towards source
+    if not check_network_acl(explanation, nat_subnet_id, "egress", egress_rules, src_ip, port_range=src_port_range):
+        raise ConnectivityError(
+            "NatGateway Subnet Network Acl Egress Rules do not allow outbound traffic to source: {0}".format(src_ip)
+        )
+
+    next_hop = lookup_route(explanation, RouteTable(routes, prefix_lists), dst_ip)
+    if next_hop is None or "igw-" not in str(next_hop):
+        raise ConnectivityError("No Internet Gateway route found for destination: {0}".format(dst_ip))
+
+
+@evaluation("VPC peering evaluation successful", "VPC peering evaluation failed")
+def eval_vpc_peering(
+    src_ip, peering_id, routes, vpc_peering_connection, dst_vpc=None, prefix_lists=None, explanation=None
+):
+    accepter_vpc_info = vpc_peering_connection["accepter_vpc_info"]
+    requester_vpc_info = vpc_peering_connection["requester_vpc_info"]
+    if accepter_vpc_info["region"] != requester_vpc_info["region"]:
+        raise ConnectivityError("Troubleshooting Cross Region peering connection is not yet supported")
+
+    if dst_vpc and dst_vpc not in (accepter_vpc_info.get("vpc_id"), requester_vpc_info.get("vpc_id")):
+        raise ConnectivityError(
+            "Kindly check the VPC peering route in route table at the source resource subnet, it does not match the expected destination VPC"
+        )
+
+    next_hop = lookup_route(explanation, RouteTable(routes, prefix_lists), src_ip) or {}
+    if next_hop.get("vpc_peering_connection_id") != peering_id:
+        raise ConnectivityError(
+            "Destination Subnet route table does not contain a valid peering route for source: {0}".format(src_ip)
+        )
+
+
+def lookup_transit_gateway_route(explanation, route_tables, attachment, ip, prefix_lists=None):
+    # The route of the transit gateway route table associated with the attachment towards ip
+    attachment_id = attachment["transit_gateway_attachment_id"]
+    route_table = associated_route_table(route_tables, attachment_id)
+    if route_table is None:
+        raise ConnectivityError(
+            "Transit gateway attachment {0} is not associated with a transit gateway route table".format(attachment_id)
+        )
+    route_table_id = route_table["transit_gateway_route_table_id"]
+    match, depth = transit_gateway_route_table_index(route_table, prefix_lists).match_depth(ip)
+    if explanation is not None:
+        explanation.append(
+            dict(
+                check="transit_gateway_route",
+                transit_gateway_route_table_id=route_table_id,
+                destination_ip=ip,
+                route=explain_route(match),
+                scan_depth=depth,
+            )
+        )
+    if match is None:
+        raise ConnectivityError(
+            "No route found in transit gateway route table {0} for destination: {1}".format(route_table_id, ip)
+        )
+    route = match[1]
+    if route["blackhole"]:
+        raise ConnectivityError(
+            "Transit gateway route table {0} drops traffic to {1} with a blackhole route".format(route_table_id, ip)
+        )
+    return route
+
+
+@evaluation("Transit gateway evaluation successful", "Transit gateway evaluation failed")
+def eval_transit_gateway(
+    src_ip,
+    src_vpc_id,
+    dst_ip,
+    dst_vpc_id,
+    transit_gateway_id,
+    attachments,
+    route_tables,
+    dst_routes,
+    prefix_lists=None,
+    explanation=None,
+):
+    src_attachment = vpc_attachment(attachments, src_vpc_id)
+    if src_attachment is None:
+        raise ConnectivityError(
+            "Source VPC {0} has no available attachment to transit gateway {1}".format(src_vpc_id, transit_gateway_id)
+        )
+
+    # Route towards the destination in the route table associated with the source attachment
+    route = lookup_transit_gateway_route(explanation, route_tables, src_attachment, dst_ip, prefix_lists)
+    if route["resource_type"] != "vpc":
+        raise ConnectivityError(
+            "Transit gateway attachment type '{0}' is not supported, the route towards {1} uses attachment {2}".format(
+                route["resource_type"], dst_ip, route["transit_gateway_attachment_id"]
+            )
+        )
+    if route["resource_id"] != dst_vpc_id:
+        raise ConnectivityError(
+            "Transit gateway route towards {0} leads to VPC {1} instead of destination VPC {2}".format(
+                dst_ip, route["resource_id"], dst_vpc_id
+            )
+        )
+    dst_attachment = vpc_attachment(attachments, dst_vpc_id)
+    if (
+        dst_attachment is None
+        or dst_attachment["transit_gateway_attachment_id"] != route["transit_gateway_attachment_id"]
+    ):
+        raise ConnectivityError(
+            "Transit gateway attachment {0} of destination VPC {1} is not available".format(
+                route["transit_gateway_attachment_id"], dst_vpc_id
+            )
+        )
+
+    # Route back towards the source in the route table associated with the destination attachment
+    route = lookup_transit_gateway_route(explanation, route_tables, dst_attachment, src_ip, prefix_lists)
+    if route["transit_gateway_attachment_id"] != src_attachment["transit_gateway_attachment_id"]:
+        raise ConnectivityError(
+            "Transit gateway route table associated with attachment {0} does not route traffic back to source: {1}".format(
+                dst_attachment["transit_gateway_attachment_id"], src_ip
+            )
+        )
+
+    # Route back towards the source in the destination subnet route table
+    route = lookup_route(explanation, RouteTable(dst_routes, prefix_lists), src_ip)
+    if route is None or route.get("transit_gateway_id") != transit_gateway_id:
+        raise ConnectivityError(
+            "Destination Subnet route table does not route traffic back to source {0} through transit gateway {1}".format(
+                src_ip, transit_gateway_id
+            )
+        )
+
+
+# Attribute holding the ID of each resource type returned by a describe callable
+RESOURCE_ID_KEYS = dict(
+    network_interfaces="network_interface_id",
+    route_tables="route_table_id",
+    nacls="nacl_id",
+    security_groups="group_id",
+    nat_gateways="nat_gateway_id",
+    vpc_peering_connections="vpc_peering_connection_id",
+    transit_gateway_attachments="transit_gateway_attachment_id",
+    transit_gateway_route_tables="transit_gateway_route_table_id",
+)
+
+# The filters whose values an evaluation depends on, the resources they look up may change
+DEPENDENCY_FILTERS = dict(
+    route_tables=["association.subnet-id", "vpc-id"],
+    nacls=["association.subnet-id", "vpc-id"],
+    transit_gateway_attachments=["transit-gateway-id"],
+    transit_gateway_route_tables=["transit-gateway-id"],
+)
+
+
+class DependencyRecorder:
+    """Wrap a describe callable and record the resources an evaluation depends on.
+
+    The IDs of the described resources are recorded, with the subnets and VPCs
+    used to look up route tables and network ACLs, and the transit gateways
+    used to look up attachments and transit gateway route tables, so that new
+    associations and attachments are detected, see expand_changed_resources,
+    and the managed prefix lists the route tables and security groups
+    reference.
+    """
+
+    def __init__(self, describe):
+        self.describe = describe
+        self.dependencies = set()
+
+    def __call__(self, resource, filters):
+        result = self.describe(resource, filters)
+        for key in DEPENDENCY_FILTERS.get(resource, []):
+            values = filters.get(key) or []
+            self.dependencies.update([values] if isinstance(values, str) else values)
+        self.dependencies.update(item[RESOURCE_ID_KEYS[resource]] for item in result)
+        self.dependencies.update(referenced_prefix_list_ids(resource, result))
+        return result
+
+
+def expand_changed_resources(describe, resource_ids):
+    """Return the changed resource IDs with the subnets, VPCs and transit gateways a change of them affects.
+
+    The subnets and VPCs whose route table or network ACL changed, and the
+    transit gateways of the changed attachments and transit gateway route
+    tables, are added. Deleted resources are not described, flows depending on
+    them recorded their ID.
+    """
+    changed = set(resource_ids)
+    route_table_ids = sorted(i for i in changed if i.startswith("rtb-"))
+    if route_table_ids:
+        for route_table in describe("route_tables", {"route-table-id": route_table_ids}):
+            for association in route_table.get("associations") or []:
+                if association.get("main"):
+                    changed.add(route_table["vpc_id"])
+                elif association.get("subnet_id"):
+                    changed.add(association["subnet_id"])
+    network_acl_ids = sorted(i for i in changed if i.startswith("acl-"))
+    if network_acl_ids:
+        for nacl in describe("nacls", {"network-acl-id": network_acl_ids}):
+            changed.update(nacl.get("subnets") or [])
+    attachment_ids = sorted(i for i in changed if i.startswith("tgw-attach-"))
+    if attachment_ids:
+        for attachment in describe("transit_gateway_attachments", {"transit-gateway-attachment-id": attachment_ids}):
+            changed.add(attachment["transit_gateway_id"])
+    transit_gateway_route_table_ids = sorted(i for i in changed if i.startswith("tgw-rtb-"))
+    if transit_gateway_route_table_ids:
+        for route_table in describe(
+            "transit_gateway_route_tables", {"transit-gateway-route-table-id": transit_gateway_route_table_ids}
+        ):
+            changed.add(route_table["transit_gateway_id"])
+    return changed
+
+
+class Troubleshooter:
+    """Troubleshoot the connectivity from a source IP towards a destination IP and port.
+
+    describe(resource, filters) returns the AWS resources matching filters, in the
+    format of the amazon.aws information modules, where resource is one of
+    network_interfaces, route_tables, nacls, security_groups, nat_gateways,
+    vpc_peering_connections, transit_gateway_attachments and
+    transit_gateway_route_tables.
+
+    prefix_lists maps managed prefix list ids to their entries, see expand_prefix_list.
+    When explanation is a list, the evaluations append to it what decided their
+    verdict, see check_network_acl, check_security_groups and match_route.
+    """
+
+    def __init__(self, describe, explanation=None, prefix_lists=None):
+        self.describe = describe
+        self.explanation = explanation
+        self.prefix_lists = prefix_lists
+
+    def get_network_interface(self, ip, vpc_id=None, error=None):
+        if ip_address(ip).version == 6:
+            filters = {"ipv6-addresses.ipv6-address": ip}
+        else:
+            filters = {"addresses.private-ip-address": ip}
+        if vpc_id:
+            filters["vpc-id"] = vpc_id
+        network_interfaces = self.describe("network_interfaces", filters)
+        if not network_interfaces:
+            raise ConnectivityError(error)
+        return network_interfaces[0]
+
+    def get_routes(self, subnet_id, vpc_id, error):
+        route_tables = self.describe("route_tables", {"association.subnet-id": subnet_id})
+        # if RouteTable is not returned, this indicates association of subnet with main route table
+        if not route_tables:
+            route_tables = self.describe("route_tables", {"association.main": "true", "vpc-id": vpc_id})
+        if not route_tables:
+            raise ConnectivityError(error)
+        return route_tables[0]["routes"]
+
+    def get_network_acls(self, subnet_ids):
+        # One describe call for all the subnets, the network ACLs are returned per subnet
+        nacls = self.describe("nacls", {"association.subnet-id": list(subnet_ids)})
+        return dict(
+            (
+                subnet_id,
+                [
+                    dict(egress=nacl["egress"], ingress=nacl["ingress"])
+                    for nacl in nacls
+                    if subnet_id in (nacl.get("subnets") or [])
+                ],
+            )
+            for subnet_id in subnet_ids
+        )
+
+    def get_security_groups(self, group_ids):
+        return self.describe("security_groups", {"group-id": sorted(set(group_ids))})
+
+    def troubleshoot_local(self, src_eni, params):
+        dst_eni = self.get_network_interface(
+            params["destination_ip"],
+            error="Kindly check the destination_ip parameter, no network interface found",
+        )
+        if params.get("destination_vpc") and params["destination_vpc"] != dst_eni["vpc_id"]:
+            raise ConnectivityError(
+                "Kindly check the source route table to ensure a more specific route is present towards required destination VPC"
+            )
+        return self.evaluate_endpoints(src_eni, dst_eni, params)
+
+    def evaluate_endpoints(self, src_eni, dst_eni, params):
+        # Security groups and network ACLs of a source and a destination in Amazon VPCs
+        src_security_groups = [group["group_id"] for group in src_eni["groups"]]
+        dst_security_groups = [group["group_id"] for group in dst_eni["groups"]]
+        results = [
+            eval_security_groups(
+                self.get_security_groups(src_security_groups + dst_security_groups),
+                params["source_ip"],
+                src_security_groups,
+                params["destination_ip"],
+                params["destination_port"],
+                dst_security_groups,
+                prefix_lists=self.prefix_lists,
+                explanation=self.explanation,
+            )
+        ]
+
+        network_acls = self.get_network_acls([src_eni["subnet_id"], dst_eni["subnet_id"]])
+        results.append(
+            eval_network_acls(
+                params["source_ip"],
+                src_eni["subnet_id"],
+                params["destination_ip"],
+                dst_eni["subnet_id"],
+                params["destination_port"],
+                network_acls[src_eni["subnet_id"]],
+                network_acls[dst_eni["subnet_id"]],
+                src_port_range=params.get("source_port_range"),
+                explanation=self.explanation,
+            )
+        )
+        return results
+
+    def troubleshoot_tgw(self, src_eni, next_hop, params):
+        dst_eni = self.get_network_interface(
+            params["destination_ip"],
+            error="Kindly check the destination_ip parameter, no network interface found",
+        )
+        if params.get("destination_vpc") and params["destination_vpc"] != dst_eni["vpc_id"]:
+            raise ConnectivityError(
+                "Kindly check the transit gateway route tables to ensure a route is present towards required destination VPC"
+            )
+
+        # Described per transit gateway, the flows through the same transit gateway share the results
+        attachments = self.describe("transit_gateway_attachments", {"transit-gateway-id": next_hop})
+        route_tables = self.describe("transit_gateway_route_tables", {"transit-gateway-id": next_hop})
+        dst_routes = self.get_routes(
+            dst_eni["subnet_id"],
+            dst_eni["vpc_id"],
+            "Could not find route table for {0}".format(params["destination_ip"]),
+        )
+        results = [
+            eval_transit_gateway(
+                params["source_ip"],
+                src_eni["vpc_id"],
+                params["destination_ip"],
+                dst_eni["vpc_id"],
+                next_hop,
+                attachments,
+                route_tables,
+                dst_routes,
+                prefix_lists=self.prefix_lists,
+                explanation=self.explanation,
+            )
+        ]
+        return results + self.evaluate_endpoints(src_eni, dst_eni, params)
+
+    def troubleshoot_igw(self, src_eni, params):
+        security_groups = self.get_security_groups([group["group_id"] for group in src_eni["groups"]])
+        network_acls = self.get_network_acls([src_eni["subnet_id"]])
+        return [
+            eval_src_igw_route(
+                params["source_ip"],
+                src_eni,
+                src_eni["subnet_id"],
+                params["destination_ip"],
+                params["destination_port"],
+                security_groups,
+                network_acls[src_eni["subnet_id"]],
+                src_port_range=params.get("source_port_range"),
+                prefix_lists=self.prefix_lists,
+                explanation=self.explanation,
+            )
+        ]
+
+    def troubleshoot_nat(self, src_eni, next_hop, params):
+        nat_gateways = self.describe("nat_gateways", {"nat-gateway-id": next_hop})
+        if not nat_gateways:
+            raise ConnectivityError("Could not find NAT Gateway {0}".format(next_hop))
+        nat_subnet_id = nat_gateways[0]["subnet_id"]
+
+        network_acls = self.get_network_acls([nat_subnet_id])
+        routes = self.get_routes(nat_subnet_id, nat_gateways[0]["vpc_id"], "Could not find route table for NAT Gateway")
+        return [
+            eval_nat_network_acls(
+                params["source_ip"],
+                src_eni["subnet_id"],
+                params["destination_ip"],
+                params["destination_port"],
+                nat_subnet_id,
+                network_acls[nat_subnet_id],
+                routes,
+                src_port_range=params.get("source_port_range"),
+                prefix_lists=self.prefix_lists,
+                explanation=self.explanation,
+            )
+        ]
+
+    def troubleshoot_peering(self, next_hop, params):
+        vpc_peering_connections = self.describe("vpc_peering_connections", {"vpc-peering-connection-id": [next_hop]})
+        if not vpc_peering_connections:
+            raise ConnectivityError("Could not find VPC peering connection {0}".format(next_hop))
+
+        dst_peer_eni = self.get_network_interface(
+            params["destination_ip"],
+            error="Kindly check the destination_ip parameter, no network interface found",
+        )
+        routes = self.get_routes(
+            dst_peer_eni["subnet_id"], dst_peer_eni["vpc_id"], "Could not find route table for Destination peer"
+        )
+        return [
+            eval_vpc_peering(
+                params["source_ip"],
+                next_hop,
+                routes,
+                vpc_peering_connections[0],
+                dst_vpc=params.get("destination_vpc"),
+                prefix_lists=self.prefix_lists,
+                explanation=self.explanation,
+            )
+        ]
+
+    def troubleshoot(self, params):
+        """Return the next hop towards the destination and the evaluation messages.
+
+        params holds source_ip, destination_ip, destination_port and optionally
+        source_vpc, source_port_range and destination_vpc. ConnectivityError is
+        raised when the traffic is not allowed.
+        """
+        if params["source_ip"] == params["destination_ip"]:
+            raise ConnectivityError("source_ip and destination_ip are same, kindly provide different values")
+        if ip_address(params["source_ip"]).version != ip_address(params["destination_ip"]).version:
+            raise ConnectivityError("source_ip and destination_ip must be of the same IP version")
+
+        src_eni = self.get_network_interface(
+            params["source_ip"],
+            vpc_id=params.get("source_vpc"),
+            error="Kindly check the source_ip and source_vpc parameters, no network interface found",
+        )
+        routes = self.get_routes(
+            src_eni["subnet_id"], src_eni["vpc_id"], "Could not find route table for {0}".format(params["source_ip"])
+        )
+        route = lookup_route(self.explanation, RouteTable(routes, self.prefix_lists), params["destination_ip"])
+        if route is None:
+            raise ConnectivityError("No route found for destination: {0}".format(params["destination_ip"]))
+        next_hop = str(get_route_target(route))
+
+        if next_hop == "local":
+            results = self.troubleshoot_local(src_eni, params)
+        elif next_hop.startswith(("igw-", "eigw-")):
+            # Egress-only internet gateways are the IPv6 counterpart of NAT gateways, without the NAT
+            results = self.troubleshoot_igw(src_eni, params)
+        elif next_hop.startswith("nat-"):
+            results = self.troubleshoot_nat(src_eni, next_hop, params)
+        elif next_hop.startswith("pcx-"):
+            results = self.troubleshoot_peering(next_hop, params)
+        elif next_hop.startswith("tgw-"):
+            results = self.troubleshoot_tgw(src_eni, next_hop, params)
+        else:
+            raise ConnectivityError("Next hop type '{0}' is not supported".format(next_hop))
+        return next_hop, results
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from collections import namedtuple
+from ipaddress import ip_address, ip_network
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count
+
+try:
+    import numpy as np
+except ImportError:
+    # Only first_match_allows needs numpy, the modules using it check for it
+    pass
+
+# NACL Entry format, as returned by amazon.aws.ec2_vpc_nacl_info
+# [
+#   100,            -> Rule number
+#   "all",          -> protocol
+#   "allow",        -> Rule action
+#   "0.0.0.0/0",    -> CIDR block, the IPv6 CIDR block for IPv6 entries
+#   null,           -> icmp type
+#   null,           -> icmp code
+#   0,              -> port range from
+#   65535           -> port range to
+# ]
+NACL_ENTRY_KEYS = [
+    "rule_number",
+    "protocol",
+    "rule_action",
+    "cidr_block",
+    "icmp_type",
+    "icmp_code",
+    "port_from",
+    "port_to",
+]
+
+# A parsed NACL entry, the CIDR block is kept as an inclusive integer interval
+NetworkAclRule = namedtuple(
+    "NetworkAclRule",
+    [
+        "rule_number",
+        "protocol",
+        "rule_action",
+        "cidr_block",
+        "version",
+        "address_from",
+        "address_to",
+        "port_from",
+        "port_to",
+    ],
+)
+
+
+def parse_port_range(port_range):
+    # "1024-65535" -> (1024, 65535)
+    if not port_range:
+        return None
+    port_from, port_to = port_range.split("-")
+    return int(port_from), int(port_to)
+
+
+def parse_network_acl_entries(entries):
+    rules = []
+    for entry in entries:
+        acl = dict(zip(NACL_ENTRY_KEYS, entry))
+        # IPv4 and IPv6 entries are kept, match_rule only evaluates the ones of the version of the remote ip
+        if not acl.get("cidr_block"):
+            continue
+        network = ip_network(acl["cidr_block"], strict=False)
+        rules.append(
+            NetworkAclRule(
+                rule_number=acl["rule_number"],
+                protocol=acl["protocol"],
+                rule_action=acl["rule_action"],
+                cidr_block=acl["cidr_block"],
+                version=network.version,
+                address_from=int(network.network_address),
+                address_to=int(network.broadcast_address),
+                port_from=acl.get("port_from"),
+                port_to=acl.get("port_to"),
+            )
+        )
+    count("cidrs_parsed", len(rules))
+    return rules
+
+
+def rule_covers_ports(rule, port_from, port_to):
+    if rule.protocol == "all":
+        return True
+    if rule.port_from is None or rule.port_to is None:
+        return False
+    return rule.port_from <= port_from and port_to <= rule.port_to
+
+
+def match_rule(rules, ip, port=None, port_range=None):
+    """Return the first rule matching traffic with the remote ip and the number of rules scanned.
+
+    The traffic is either described by a single port or by a port range tuple,
+    rules that are not for all protocols only match when they cover every port
+    of the traffic. Without port information, only rules for all protocols match.
+    """
+    address = ip_address(ip)
+    value = int(address)
+    if port is not None:
+        port_range = (int(port), int(port))
+
+    scanned = 0
+    for rule in rules:
+        scanned += 1
+        if rule.version != address.version or not rule.address_from <= value <= rule.address_to:
+            continue
+        if rule.protocol == "all" or (port_range and rule_covers_ports(rule, *port_range)):
+            break
+    else:
+        rule = None
+    count("network_acl_rules_scanned", scanned)
+    return rule, scanned
+
+
+def explain_network_acl_rule(rule):
+    # The entry as returned by amazon.aws.ec2_vpc_nacl_info, None when the traffic is implicitly denied
+    if rule is None:
+        return None
+    return dict(
+        rule_number=rule.rule_number,
+        protocol=rule.protocol,
+        rule_action=rule.rule_action,
+        cidr_block=rule.cidr_block,
+        port_from=rule.port_from,
+        port_to=rule.port_to,
+    )
+
+
+def first_match_allows(rules, block_from, block_to, port_from, port_to):
+    """First match evaluation of a network ACL for every (IPv4 address block, port range) combination.
+
+    The blocks and the port ranges are inclusive bounds in int64 arrays, a
+    single address is a block whose bounds are equal. A block is allowed when
+    the first rule matching any of its addresses allows the traffic and
+    contains the whole block. An empty port range (from > to) only matches
+    rules for all protocols. Return a boolean array of shape
+    (len(block_from), len(port_from)).
+    """
+    # IPv6 entries never match an IPv4 block, and their bounds do not fit in int64
+    rules = [rule for rule in rules if rule.version == 4]
+    if not rules:
+        return np.zeros((len(block_from), len(port_from)), dtype=bool)
+
+    address_from = np.array([rule.address_from for rule in rules], dtype=np.int64)
+    address_to = np.array([rule.address_to for rule in rules], dtype=np.int64)
+    all_protocols = np.array([rule.protocol == "all" for rule in rules], dtype=bool)
+    has_ports = np.array([rule.port_from is not None and rule.port_to is not None for rule in rules], dtype=bool)
+    rule_port_from = np.array([rule.port_from if rule.port_from is not None else 0 for rule in rules], dtype=np.int64)
+    rule_port_to = np.array([rule.port_to if rule.port_to is not None else -1 for rule in rules], dtype=np.int64)
+    allow = np.array([rule.rule_action == "allow" for rule in rules], dtype=bool)
+
+    # (blocks, rules)
+    overlap = (block_from[:, None] <= address_to[None, :]) & (block_to[:, None] >= address_from[None, :])
+    contains = (address_from[None, :] <= block_from[:, None]) & (block_to[:, None] <= address_to[None, :])
+    # (ports, rules)
+    port_match = all_protocols[None, :] | (
+        has_ports[None, :]
+        & (port_from <= port_to)[:, None]
+        & (rule_port_from[None, :] <= port_from[:, None])
+        & (port_to[:, None] <= rule_port_to[None, :])
+    )
+    # (blocks, ports, rules)
+    match = overlap[:, None, :] & port_match[None, :, :]
+    first = match.argmax(axis=2)
+    return match.any(axis=2) & allow[first] & contains[np.arange(len(block_from))[:, None], first]
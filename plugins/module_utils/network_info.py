@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from ipaddress import ip_network
+from threading import Lock
+
+from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code, normalize_boto3_result
+from ansible_collections.amazon.aws.plugins.module_utils.ec2 import (
+    AnsibleEC2Error,
+    describe_nat_gateways,
+    describe_network_acls,
+    describe_network_interfaces,
+    describe_route_tables,
+    describe_security_groups,
+    describe_subnets,
+    describe_transit_gateway_vpc_attachments,
+    describe_vpc_peering_connections,
+)
+from ansible_collections.amazon.aws.plugins.module_utils.errors import AWSErrorHandler
+from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
+from ansible_collections.amazon.aws.plugins.module_utils.tagging import boto3_tag_list_to_ansible_dict
+from ansible_collections.amazon.aws.plugins.module_utils.transformation import (
+    ansible_dict_to_boto3_filter_list,
+    boto3_resource_to_ansible_dict,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count, phase
+
+# The formatters below return the resources as amazon.aws information modules do,
+# so that gathered facts can be used in place of their results
+
+# http://www.iana.org/assignments/protocol-numbers/protocol-numbers.xhtml
+PROTOCOL_NAMES = {"-1": "all", "1": "icmp", "6": "tcp", "17": "udp"}
+
+
+def format_subnet(subnet):
+    # amazon.aws.ec2_vpc_subnet_info
+    subnet["id"] = subnet["SubnetId"]
+    result = camel_dict_to_snake_dict(subnet)
+    result["tags"] = boto3_tag_list_to_ansible_dict(subnet.get("Tags", []))
+    return result
+
+
+def format_security_group(security_group):
+    # amazon.aws.ec2_security_group_info
+    result = camel_dict_to_snake_dict(security_group)
+    result["tags"] = boto3_tag_list_to_ansible_dict(
+        result.get("tags", {}), tag_name_key_name="key", tag_value_key_name="value"
+    )
+    return result
+
+
+def format_route_table(table):
+    # amazon.aws.ec2_vpc_route_table_info
+    table["tags"] = boto3_tag_list_to_ansible_dict(table.pop("Tags", []))
+    for association in table["Associations"]:
+        association["Id"] = association["RouteTableAssociationId"]
+    for route in table["Routes"]:
+        for legacy_key in ["DestinationCidrBlock", "GatewayId", "InstanceId", "Origin", "State", "NetworkInterfaceId"]:
+            route.setdefault(legacy_key, None)
+        route["InterfaceId"] = route["NetworkInterfaceId"]
+    table["Id"] = table["RouteTableId"]
+    return camel_dict_to_snake_dict(table, ignore_list=["tags"])
+
+
+def format_network_acl_entry(entry):
+    # [rule number, protocol, rule action, CIDR block, icmp type, icmp code, port from, port to]
+    protocol = entry.get("protocol")
+    result = [
+        entry["rule_number"],
+        PROTOCOL_NAMES.get(protocol, protocol),
+        entry["rule_action"],
+        entry.get("cidr_block") or entry.get("ipv6_cidr_block") or None,
+        None,
+        None,
+        None,
+        None,
+    ]
+    if protocol in ("1", "58"):
+        result[4] = entry.get("icmp_type_code", {}).get("type")
+        result[5] = entry.get("icmp_type_code", {}).get("code")
+    if protocol not in ("1", "6", "17", "58"):
+        result[6] = 0
+        result[7] = 65535
+    elif "port_range" in entry:
+        result[6] = entry["port_range"]["from"]
+        result[7] = entry["port_range"]["to"]
+    return result
+
+
+def format_network_acl(nacl):
+    # amazon.aws.ec2_vpc_nacl_info
+    result = camel_dict_to_snake_dict(nacl)
+    if "tags" in result:
+        result["tags"] = boto3_tag_list_to_ansible_dict(result["tags"], "key", "value")
+    if "entries" in result:
+        # The default rule (32767) is not returned
+        entries = [entry for entry in result.pop("entries") if entry["rule_number"] < 32767]
+        result["egress"] = [format_network_acl_entry(entry) for entry in entries if entry["egress"]]
+        result["ingress"] = [format_network_acl_entry(entry) for entry in entries if not entry["egress"]]
+    if "associations" in result:
+        result["subnets"] = [association["subnet_id"] for association in result.pop("associations")]
+    if "network_acl_id" in result:
+        result["nacl_id"] = result.pop("network_acl_id")
+    return result
+
+
+def format_network_interface(network_interface):
+    # amazon.aws.ec2_eni_info
+    network_interface["TagSet"] = boto3_tag_list_to_ansible_dict(network_interface.get("TagSet", []))
+    network_interface["Tags"] = network_interface["TagSet"]
+    if "Name" in network_interface["Tags"]:
+        network_interface["Name"] = network_interface["Tags"]["Name"]
+    network_interface["Id"] = network_interface["NetworkInterfaceId"]
+    return camel_dict_to_snake_dict(network_interface, ignore_list=["Tags", "TagSet"])
+
+
+def format_nat_gateway(nat_gateway):
+    # amazon.aws.ec2_vpc_nat_gateway_info
+    result = camel_dict_to_snake_dict(normalize_boto3_result(nat_gateway))
+    if "tags" in result:
+        result["tags"] = boto3_tag_list_to_ansible_dict(result["tags"])
+    return result
+
+
+def format_vpc_peering_connection(vpc_peering_connection):
+    # amazon.aws.ec2_vpc_peering_info
+    result = camel_dict_to_snake_dict(normalize_boto3_result(vpc_peering_connection))
+    result["tags"] = boto3_tag_list_to_ansible_dict(result.get("tags", []))
+    return result
+
+
+def format_transit_gateway_attachment(attachment):
+    # amazon.aws.ec2_transit_gateway_vpc_attachment_info
+    return boto3_resource_to_ansible_dict(attachment)
+
+
+def format_transit_gateway_route_table(route_table):
+    # cloud.aws_troubleshooting.transit_gateway_route_table_info
+    result = camel_dict_to_snake_dict(normalize_boto3_result(route_table))
+    result["tags"] = boto3_tag_list_to_ansible_dict(result.get("tags", []))
+    return result
+
+
+class EC2TransitGatewayRouteTableErrorHandler(AWSErrorHandler):
+    _CUSTOM_EXCEPTION = AnsibleEC2Error
+
+    @classmethod
+    def _is_missing(cls):
+        return is_boto3_error_code("InvalidRouteTableID.NotFound")
+
+
+@EC2TransitGatewayRouteTableErrorHandler.list_error_handler("describe transit gateway route tables", [])
+@AWSRetry.jittered_backoff()
+def _describe_transit_gateway_route_tables(client, **params):
+    paginator = client.get_paginator("describe_transit_gateway_route_tables")
+    return paginator.paginate(**params).build_full_result()["TransitGatewayRouteTables"]
+
+
+@EC2TransitGatewayRouteTableErrorHandler.list_error_handler("get transit gateway route table associations", [])
+@AWSRetry.jittered_backoff()
+def get_transit_gateway_route_table_associations(client, route_table_id):
+    paginator = client.get_paginator("get_transit_gateway_route_table_associations")
+    return paginator.paginate(TransitGatewayRouteTableId=route_table_id).build_full_result()["Associations"]
+
+
+@EC2TransitGatewayRouteTableErrorHandler.common_error_handler("search transit gateway routes")
+@AWSRetry.jittered_backoff()
+def _search_transit_gateway_routes(client, route_table_id, filters):
+    # Not paginated, at most 1000 routes (the default MaxResults) are returned
+    filters = dict(filters, state=["active", "blackhole"])
+    return client.search_transit_gateway_routes(
+        TransitGatewayRouteTableId=route_table_id, Filters=ansible_dict_to_boto3_filter_list(filters)
+    )
+
+
+def search_transit_gateway_routes(client, route_table_id, network=None):
+    """Return the active and blackhole routes of a transit gateway route table.
+
+    A search returns at most 1000 routes. When it is truncated, the routes are
+    searched again per half of the address space, recursively, with the route
+    of the split network itself.
+    """
+    filters = {"route-search.subnet-of-match": str(network)} if network is not None else {}
+    count("transit_gateway_route_searches")
+    response = _search_transit_gateway_routes(client, route_table_id, filters)
+    routes = list(response.get("Routes") or [])
+    if not response.get("AdditionalRoutesAvailable"):
+        return routes
+
+    if network is None:
+        networks = [ip_network("0.0.0.0/0"), ip_network("::/0")]
+    elif network.prefixlen < network.max_prefixlen:
+        count("transit_gateway_route_searches")
+        exact = _search_transit_gateway_routes(client, route_table_id, {"route-search.exact-match": str(network)})
+        routes.extend(exact.get("Routes") or [])
+        networks = list(network.subnets())
+    else:
+        return routes
+    for subnet in networks:
+        routes.extend(search_transit_gateway_routes(client, route_table_id, subnet))
+
+    # Overlapping searches return some routes more than once
+    unique = dict(((route.get("DestinationCidrBlock"), route.get("PrefixListId")), route) for route in routes)
+    return list(unique.values())
+
+
+def describe_transit_gateway_route_tables(client, **params):
+    """Describe transit gateway route tables with their associations and routes.
+
+    The associations and routes of each route table are fetched concurrently.
+    """
+    route_tables = _describe_transit_gateway_route_tables(client, **params) or []
+
+    def describe_routes(route_table):
+        route_table_id = route_table["TransitGatewayRouteTableId"]
+        route_table["Associations"] = get_transit_gateway_route_table_associations(client, route_table_id) or []
+        route_table["Routes"] = search_transit_gateway_routes(client, route_table_id)
+        return route_table
+
+    if not route_tables:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(route_tables), 8)) as executor:
+        return list(executor.map(describe_routes, route_tables))
+
+
+# Resource type: (describe function, formatter, filters parameter)
+DESCRIBE_CALLS = dict(
+    network_interfaces=(describe_network_interfaces, format_network_interface, "Filters"),
+    route_tables=(describe_route_tables, format_route_table, "Filters"),
+    nacls=(describe_network_acls, format_network_acl, "Filters"),
+    security_groups=(describe_security_groups, format_security_group, "Filters"),
+    nat_gateways=(describe_nat_gateways, format_nat_gateway, "Filter"),
+    vpc_peering_connections=(describe_vpc_peering_connections, format_vpc_peering_connection, "Filters"),
+    transit_gateway_attachments=(
+        describe_transit_gateway_vpc_attachments,
+        format_transit_gateway_attachment,
+        "Filters",
+    ),
+    transit_gateway_route_tables=(
+        describe_transit_gateway_route_tables,
+        format_transit_gateway_route_table,
+        "Filters",
+    ),
+)
+
+
+class Describer:
+    """Describe the resources of a region, in the format of the amazon.aws information modules.
+
+    Results are memoised by resource type and filters, the instance can be shared
+    by threads evaluating several flows of the same region. A describe call in
+    progress is shared too, the threads asking for the same resources meanwhile
+    wait for its result instead of making the same call.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.results = {}
+        self.lock = Lock()
+
+    def __call__(self, resource, filters):
+        key = (resource, json.dumps(filters, sort_keys=True))
+        with self.lock:
+            future = self.results.get(key)
+            if future is None:
+                future = self.results[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            count("describe_cache_hits")
+            return future.result()
+
+        describe, formatter, filters_parameter = DESCRIBE_CALLS[resource]
+        params = {filters_parameter: ansible_dict_to_boto3_filter_list(filters)}
+        count("describe_calls")
+        try:
+            with phase("describe"):
+                result = [formatter(item) for item in describe(self.client, **params) or []]
+        except Exception as e:
+            # Failures are not memoised, the waiting threads get the error and later calls retry
+            with self.lock:
+                del self.results[key]
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+
+
+def gather_network_info(client, subnet_ids=None, security_group_ids=None, vpc_id=None):
+    """Describe the subnets, network ACLs, security groups and route tables of a network path.
+
+    The describe calls do not depend on each other, they are made concurrently
+    and the result is ready once the slowest one returns. vpc_id can be a list
+    of VPC IDs, to describe the network paths of several VPCs at once, see
+    select_network_info.
+    """
+    subnet_ids = list(subnet_ids or [])
+    security_group_ids = list(security_group_ids or [])
+    calls = {}
+
+    # Describe calls without filter return every resource of the region
+    if subnet_ids:
+        subnet_filter = ansible_dict_to_boto3_filter_list({"association.subnet-id": subnet_ids})
+        calls["subnets"] = (describe_subnets, format_subnet, dict(SubnetIds=subnet_ids))
+        calls["nacls"] = (describe_network_acls, format_network_acl, dict(Filters=subnet_filter))
+        calls["route_tables"] = (describe_route_tables, format_route_table, dict(Filters=subnet_filter))
+    if security_group_ids:
+        group_filter = ansible_dict_to_boto3_filter_list({"group-id": security_group_ids})
+        calls["security_groups"] = (describe_security_groups, format_security_group, dict(Filters=group_filter))
+    if vpc_id:
+        main_filter = ansible_dict_to_boto3_filter_list({"association.main": "true", "vpc-id": vpc_id})
+        calls["vpc_route_tables"] = (describe_route_tables, format_route_table, dict(Filters=main_filter))
+
+    result = dict(subnets=[], nacls=[], security_groups=[], route_tables=[], vpc_route_tables=[])
+    if not calls:
+        return result
+
+    count("describe_calls", len(calls))
+    with phase("describe"), ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = dict((key, executor.submit(call[0], client, **call[2])) for key, call in calls.items())
+        for key, future in futures.items():
+            formatter = calls[key][1]
+            result[key] = [formatter(resource) for resource in future.result() or []]
+    return result
+
+
+def select_network_info(network_info, subnet_ids=None, security_group_ids=None, vpc_id=None):
+    """Return the part of a gather_network_info result describing one network path.
+
+    The result is the one gather_network_info returns for subnet_ids,
+    security_group_ids and vpc_id, when network_info was gathered for all of
+    them, so that the paths of many sources share the same describe calls.
+    """
+    subnet_ids = set(subnet_ids or [])
+    security_group_ids = set(security_group_ids or [])
+
+    def associated(route_table):
+        return any(association.get("subnet_id") in subnet_ids for association in route_table.get("associations") or [])
+
+    return dict(
+        subnets=[subnet for subnet in network_info["subnets"] if subnet["subnet_id"] in subnet_ids],
+        nacls=[nacl for nacl in network_info["nacls"] if subnet_ids.intersection(nacl.get("subnets") or [])],
+        security_groups=[group for group in network_info["security_groups"] if group["group_id"] in security_group_ids],
+        route_tables=[table for table in network_info["route_tables"] if associated(table)],
+        vpc_route_tables=[table for table in network_info["vpc_route_tables"] if table.get("vpc_id") == vpc_id],
+    )
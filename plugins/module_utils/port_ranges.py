@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Sets of ports, kept as sorted lists of disjoint inclusive (from, to) intervals,
+# so that a port range such as 1024-65535 is evaluated as a whole instead of
+# port by port. merge, intersect, subtract and contains work on any integer
+# intervals, e.g. on the integer values of IP address ranges.
+
+from bisect import bisect_right
+
+ALL_PORTS = [(0, 65535)]
+
+
+def merge(ranges):
+    """Return the port ranges sorted, with the overlapping and adjacent ones merged."""
+    merged = []
+    for port_from, port_to in sorted(ranges):
+        if merged and port_from <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], port_to))
+        else:
+            merged.append((port_from, port_to))
+    return merged
+
+
+def intersect(ranges, other):
+    """Return the ports of both sets of merged port ranges."""
+    result = []
+    i = j = 0
+    while i < len(ranges) and j < len(other):
+        port_from = max(ranges[i][0], other[j][0])
+        port_to = min(ranges[i][1], other[j][1])
+        if port_from <= port_to:
+            result.append((port_from, port_to))
+        if ranges[i][1] < other[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def subtract(ranges, other):
+    """Return the ports of the merged port ranges which are not in other."""
+    result = []
+    j = 0
+    for port_from, port_to in ranges:
+        while j < len(other) and other[j][1] < port_from:
+            j += 1
+        k = j
+        while port_from <= port_to and k < len(other) and other[k][0] <= port_to:
+            if other[k][0] > port_from:
+                result.append((port_from, other[k][0] - 1))
+            port_from = max(port_from, other[k][1] + 1)
+            k += 1
+        if port_from <= port_to:
+            result.append((port_from, port_to))
+    return result
+
+
+def contains(ranges, value):
+    """Whether value is in the merged port ranges."""
+    index = bisect_right(ranges, (value, float("inf"))) - 1
+    return index >= 0 and ranges[index][0] <= value <= ranges[index][1]
+
+
+def parse_ports(ports):
+    """Return the merged port ranges of a list of ports and "from-to" port ranges.
+
+    parse_ports([5432, "3306", "1024-2048"]) -> [(1024, 2048), (3306, 3306), (5432, 5432)]
+    """
+    ranges = []
+    for value in ports:
+        bounds = str(value).strip().split("-")
+        try:
+            if len(bounds) > 2:
+                raise ValueError()
+            port_from, port_to = int(bounds[0]), int(bounds[-1])
+        except ValueError:
+            raise ValueError("Invalid port or port range '{0}'".format(value))
+        if not 0 <= port_from <= port_to <= 65535:
+            raise ValueError("Invalid port or port range '{0}'".format(value))
+        ranges.append((port_from, port_to))
+    return merge(ranges)
+
+
+def format_port_ranges(ranges):
+    # [(5432, 5432), (1024, 65535)] -> ["5432", "1024-65535"]
+    return [
+        str(port_from) if port_from == port_to else "{0}-{1}".format(port_from, port_to)
+        for port_from, port_to in ranges
+    ]
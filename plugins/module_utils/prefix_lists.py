@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from ipaddress import ip_network
+from threading import Lock
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count
+
+# Option of the modules resolving managed prefix lists
+PREFIX_LISTS_ARGUMENT_SPEC = dict(
+    prefix_lists=dict(type="dict", default={}),
+)
+
+# Expanded prefix lists, keyed by (prefix list id, version), or by (prefix list
+# id, CIDRs) when the version is not known. Entries of a prefix list version
+# never change, the expansion is shared by every route table and security
+# group index of the process, e.g. by the tasks run by an action plugin.
+_expanded = {}
+_lock = Lock()
+
+
+def prefix_list_entries(value):
+    # value is a list of CIDRs or of entries as returned by get-managed-prefix-list-entries,
+    # or a dict with these as entries and the version of the prefix list
+    if isinstance(value, dict):
+        version = value.get("version")
+        entries = value.get("entries") or []
+    else:
+        version = None
+        entries = value or []
+    cidrs = tuple(entry["cidr"] if isinstance(entry, dict) else entry for entry in entries)
+    return version, cidrs
+
+
+def expand_prefix_list(prefix_lists, prefix_list_id):
+    """Return the networks of a managed prefix list, None when prefix_lists does not define it.
+
+    prefix_lists maps prefix list ids to their entries, see prefix_list_entries.
+    """
+    value = (prefix_lists or {}).get(prefix_list_id)
+    if value is None:
+        count("prefix_lists_unresolved")
+        return None
+
+    version, cidrs = prefix_list_entries(value)
+    key = (prefix_list_id, version if version is not None else cidrs)
+    with _lock:
+        networks = _expanded.get(key)
+    if networks is not None:
+        count("prefix_list_cache_hits")
+        return networks
+
+    networks = tuple(ip_network(cidr, strict=False) for cidr in cidrs)
+    count("prefix_list_expansions")
+    count("cidrs_parsed", len(networks))
+    with _lock:
+        _expanded[key] = networks
+    return networks
+
+
+def referenced_prefix_list_ids(resource, items):
+    """Return the ids of the managed prefix lists referenced by route tables or security groups."""
+    prefix_list_ids = set()
+    for item in items:
+        if resource == "route_tables":
+            prefix_list_ids.update(route.get("destination_prefix_list_id") for route in item.get("routes") or [])
+        elif resource == "security_groups":
+            for rule in (item.get("ip_permissions") or []) + (item.get("ip_permissions_egress") or []):
+                prefix_list_ids.update(pl.get("prefix_list_id") for pl in rule.get("prefix_list_ids") or [])
+    prefix_list_ids.discard(None)
+    return prefix_list_ids
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from ipaddress import ip_address, ip_network
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import expand_prefix_list
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count
+
+# Route target attributes, in the order they are used to report the next hop
+ROUTE_TARGET_KEYS = [
+    "egress_only_internet_gateway_id",
+    "gateway_id",
+    "instance_id",
+    "network_interface_id",
+    "local_gateway_id",
+    "nat_gateway_id",
+    "transit_gateway_id",
+    "vpc_peering_connection_id",
+    "transit_gateway_attachment_id",
+]
+
+
+def get_route_target(route):
+    for key in ROUTE_TARGET_KEYS:
+        if route.get(key):
+            return route[key]
+    return None
+
+
+class RouteTable:
+    """Longest prefix match index over the routes of a route table.
+
+    Routes are stored in a binary trie keyed on the integer value of their
+    destination network, so that a lookup walks at most one node per address
+    bit whatever the number of routes. IPv4 and IPv6 routes are kept in
+    separate tries, an IPv4 lookup never walks the 128-bit IPv6 one. Blackhole routes are not indexed, routes
+    towards a managed prefix list are indexed once per CIDR of the list when
+    prefix_lists defines it, see expand_prefix_list.
+    """
+
+    def __init__(self, routes, prefix_lists=None):
+        # one trie per IP version, each node is [child_0, child_1, (network, route)]
+        self._roots = {}
+        self.prefix_lists = prefix_lists
+        # CIDR routes take precedence over prefix list routes of the same destination
+        for route in sorted(routes, key=lambda route: bool(route.get("destination_prefix_list_id"))):
+            self.add(route)
+
+    def add(self, route):
+        if route.get("state") == "blackhole":
+            return
+        prefix_list_id = route.get("destination_prefix_list_id")
+        if prefix_list_id:
+            for network in expand_prefix_list(self.prefix_lists, prefix_list_id) or []:
+                self.insert(network, route)
+            return
+        cidr = route.get("destination_cidr_block") or route.get("destination_ipv6_cidr_block")
+        if cidr:
+            self.insert(ip_network(cidr, strict=False), route)
+
+    def insert(self, network, route):
+        node = self._roots.setdefault(network.version, [None, None, None])
+        value = int(network.network_address)
+        shift = network.max_prefixlen - 1
+        for _ in range(network.prefixlen):
+            bit = (value >> shift) & 1
+            if node[bit] is None:
+                node[bit] = [None, None, None]
+            node = node[bit]
+            shift -= 1
+
+        # The first route declared for a given prefix wins
+        if node[2] is None:
+            node[2] = (network, route)
+        count("routes_indexed")
+
+    def match_depth(self, address):
+        """Return the (network, route) longest prefix match of address and the number of trie nodes walked."""
+        count("route_lookups")
+        address = ip_address(address)
+        node = self._roots.get(address.version)
+        if node is None:
+            return None, 0
+
+        value = int(address)
+        best = node[2]
+        depth = 1
+        for shift in range(address.max_prefixlen - 1, -1, -1):
+            node = node[(value >> shift) & 1]
+            if node is None:
+                break
+            depth += 1
+            if node[2] is not None:
+                best = node[2]
+        return best, depth
+
+    def match(self, address):
+        return self.match_depth(address)[0]
+
+    def lookup(self, address):
+        best = self.match(address)
+        return best[1] if best else None
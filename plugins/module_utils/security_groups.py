@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from collections import namedtuple
+from ipaddress import ip_address, ip_network
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import expand_prefix_list
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count
+
+# A security group rule compiled for evaluation
+#   networks:  (version, first address, last address) integer interval for each ip_ranges and
+#              ipv6_ranges CIDR and each CIDR of the prefix_list_ids managed prefix lists
+#   cidrs:     the CIDR of each network, in the order of networks
+#   sources:   the managed prefix list id of each network, None for ip_ranges and ipv6_ranges CIDRs
+#   group_ids: the groups referenced through user_id_group_pairs
+SecurityGroupRule = namedtuple(
+    "SecurityGroupRule",
+    [
+        "group_id",
+        "direction",
+        "index",
+        "ip_protocol",
+        "from_port",
+        "to_port",
+        "networks",
+        "cidrs",
+        "sources",
+        "group_ids",
+    ],
+)
+
+
+def compile_security_group_rule(group_id, direction, index, rule, prefix_lists=None):
+    networks = []
+    cidrs = []
+    sources = []
+    for key, ranges in (("cidr_ip", rule.get("ip_ranges")), ("cidr_ipv6", rule.get("ipv6_ranges"))):
+        for cidr in ranges or []:
+            network = ip_network(cidr[key], strict=False)
+            networks.append((network.version, int(network.network_address), int(network.broadcast_address)))
+            cidrs.append(cidr[key])
+            sources.append(None)
+    count("cidrs_parsed", len(networks))
+    for prefix_list in rule.get("prefix_list_ids") or []:
+        for network in expand_prefix_list(prefix_lists, prefix_list.get("prefix_list_id")) or []:
+            networks.append((network.version, int(network.network_address), int(network.broadcast_address)))
+            cidrs.append(str(network))
+            sources.append(prefix_list["prefix_list_id"])
+
+    return SecurityGroupRule(
+        group_id=group_id,
+        direction=direction,
+        index=index,
+        ip_protocol=rule.get("ip_protocol"),
+        from_port=rule.get("from_port"),
+        to_port=rule.get("to_port"),
+        networks=tuple(networks),
+        cidrs=tuple(cidrs),
+        sources=tuple(sources),
+        group_ids=frozenset(pair["group_id"] for pair in rule.get("user_id_group_pairs") or [] if pair.get("group_id")),
+    )
+
+
+def rule_allows_port(rule, port):
+    if rule.ip_protocol == "-1" or (rule.from_port == -1 and rule.to_port == -1):
+        return True
+    if rule.from_port is None or rule.to_port is None:
+        return False
+    return rule.from_port <= port <= rule.to_port
+
+
+class SecurityGroupIndex:
+    """Security groups indexed by group id.
+
+    Rules are compiled the first time a group is evaluated, CIDRs and the CIDRs
+    of the managed prefix lists defined by prefix_lists become integer intervals
+    and group references a set of group ids.
+    """
+
+    def __init__(self, security_groups, prefix_lists=None):
+        self._groups = dict((group["group_id"], group) for group in security_groups)
+        self._rules = {}
+        self.prefix_lists = prefix_lists
+
+    def __contains__(self, group_id):
+        return group_id in self._groups
+
+    def get(self, group_id):
+        return self._groups.get(group_id)
+
+    def rules(self, group_id, egress=False):
+        direction = "egress" if egress else "ingress"
+        key = (group_id, direction)
+        if key not in self._rules:
+            group = self._groups.get(group_id)
+            if group is None:
+                raise ValueError("Security group {0} not found".format(group_id))
+            permissions = group.get("ip_permissions_egress" if egress else "ip_permissions") or []
+            self._rules[key] = [
+                compile_security_group_rule(group_id, direction, index, rule, self.prefix_lists)
+                for index, rule in enumerate(permissions)
+            ]
+        return self._rules[key]
+
+    def match_rule(self, group_ids, port, ip=None, peer_group_ids=None, egress=False):
+        """Return the first rule of the groups allowing traffic on port, what it matched and the number of rules scanned.
+
+        A rule matches when one of its CIDRs contains ip, the index of the CIDR in
+        rule.cidrs is returned, or when it references one of peer_group_ids, the
+        first referenced group is returned.
+        """
+        address = ip_address(ip) if ip is not None else None
+        value = int(address) if address is not None else None
+        peer_group_ids = frozenset(peer_group_ids or [])
+
+        scanned = 0
+        try:
+            for group_id in group_ids:
+                for rule in self.rules(group_id, egress=egress):
+                    scanned += 1
+                    if not rule_allows_port(rule, port):
+                        continue
+                    if address is not None:
+                        for index, (version, first, last) in enumerate(rule.networks):
+                            if version == address.version and first <= value <= last:
+                                return rule, index, scanned
+                    referenced = rule.group_ids & peer_group_ids
+                    if referenced:
+                        return rule, sorted(referenced)[0], scanned
+            return None, None, scanned
+        finally:
+            count("security_group_rules_scanned", scanned)
+
+
+def explain_security_group_rule(rule, matched):
+    # None when no rule allows the traffic, security groups deny by default
+    if rule is None:
+        return None
+    result = dict(
+        group_id=rule.group_id,
+        direction=rule.direction,
+        index=rule.index,
+        ip_protocol=rule.ip_protocol,
+        from_port=rule.from_port,
+        to_port=rule.to_port,
+    )
+    if matched in rule.group_ids:
+        result["referenced_group_id"] = matched
+    else:
+        result["cidr_ipv6" if ":" in rule.cidrs[matched] else "cidr_ip"] = rule.cidrs[matched]
+        if rule.sources[matched]:
+            result["prefix_list_id"] = rule.sources[matched]
+    return result
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Active TCP reachability probes, to confirm the verdicts of the evaluation
+# modules with real traffic: a TCP connection is opened and closed to each
+# target, concurrently on an asyncio event loop. Only the event loop API of
+# Python 3.6 is used, asyncio.run and friends are not.
+
+import asyncio
+import math
+import time
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count, phase
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+PERCENTILES = (50, 90, 95, 99)
+
+# Status of a target, in order of precedence when its attempts differ
+STATUSES = ("reachable", "refused", "timeout", "error")
+
+
+async def connect(host, port, timeout):
+    """Open and close a TCP connection to host:port.
+
+    Return (status, latency in seconds, message), status being one of
+    STATUSES. The latency is the time to establish the connection, including
+    the name resolution of host.
+    """
+    count("tcp_connections_attempted")
+    start = time.perf_counter()
+    try:
+        writer = (await asyncio.wait_for(asyncio.open_connection(host, port), timeout))[1]
+    except asyncio.TimeoutError:
+        # Python >= 3.11 raises the builtin TimeoutError, an OSError, check it first
+        return "timeout", None, "No connection established within {0} seconds".format(timeout)
+    except ConnectionRefusedError as e:
+        return "refused", None, "Connection refused: {0}".format(e)
+    except ConnectionResetError:
+        # A SYN is answered by a reset as a refusal, a reset is only reported
+        # once the handshake succeeded and the peer closed the connection
+        count("tcp_connections_established")
+        return "reachable", time.perf_counter() - start, None
+    except OSError as e:
+        return "error", None, "Connection failed: {0}".format(e)
+    latency = time.perf_counter() - start
+    count("tcp_connections_established")
+    try:
+        writer.close()
+        if hasattr(writer, "wait_closed"):
+            await writer.wait_closed()
+    except OSError:
+        # The handshake succeeded, the peer resetting the connection since does not matter
+        pass
+    return "reachable", latency, None
+
+
+async def probe_target(semaphore, target, attempts, timeout):
+    """Probe a target attempts times, one attempt after the other.
+
+    The target is reachable when one attempt establishes a connection,
+    otherwise its status and message are the ones of the last attempt.
+    """
+    host, port = target["host"], target["port"]
+    timeout = target.get("timeout") or timeout
+    outcomes = []
+    for _ in range(attempts):
+        # The semaphore bounds the connections in progress, not the targets
+        async with semaphore:
+            outcomes.append(await connect(host, port, timeout))
+
+    latencies = [latency for status, latency, message in outcomes if status == "reachable"]
+    status, _, message = outcomes[-1]
+    result = dict(
+        host=host,
+        port=port,
+        status="reachable" if latencies else status,
+        attempts=attempts,
+        established=len(latencies),
+        latencies_ms=[round(latency * 1000, 3) for latency in latencies],
+    )
+    if target.get("name") is not None:
+        result["name"] = target["name"]
+    if not latencies:
+        result["msg"] = message
+    if target.get("expected") is not None:
+        result["expected"] = target["expected"]
+        result["agrees"] = bool(latencies) == target["expected"]
+    return result
+
+
+async def probe_all(targets, attempts, timeout, max_concurrent_connections):
+    # The semaphore must be created by the running loop on Python < 3.10
+    semaphore = asyncio.Semaphore(max_concurrent_connections)
+    return await asyncio.gather(*[probe_target(semaphore, target, attempts, timeout) for target in targets])
+
+
+def probe(targets, attempts=1, timeout=3.0, max_concurrent_connections=64):
+    """Probe the TCP targets, dicts with host, port and optionally name, timeout and expected.
+
+    The targets are probed concurrently, with at most max_concurrent_connections
+    connections in progress, and the results are returned in order of targets.
+    """
+    if not targets:
+        return []
+    loop = asyncio.new_event_loop()
+    try:
+        with phase("probe"):
+            return loop.run_until_complete(probe_all(targets, attempts, timeout, max_concurrent_connections))
+    finally:
+        loop.close()
+
+
+def percentile(values, p):
+    """Return the p-th percentile of sorted values, by the nearest-rank method."""
+    return values[max(int(math.ceil(p / 100.0 * len(values))) - 1, 0)]
+
+
+def latency_statistics(latencies_ms):
+    # min, max, mean and PERCENTILES of the latencies, None without latency
+    if not latencies_ms:
+        return None
+    values = sorted(latencies_ms)
+    statistics = dict(min=values[0], max=values[-1], mean=round(sum(values) / len(values), 3))
+    for p in PERCENTILES:
+        statistics["p{0}".format(p)] = percentile(values, p)
+    return statistics
+
+
+def latency_histogram(latencies_ms, buckets_ms=None):
+    """Return the number of latencies per bucket, as a list of dict(le_ms, count).
+
+    Each latency is counted in the first bucket whose le_ms upper bound it
+    does not exceed, a last bucket with a null le_ms counts the latencies
+    above every bound.
+    """
+    bounds = sorted(set(buckets_ms or HISTOGRAM_BUCKETS_MS))
+    counts = [0] * (len(bounds) + 1)
+    for latency in latencies_ms:
+        index = next((i for i, bound in enumerate(bounds) if latency <= bound), len(bounds))
+        counts[index] += 1
+    return [dict(le_ms=bound, count=value) for bound, value in zip(bounds + [None], counts)]
+
+
+def summarize(results, buckets_ms=None):
+    """Return the number of targets by status, the latency statistics and histogram of all the connections."""
+    latencies_ms = [latency for result in results for latency in result["latencies_ms"]]
+    summary = dict((status, 0) for status in STATUSES)
+    for result in results:
+        summary[result["status"]] += 1
+    summary.update(
+        disagreements=len([result for result in results if result.get("agrees") is False]),
+        latency_ms=latency_statistics(latencies_ms),
+        histogram=latency_histogram(latencies_ms, buckets_ms),
+    )
+    return summary
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import time
+from contextlib import contextmanager
+from threading import Lock, get_ident
+
+# Option of the modules returning timings
+TIMINGS_ARGUMENT_SPEC = dict(
+    collect_timings=dict(type="bool", default=False),
+)
+
+# The Timings collecting the phases and counters of the running module, if any.
+# Phases and counters are no-ops otherwise, evaluation code can call them unconditionally.
+_active = None
+
+
+class Timings:
+    """Per-phase wall time and work counters of a module run."""
+
+    def __init__(self, name=None):
+        self.name = name
+        self.started = time.time()
+        self.start = time.perf_counter()
+        self.phases = {}
+        self.counters = {}
+        self.lock = Lock()
+        self._open = {}
+
+    def __enter__(self):
+        global _active
+        self._previous = _active
+        _active = self
+        return self
+
+    def __exit__(self, *exc_info):
+        global _active
+        _active = self._previous
+
+    def add_phase(self, name, seconds):
+        with self.lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_count(self, name, value):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def result(self):
+        now = time.perf_counter()
+        phases = dict(self.phases)
+        # Phases left by exit_json or fail_json
+        for (name, dummy), start in list(self._open.items()):
+            phases[name] = phases.get(name, 0.0) + now - start
+        return dict(
+            module=self.name,
+            started=self.started,
+            total_ms=round((now - self.start) * 1000, 3),
+            phases_ms=dict((name, round(seconds * 1000, 3)) for name, seconds in phases.items()),
+            counters=dict(self.counters),
+        )
+
+
+@contextmanager
+def phase(name):
+    """Measure the wall time of the block as the phase name.
+
+    Phases of the same name add up, including the ones run by concurrent threads.
+    """
+    timings = _active
+    if timings is None:
+        yield
+        return
+    key = (name, get_ident())
+    start = time.perf_counter()
+    timings._open[key] = start
+    try:
+        yield
+    finally:
+        timings._open.pop(key, None)
+        timings.add_phase(name, time.perf_counter() - start)
+
+
+def count(name, value=1):
+    if _active is not None:
+        _active.add_count(name, value)
+
+
+@contextmanager
+def module_timings(module):
+    """Collect the timings of the module when its collect_timings option is set.
+
+    exit_json and fail_json return them as timings.
+    """
+    if not module.params.get("collect_timings"):
+        yield
+        return
+
+    timings = Timings(getattr(module, "_name", None))
+
+    def with_timings(method):
+        def wrapper(*args, **kwargs):
+            kwargs["timings"] = timings.result()
+            method(*args, **kwargs)
+
+        return wrapper
+
+    module.exit_json = with_timings(module.exit_json)
+    module.fail_json = with_timings(module.fail_json)
+    with timings:
+        yield
+
+
+def iter_timings(value):
+    # Module results may be nested in the results of a loop
+    if isinstance(value, list):
+        for item in value:
+            for timings in iter_timings(item):
+                yield timings
+    elif isinstance(value, dict):
+        if isinstance(value.get("timings"), dict):
+            yield value["timings"]
+        elif isinstance(value.get("results"), list):
+            for timings in iter_timings(value["results"]):
+                yield timings
+
+
+def timings_profile(results, since=None):
+    """Aggregate the timings of module results into one profile.
+
+    results is a list of module results or of loop results, the ones without
+    timings or started before the since epoch are ignored.
+    """
+    profile = dict(total_ms=0.0, phases_ms={}, counters={}, modules=[])
+    seen = set()
+    for timings in iter_timings(results):
+        key = (timings.get("module"), timings.get("started"))
+        if key in seen or (since is not None and timings.get("started", 0) < float(since)):
+            continue
+        seen.add(key)
+        profile["total_ms"] += timings.get("total_ms", 0)
+        for name, value in (timings.get("phases_ms") or {}).items():
+            profile["phases_ms"][name] = profile["phases_ms"].get(name, 0) + value
+        for name, value in (timings.get("counters") or {}).items():
+            profile["counters"][name] = profile["counters"].get(name, 0) + value
+        profile["modules"].append(dict(module=timings.get("module"), total_ms=timings.get("total_ms", 0)))
+    profile["total_ms"] = round(profile["total_ms"], 3)
+    profile["phases_ms"] = dict((name, round(value, 3)) for name, value in profile["phases_ms"].items())
+    return profile
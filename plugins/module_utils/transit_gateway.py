@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from threading import Lock
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.route_table import RouteTable
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import count, phase
+
+# Route table indexes, keyed by transit gateway route table id. A transit gateway
+# route table holds thousands of propagated routes, its index is built once per
+# describe result and shared by the flows evaluated with it, e.g. by the flows
+# of a region whose describe calls are memoised.
+_indexes = {}
+_lock = Lock()
+
+
+def transit_gateway_route(route):
+    """Return a transit gateway route in the format of the VPC route table routes.
+
+    The target of the route is its VPC attachment, or its first attachment.
+    Blackhole routes are indexed, the traffic they match is dropped.
+    """
+    attachments = route.get("transit_gateway_attachments") or []
+    vpc_attachments = [attachment for attachment in attachments if attachment.get("resource_type") == "vpc"]
+    attachment = (vpc_attachments or attachments or [{}])[0]
+    return dict(
+        destination_cidr_block=route.get("destination_cidr_block"),
+        destination_prefix_list_id=route.get("prefix_list_id"),
+        transit_gateway_attachment_id=attachment.get("transit_gateway_attachment_id"),
+        resource_id=attachment.get("resource_id"),
+        resource_type=attachment.get("resource_type"),
+        type=route.get("type"),
+        blackhole=route.get("state") == "blackhole",
+    )
+
+
+def transit_gateway_route_table_index(route_table, prefix_lists=None):
+    """Return the RouteTable of a transit gateway route table, see _indexes."""
+    key = route_table["transit_gateway_route_table_id"]
+    with _lock:
+        cached = _indexes.get(key)
+    if cached is not None and cached[0] is route_table and cached[1] is prefix_lists:
+        count("transit_gateway_index_hits")
+        return cached[2]
+
+    with phase("transit_gateway_index"):
+        index = RouteTable([transit_gateway_route(route) for route in route_table.get("routes") or []], prefix_lists)
+    with _lock:
+        _indexes[key] = (route_table, prefix_lists, index)
+    return index
+
+
+def associated_route_table(route_tables, attachment_id):
+    # The transit gateway route table the attachment is associated with, None if there is none
+    for route_table in route_tables:
+        for association in route_table.get("associations") or []:
+            if association.get("transit_gateway_attachment_id") == attachment_id:
+                return route_table
+    return None
+
+
+def vpc_attachment(attachments, vpc_id):
+    # The available attachment of the VPC, None if there is none
+    for attachment in attachments:
+        if attachment.get("vpc_id") == vpc_id and attachment.get("state") == "available":
+            return attachment
+    return None
@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Checks of the validate_* modules, comparing the resources of an EC2 instance
+# (source) with the ones of an RDS instance (destination). As the evaluations of
+# connectivity.py, they return the success message or raise ConnectivityError.
+
+from collections import namedtuple
+from ipaddress import ip_address, ip_network
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    check,
+    evaluation,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.port_ranges import (
+    ALL_PORTS,
+    format_port_ranges,
+    intersect,
+    merge,
+    parse_ports,
+    subtract,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    count,
+    phase,
+)
+
+# NACL Entry format
+# [
+#   100,            -> Rule number
+#   "all",          -> protocol
+#   "allow",        -> Rule action
+#   "0.0.0.0/0",    -> CIDR block, the IPv6 CIDR block for IPv6 entries
+#   null,           -> icmp type
+#   null,           -> icmp code
+#   0,              -> port range from
+#   65535           -> port range to
+# ]
+NACLEntry = namedtuple(
+    "NACLEntry",
+    [
+        "rule_number",
+        "protocol",
+        "rule_action",
+        "cidr_block",
+        "icmp_type",
+        "icmp_code",
+        "port_range_from",
+        "port_range_to",
+    ],
+)
+
+
+def overlaps(cidr, other):
+    # CIDRs of different IP versions never overlap
+    return ip_network(cidr, strict=False).overlaps(ip_network(other, strict=False))
+
+
+def route_destination(route):
+    return route.get("destination_cidr_block") or route.get("destination_ipv6_cidr_block")
+
+
+def peering_routes_missing(route_tables, remote_cidrs):
+    # Return the IDs of the route tables without a peering route to each remote CIDR
+    missing = []
+    for rtb in route_tables:
+        required_cidrs = list(remote_cidrs)
+        for route in rtb["routes"]:
+            count("routes_examined")
+            if "vpc_peering_connection_id" not in route.keys() or not route_destination(route):
+                continue
+            if len(required_cidrs) == 0:
+                break
+            required_cidrs = [cidr for cidr in required_cidrs if not overlaps(route_destination(route), cidr)]
+        if len(required_cidrs) > 0:
+            missing.append(rtb["route_table_id"])
+    return missing
+
+
+def subnets_without_route_table(subnet_ids, route_tables):
+    # Whether some subnets use the main route table of the VPC, not an associated one
+    associated = [
+        assoc["subnet_id"] for rtb in route_tables for assoc in rtb["associations"] if assoc["subnet_id"] in subnet_ids
+    ]
+    return len(associated) < len(subnet_ids)
+
+
+@evaluation("Route table validation successful", "Route table validation failed")
+def validate_route_tables(
+    src_subnets,
+    src_private_ips,
+    src_route_tables,
+    src_vpc_route_tables,
+    dest_subnets,
+    dest_route_tables,
+    dest_vpc_route_tables,
+):
+    # RDS Info
+    dest_subnet_ids = [x.get("id") for x in dest_subnets]
+    dest_subnet_cidrs = [x.get("cidr_block") for x in dest_subnets]
+    dest_vpc_id = list(set(x.get("vpc_id") for x in dest_subnets))
+
+    # EC2 Instance Info
+    src_subnet_ids = [x.get("id") for x in src_subnets]
+    src_vpc_id = list(set(x.get("vpc_id") for x in src_subnets))
+
+    b_check_vpc_rtb_rds = subnets_without_route_table(dest_subnet_ids, dest_route_tables)
+    b_check_vpc_rtb_ec2 = subnets_without_route_table(src_subnet_ids, src_route_tables)
+
+    with phase("vpc"):
+        # Check whether resources are in the same VPC. If not, Cidr cannot overlap
+        if dest_vpc_id[0] == src_vpc_id[0]:
+            return "Resources located in the same VPC."
+        for dest_cidr in dest_subnet_cidrs:
+            for ip_addr in src_private_ips:
+                if overlaps(dest_cidr, ip_addr):
+                    raise ConnectivityError("Resources are located in different VPCs, however, Cidrs are overlapping.")
+
+    with phase("route_tables"):
+        # Check whether resources are using the same route table
+        if (dest_route_tables == src_route_tables) and not b_check_vpc_rtb_ec2 and not b_check_vpc_rtb_rds:
+            return "Source and destination resources are using the same route table(s): {0}".format(
+                [rtb["route_table_id"] for rtb in src_route_tables]
+            )
+
+    # Subnets without an associated route table use the main route table of their VPC
+    if b_check_vpc_rtb_rds:
+        dest_route_tables = dest_route_tables + dest_vpc_route_tables
+    if b_check_vpc_rtb_ec2:
+        src_route_tables = src_route_tables + src_vpc_route_tables
+
+    with phase("route_connection"):
+        # Check whether route is through a peering connection
+        # Verify whether Destination RTBs contains route to Source network
+        rds_rtb_list = peering_routes_missing(dest_route_tables, src_private_ips)
+
+    with phase("route_to_destination"):
+        # Verify whether Source RTB contains route to Destination network
+        ec2_rtb_list = peering_routes_missing(src_route_tables, dest_subnet_cidrs)
+
+    if len(rds_rtb_list) > 0:
+        raise ConnectivityError(
+            "Please review route table(s) {0} for entries matching {1} Cidr".format(rds_rtb_list, src_private_ips)
+        )
+
+    if len(ec2_rtb_list) > 0:
+        raise ConnectivityError(
+            "Please review route table(s) {0} for entries matching {1} Cidr".format(ec2_rtb_list, dest_subnet_cidrs)
+        )
+
+
+def nacl_entry_ports(nacl_entry):
+    if nacl_entry.port_range_from is not None and nacl_entry.port_range_to is not None:
+        return [(nacl_entry.port_range_from, nacl_entry.port_range_to)]
+    return ALL_PORTS
+
+
+def sweep_nacl_entries(acl_entries, port_ranges, remote_cidrs=None, remote_ips=None):
+    """Return the entry deciding the traffic on each sub-range of port_ranges.
+
+    The entries are scanned once, in order: each matching entry decides the
+    ports of its range which no previous entry decided, the ports no entry
+    matches are denied. The result is a list of (port range, entry or None,
+    number of entries scanned up to the entry) sorted by port.
+
+    Egress entries match when their CIDR block overlaps one of remote_cidrs, ingress
+    entries when it contains one of remote_ips.
+    """
+    undecided = list(port_ranges)
+    decided = []
+    scanned = 0
+    for entry in acl_entries:
+        if not undecided:
+            break
+        scanned += 1
+        nacl_entry = NACLEntry(*entry)
+        if nacl_entry.protocol not in ("all", "tcp"):
+            continue
+        entry_ports = nacl_entry_ports(nacl_entry)
+        matched = intersect(undecided, entry_ports)
+        if not matched:
+            continue
+
+        if remote_cidrs is not None:
+            # Evaluate traffic based on CIDR for egress
+            eval_traffic = (overlaps(nacl_entry.cidr_block, cidr) for cidr in remote_cidrs)
+        else:
+            # Evaluate traffic based on IP for ingress
+            eval_traffic = (ip_address(ip) in ip_network(nacl_entry.cidr_block, strict=False) for ip in remote_ips)
+        if not any(eval_traffic):
+            continue
+
+        decided.extend((port_range, nacl_entry, scanned) for port_range in matched)
+        undecided = subtract(undecided, entry_ports)
+    count("network_acl_rules_scanned", scanned)
+    decided.extend((port_range, None, scanned) for port_range in undecided)
+    return sorted(decided, key=lambda item: item[0])
+
+
+def evaluate_network_acl(acl, direction, port_ranges, remote_cidrs=None, remote_ips=None, explanation=None):
+    # Return the port ranges the network ACL denies traffic on
+    denied = []
+    for port_range, nacl_entry, scanned in sweep_nacl_entries(
+        acl.get(direction, []), port_ranges, remote_cidrs=remote_cidrs, remote_ips=remote_ips
+    ):
+        allowed = nacl_entry is not None and nacl_entry.rule_action == "allow"
+        if not allowed:
+            denied.append(port_range)
+        if explanation is not None:
+            explanation.append(
+                dict(
+                    check="network_acl",
+                    network_acl_id=acl.get("nacl_id"),
+                    direction=direction,
+                    ports=format_port_ranges([port_range])[0],
+                    allowed=allowed,
+                    rule=(
+                        dict(
+                            rule_number=nacl_entry.rule_number,
+                            protocol=nacl_entry.protocol,
+                            rule_action=nacl_entry.rule_action,
+                            cidr_block=nacl_entry.cidr_block,
+                            port_from=nacl_entry.port_range_from,
+                            port_to=nacl_entry.port_range_to,
+                        )
+                        if nacl_entry
+                        else None
+                    ),
+                    scan_depth=scanned,
+                )
+            )
+    return merge(denied)
+
+
+def set_port_verdict(verdict, port_ranges, denied):
+    # Fill verdict with the exact allowed and denied sub-ranges of port_ranges
+    if verdict is not None:
+        verdict.update(
+            allowed_ports=format_port_ranges(subtract(port_ranges, denied)),
+            denied_ports=format_port_ranges(denied),
+        )
+
+
+@evaluation("Network ACL validation successful", "Network ACL validation failed")
+def validate_network_acls(
+    src_network_acl_rules,
+    src_private_ips,
+    dest_network_acl_rules,
+    dest_subnet_cidrs,
+    dest_ports,
+    explanation=None,
+    verdict=None,
+):
+    """Evaluate the network ACLs for the traffic to dest_ports.
+
+    dest_ports is a list of ports and "from-to" port ranges, each network ACL is
+    evaluated for all of them in one sweep over its entries. Every network ACL is
+    evaluated, verdict is filled with the allowed_ports and denied_ports
+    sub-ranges of the path.
+    """
+    port_ranges = parse_ports(dest_ports)
+    denials = []
+
+    # Verify Egress traffic from Source to Destination subnets
+    with phase("network_acl_egress"):
+        for acl in src_network_acl_rules:
+            denied = evaluate_network_acl(
+                acl, "egress", port_ranges, remote_cidrs=dest_subnet_cidrs, explanation=explanation
+            )
+            denials.append((acl, "egress", denied))
+
+    # Verify Ingress traffic to Destination from Source Instance IP
+    with phase("network_acl_ingress"):
+        for acl in dest_network_acl_rules:
+            denied = evaluate_network_acl(
+                acl, "ingress", port_ranges, remote_ips=src_private_ips, explanation=explanation
+            )
+            denials.append((acl, "ingress", denied))
+
+    set_port_verdict(verdict, port_ranges, merge(port_range for item in denials for port_range in item[2]))
+    for acl, direction, denied in denials:
+        if denied:
+            raise ConnectivityError(
+                "Network acl {id} is not allowing traffic for port(s) {ports}."
+                "Please review network acl for {acl_type} rules allowing port(s) {ports}".format(
+                    id=acl.get("nacl_id"),
+                    ports=", ".join(format_port_ranges(denied)),
+                    acl_type=direction,
+                )
+            )
+
+
+def security_group_rule_cidrs(rule):
+    return [cidr["cidr_ip"] for cidr in rule.get("ip_ranges") or []] + [
+        cidr["cidr_ipv6"] for cidr in rule.get("ipv6_ranges") or []
+    ]
+
+
+def security_group_rule_ports(rule, protocol):
+    # The port ranges of the rule for protocol, None when the rule is for another protocol
+    if rule["ip_protocol"] == "-1":
+        return ALL_PORTS
+    if rule["ip_protocol"] == protocol:
+        return [(rule["from_port"], rule["to_port"])]
+    return None
+
+
+def security_group_egress_ports(security_group, peer_group_ids, remote_cidrs, protocol):
+    """Return the port ranges on which the egress rules allow traffic towards every remote CIDR.
+
+    Each rule is scanned once, a remote CIDR is allowed on the union of the port
+    ranges of the rules overlapping it.
+    """
+    peer_ports = []
+    cidr_ports = [[] for remote_cidr in remote_cidrs]
+    for rule in security_group.get("ip_permissions_egress", []):
+        count("security_group_rules_scanned")
+        rule_ports = security_group_rule_ports(rule, protocol)
+        if rule_ports is None:
+            continue
+        if any(group["group_id"] in peer_group_ids for group in rule["user_id_group_pairs"]):
+            peer_ports.extend(rule_ports)
+            continue
+        cidrs = security_group_rule_cidrs(rule)
+        for ports, remote_cidr in zip(cidr_ports, remote_cidrs):
+            if any(overlaps(cidr, remote_cidr) for cidr in cidrs):
+                ports.extend(rule_ports)
+
+    allowed = ALL_PORTS
+    for ports in cidr_ports:
+        allowed = intersect(allowed, merge(ports))
+    return merge(peer_ports + allowed)
+
+
+def security_group_ingress_ports(security_group, peer_group_ids, remote_ip, protocol):
+    # Return the port ranges on which the ingress rules allow traffic from remote_ip
+    allowed = []
+    for rule in security_group.get("ip_permissions", []):
+        count("security_group_rules_scanned")
+        rule_ports = security_group_rule_ports(rule, protocol)
+        if rule_ports is None:
+            continue
+        if any(group["group_id"] in peer_group_ids for group in rule["user_id_group_pairs"]) or any(
+            ip_address(remote_ip) in ip_network(cidr, strict=False) for cidr in security_group_rule_cidrs(rule)
+        ):
+            allowed.extend(rule_ports)
+    return merge(allowed)
+
+
+@evaluation("Security Group validation successful", "Security Group validation failed")
+def validate_security_group_rules(
+    src_security_groups,
+    src_private_ip,
+    dest_security_groups,
+    dest_subnet_cidrs,
+    dest_ports,
+    protocol="tcp",
+    verdict=None,
+):
+    """Evaluate the security groups for the traffic to dest_ports.
+
+    dest_ports is a list of ports and "from-to" port ranges. The traffic on a
+    port is allowed when a source security group allows it egress and a
+    destination one ingress, verdict is filled with the allowed_ports and
+    denied_ports sub-ranges.
+    """
+    port_ranges = parse_ports(dest_ports)
+    dest_secgroup_ids = [x["group_id"] for x in dest_security_groups]
+    src_secgroup_ids = [x["group_id"] for x in src_security_groups]
+
+    # Verify Egress traffic from Source Instance to Destination subnets
+    with phase("security_group_egress"):
+        egress = []
+        for sec_group in src_security_groups:
+            egress.extend(security_group_egress_ports(sec_group, dest_secgroup_ids, dest_subnet_cidrs, protocol))
+        egress_denied = subtract(port_ranges, merge(egress))
+
+    # Verify Ingress traffic to Destination from Source Instance IP
+    with phase("security_group_ingress"):
+        ingress = []
+        for sec_group in dest_security_groups:
+            ingress.extend(security_group_ingress_ports(sec_group, src_secgroup_ids, src_private_ip, protocol))
+        ingress_denied = subtract(port_ranges, merge(ingress))
+
+    set_port_verdict(verdict, port_ranges, merge(egress_denied + ingress_denied))
+    if egress_denied:
+        raise ConnectivityError(
+            "Security group(s) {ids} are not allowing {protocol} traffic to IP ranges {ip_addr} for port(s) {ports}. "
+            "Please review security group(s) {ids} for rules allowing egress TCP traffic to port(s) {ports}".format(
+                ids=src_secgroup_ids,
+                protocol=protocol,
+                ip_addr=dest_subnet_cidrs,
+                ports=", ".join(format_port_ranges(egress_denied)),
+            )
+        )
+
+    if ingress_denied:
+        raise ConnectivityError(
+            "Security group(s) {ids} are not allowing {protocol} traffic from IP {ip_addr} for port(s) {ports}. "
+            "Please review security group(s) {ids} for rules allowing ingress TCP traffic to port(s) {ports}".format(
+                ids=dest_secgroup_ids,
+                protocol=protocol,
+                ip_addr=src_private_ip,
+                ports=", ".join(format_port_ranges(ingress_denied)),
+            )
+        )
+
+
+CONNECTIVITY_CHECKS = ("security_groups", "network_acls", "route_tables")
+
+
+def check_addresses(evaluate, addresses, port_ranges):
+    """Run evaluate(address, verdict) for each source address, see check.
+
+    The traffic is allowed when it is for every address: the result is the one
+    of check, with the messages and the list of the denied addresses, and the
+    allowed_ports and denied_ports of the addresses together.
+    """
+    messages = []
+    denied = []
+    denied_addresses = []
+    result = None
+    for address in addresses:
+        verdict = {}
+        outcome = check(evaluate, address, verdict)
+        if outcome["allowed"]:
+            result = outcome["result"]
+        else:
+            denied_addresses.append(address)
+            if outcome["msg"] not in messages:
+                messages.append(outcome["msg"])
+        # An evaluation failing before its verdict, e.g. on a malformed rule, denies every port
+        denied.extend(parse_ports(verdict["denied_ports"]) if "denied_ports" in verdict else port_ranges)
+    outcome = dict(allowed=False, msg=" ".join(messages)) if messages else dict(allowed=True, result=result)
+    set_port_verdict(outcome, port_ranges, merge(denied))
+    outcome["denied_addresses"] = denied_addresses
+    return outcome
+
+
+def validate_connectivity(src_network_info, src_private_ips, dest_network_info, dest_ports, checks=CONNECTIVITY_CHECKS):
+    """Run the checks of the validate_* modules for the traffic from src_private_ips to dest_ports.
+
+    src_network_info and dest_network_info are results of gather_network_info.
+    Every check of checks is run, whichever denies the traffic, and the result
+    is a dict keyed by check of check results: the security group and network
+    ACL checks are run for each source address and report their allowed_ports,
+    denied_ports and denied_addresses.
+    """
+    port_ranges = parse_ports(dest_ports)
+    dest_subnet_cidrs = [subnet["cidr_block"] for subnet in dest_network_info["subnets"]]
+    results = {}
+
+    if "security_groups" in checks:
+        results["security_groups"] = check_addresses(
+            lambda address, verdict: validate_security_group_rules(
+                src_network_info["security_groups"],
+                address,
+                dest_network_info["security_groups"],
+                dest_subnet_cidrs,
+                dest_ports,
+                verdict=verdict,
+            ),
+            src_private_ips,
+            port_ranges,
+        )
+
+    if "network_acls" in checks:
+        results["network_acls"] = check_addresses(
+            lambda address, verdict: validate_network_acls(
+                src_network_info["nacls"],
+                [address],
+                dest_network_info["nacls"],
+                dest_subnet_cidrs,
+                dest_ports,
+                verdict=verdict,
+            ),
+            src_private_ips,
+            port_ranges,
+        )
+
+    if "route_tables" in checks:
+        results["route_tables"] = check(
+            validate_route_tables,
+            src_network_info["subnets"],
+            src_private_ips,
+            src_network_info["route_tables"],
+            src_network_info["vpc_route_tables"],
+            dest_network_info["subnets"],
+            dest_network_info["route_tables"],
+            dest_network_info["vpc_route_tables"],
+        )
+    return results
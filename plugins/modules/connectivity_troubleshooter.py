@@ -0,0 +1,243 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: connectivity_troubleshooter
+short_description: Troubleshoot connectivity between AWS resources in a single task
+description:
+  - Troubleshoot connectivity between an AWS resource in an Amazon VPC and a destination, with the same inputs and verdicts
+    as the C(cloud.aws_troubleshooting.connectivity_troubleshooter) role.
+  - The next hop towards the destination is read from the source route table, then the local, internet gateway, NAT gateway,
+    VPC peering or transit gateway path is evaluated.
+  - This is an action plugin, the evaluation runs on the controller and only the describe calls run information modules.
+  - The play C(module_defaults) for C(group/aws) are applied to the information modules.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  destination_ip:
+    description:
+    - The IPv4 or IPv6 address of the resource you want to connect to.
+    type: str
+    required: true
+  destination_port:
+    description:
+    - The port number you want to connect to on the destination resource.
+    type: int
+    required: true
+  source_ip:
+    description:
+    - The private IPv4 address or the IPv6 address of the AWS resource in your Amazon VPC you want to test connectivity from.
+    type: str
+    required: true
+  source_vpc:
+    description:
+    - The ID of the Amazon VPC you want to test connectivity from.
+    type: str
+  source_port_range:
+    description:
+    - The port range used by the AWS resource in your Amazon VPC you want to test connectivity from, e.g. C(1024-65535).
+    type: str
+  destination_vpc:
+    description:
+    - The ID of the Amazon VPC you want to test connectivity to.
+    type: str
+  snapshot_mode:
+    description:
+    - C(capture) stores the result of each describe call in C(snapshot_file).
+    - C(replay) reads the describe results from C(snapshot_file), no AWS API call is made.
+    - See M(cloud.aws_troubleshooting.resource_info).
+    type: str
+    default: disabled
+    choices: ['disabled', 'capture', 'replay']
+  snapshot_file:
+    description:
+    - Path of the snapshot file on the controller.
+    - Required when C(snapshot_mode) is C(capture) or C(replay).
+    type: path
+  cache_ttl:
+    description:
+    - Number of seconds a cached describe result is reused, C(0) disables the cache.
+    - Cached results are not shared between profiles, access keys, regions and endpoints, whether they are set by
+      module_defaults or environment variables. The cache is not used when the task runs on a remote host.
+    type: int
+    default: 0
+  cache_dir:
+    description:
+    - Directory of the describe cache on the controller.
+    type: path
+    default: ~/.ansible/cache/aws_troubleshooting
+  cache_invalidate:
+    description:
+    - Resource IDs and information modules, by FQCN or short name, whose cached results are discarded.
+    - A resource ID discards the cached results filtering on it or describing it, an information module discards every
+      cached result of the module, see M(cloud.aws_troubleshooting.resource_info).
+    type: list
+    elements: str
+    default: []
+  cache_bypass:
+    description:
+    - Do not read nor write the describe cache.
+    type: bool
+    default: false
+notes:
+  - Security groups and network ACLs of the source and destination are described in a single call each.
+  - The attachments and route tables of a transit gateway are described once per transit gateway, see
+    M(cloud.aws_troubleshooting.transit_gateway_route_table_info).
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Troubleshoot connectivity between two instances
+  module_defaults:
+    group/aws:
+      region: us-east-1
+  block:
+    - name: Evaluate the path from 172.31.2.7 to 172.31.2.8:443
+      cloud.aws_troubleshooting.connectivity_troubleshooter:
+        destination_ip: 172.31.2.8
+        destination_port: 443
+        source_ip: 172.31.2.7
+        source_port_range: 1024-65535
+      register: connectivity
+"""
+
+
+RETURN = r"""
+next_hop:
+  description: The next hop towards the destination in the source route table.
+  returned: success
+  type: str
+  sample: local
+result:
+  description: The result of each evaluation of the path.
+  returned: success
+  type: list
+  elements: str
+  sample:
+    - Security Groups rules validation successful
+    - Network ACLs evaluation successful
+explanation:
+  description:
+    - What decided the verdict of each check, in evaluation order. The evaluation stops at the first check denying the
+      traffic.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: The kind of check, one of C(security_group), C(network_acl), C(route) and C(transit_gateway_route).
+      type: str
+    transit_gateway_route_table_id:
+      description: The transit gateway route table looked up, for transit gateway route checks.
+      type: str
+    direction:
+      description: C(egress) or C(ingress), for security group and network ACL checks.
+      type: str
+    subnet_id:
+      description: The subnet whose network ACL is checked.
+      type: str
+    security_groups:
+      description: The security groups checked.
+      type: list
+      elements: str
+    remote_ip:
+      description: The IP address at the other end of the traffic.
+      type: str
+    remote_security_groups:
+      description: The security groups at the other end of the traffic, that rules may reference.
+      type: list
+      elements: str
+    port:
+      description: The destination port, for security group checks.
+      type: int
+    ports:
+      description: The first and last port of the traffic, for network ACL checks.
+      type: list
+      elements: int
+    allowed:
+      description: Whether the check allows the traffic.
+      type: bool
+    rule:
+      description:
+        - The first security group rule allowing the traffic, with the C(cidr_ip), C(cidr_ipv6) or the
+          C(referenced_group_id) it matched and its C(index) in the rules of the group, or the first matching network ACL entry.
+        - C(prefix_list_id) is the managed prefix list the matched C(cidr_ip) belongs to, if any.
+        - C(null) when no rule matches, the traffic is then denied.
+      type: dict
+    destination_ip:
+      description: The address looked up in the route table, for route checks.
+      type: str
+    route:
+      description:
+        - The longest prefix match route, with its C(destination_cidr_block) and C(next_hop), C(null) if none.
+        - The next hop of a transit gateway route is its attachment, C(null) for a blackhole route.
+        - For a managed prefix list route, C(destination_cidr_block) is the matched CIDR of the prefix list
+          C(destination_prefix_list_id).
+      type: dict
+    scan_depth:
+      description: The number of rules scanned up to the match, or of route table trie nodes walked.
+      type: int
+  sample:
+    - check: network_acl
+      subnet_id: subnet-0d8ddbeaa790da839
+      direction: egress
+      remote_ip: 172.32.2.13
+      ports: [3389, 3389]
+      allowed: true
+      rule:
+        rule_number: 100
+        protocol: all
+        rule_action: allow
+        cidr_block: 0.0.0.0/0
+        port_from: 0
+        port_to: 65535
+      scan_depth: 1
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(describe_calls), C(describe_memo_hits) or C(security_group_rules_scanned).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.connectivity_troubleshooter
+    started: 1791331200.123
+    total_ms: 1286.53
+    phases_ms:
+      describe: 1285.036
+      eval_security_groups: 0.206
+      eval_network_acls: 0.3
+    counters:
+      describe_calls: 5
+      describe_memo_hits: 1
+      routes_indexed: 2
+      route_lookups: 1
+      cidrs_parsed: 6
+      security_group_rules_scanned: 2
+      network_acl_rules_scanned: 4
+"""
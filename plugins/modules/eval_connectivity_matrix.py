@@ -0,0 +1,409 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: eval_connectivity_matrix
+short_description: Evaluate connectivity between every pair of network interfaces of a VPC
+description:
+  - Evaluate route tables, security group rules and network ACLs for every (source, destination, port) combination of a set of network interfaces.
+  - Addresses, CIDR blocks and port ranges are encoded as integer arrays and evaluated with vectorised containment tests.
+  - Security group and network ACL rules are evaluated the same way as M(cloud.aws_troubleshooting.eval_security_groups) and
+    M(cloud.aws_troubleshooting.eval_network_acls).
+  - A flow is only allowed when the source subnet route table has a C(local) route towards the destination.
+  - Only IPv4 is evaluated, the network interfaces are matched by their private IPv4 address, and IPv6 security group and
+    network ACL rules never match.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+requirements:
+  - numpy
+options:
+  network_interfaces:
+    description:
+    - Network interfaces to evaluate, as returned by M(amazon.aws.ec2_eni_info).
+    - Each interface is used both as a source and as a destination.
+    type: list
+    elements: dict
+    required: true
+  ports:
+    description:
+    - The destination port numbers to evaluate.
+    type: list
+    elements: int
+    required: true
+  src_port_range:
+    description:
+    - The port range used by the source resources for the return traffic.
+    type: str
+    required: false
+  security_groups:
+    description:
+    - Security groups of the network interfaces, as returned by M(amazon.aws.ec2_security_group_info).
+    type: list
+    elements: dict
+    required: true
+  network_acls:
+    description:
+    - Network ACLs of the network interfaces subnets, as returned by M(amazon.aws.ec2_vpc_nacl_info).
+    type: list
+    elements: dict
+    required: true
+  route_tables:
+    description:
+    - Route tables of the VPC, as returned by M(amazon.aws.ec2_vpc_route_table_info).
+    - Subnets without an explicit association use the main route table.
+    type: list
+    elements: dict
+    required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Gather information about the VPC network interfaces
+  amazon.aws.ec2_eni_info:
+    filters:
+      vpc-id: "{{ vpc_id }}"
+  register: vpc_enis
+
+- name: Evaluate connectivity between every network interface of the VPC
+  cloud.aws_troubleshooting.eval_connectivity_matrix:
+    network_interfaces: "{{ vpc_enis.network_interfaces }}"
+    ports:
+      - 22
+      - 443
+      - 5432
+    src_port_range: "1024-65535"
+    security_groups: "{{ vpc_security_groups.security_groups }}"
+    network_acls: "{{ vpc_nacls.nacls }}"
+    route_tables: "{{ vpc_route_tables.route_tables }}"
+  register: segmentation
+"""
+
+
+RETURN = r"""
+network_interfaces:
+  type: list
+  elements: dict
+  description: The evaluated network interfaces, in the order used for the matrix rows and columns.
+  returned: success
+  contains:
+    id:
+      type: str
+      description: The network interface id.
+      sample: 'eni-0b9da14cbd81d415c'
+    private_ip_address:
+      type: str
+      description: The network interface private IPv4 address.
+      sample: '172.32.1.31'
+    subnet_id:
+      type: str
+      description: The network interface subnet id.
+      sample: 'subnet-0d8ddbeaa790da839'
+matrix:
+  type: dict
+  description:
+    - Verdicts keyed by destination port.
+    - Each port maps to one string per source interface, the character at index j is C(1) when the traffic
+      towards the destination interface j is allowed and C(0) otherwise.
+  returned: success
+  sample: {"443": ["011", "101", "000"]}
+allowed:
+  type: int
+  description: The number of allowed (source, destination, port) flows, excluding flows from an interface to itself.
+  returned: success
+  sample: 4
+denied:
+  type: int
+  description: The number of denied (source, destination, port) flows, excluding flows from an interface to itself.
+  returned: success
+  sample: 2
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(routes_indexed), C(route_lookups) or C(cidrs_parsed).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_connectivity_matrix
+    started: 1791331200.123
+    total_ms: 2.954
+    phases_ms:
+      load: 0.152
+      routes: 0.408
+      security_groups: 1.106
+      network_acls: 1.216
+    counters:
+      routes_indexed: 4
+      route_lookups: 21
+      cidrs_parsed: 47
+"""
+
+
+from ipaddress import ip_address
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_acls import (
+    first_match_allows,
+    parse_network_acl_entries,
+    parse_port_range,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.route_table import RouteTable
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.security_groups import (
+    compile_security_group_rule,
+    rule_allows_port,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+    phase,
+)
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class EvalConnectivityMatrix(AnsibleModule):
+    def __init__(self):
+        argument_spec = dict(
+            network_interfaces=dict(type="list", elements="dict", required=True),
+            ports=dict(type="list", elements="int", required=True),
+            src_port_range=dict(type="str", required=False),
+            security_groups=dict(type="list", elements="dict", required=True),
+            network_acls=dict(type="list", elements="dict", required=True),
+            route_tables=dict(type="list", elements="dict", required=True),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        super(EvalConnectivityMatrix, self).__init__(argument_spec=argument_spec)
+
+        if not HAS_NUMPY:
+            self.fail_json(msg=missing_required_lib("numpy"))
+
+        for key in argument_spec:
+            setattr(self, key, self.params.get(key))
+
+        with module_timings(self):
+            self.execute_module()
+
+    def load_interfaces(self):
+        self.interfaces = [
+            dict(
+                id=eni.get("id") or eni.get("network_interface_id"),
+                private_ip_address=eni["private_ip_address"],
+                subnet_id=eni["subnet_id"],
+            )
+            for eni in self.network_interfaces
+        ]
+        self.ips = np.array([int(ip_address(eni["private_ip_address"])) for eni in self.interfaces], dtype=np.int64)
+        self.subnet_ids = sorted(set(eni["subnet_id"] for eni in self.interfaces))
+        subnet_positions = dict((subnet_id, index) for index, subnet_id in enumerate(self.subnet_ids))
+        self.subnet_index = np.array([subnet_positions[eni["subnet_id"]] for eni in self.interfaces], dtype=np.int64)
+        self.port_numbers = np.array(self.ports, dtype=np.int64)
+
+        self.group_ids = []
+        self.group_positions = {}
+        for eni in self.network_interfaces:
+            for group in eni.get("groups", []):
+                if group["group_id"] not in self.group_positions:
+                    self.group_positions[group["group_id"]] = len(self.group_ids)
+                    self.group_ids.append(group["group_id"])
+
+        # (interfaces, groups) membership
+        self.membership = np.zeros((len(self.interfaces), len(self.group_ids)), dtype=np.float32)
+        for i, eni in enumerate(self.network_interfaces):
+            for group in eni.get("groups", []):
+                self.membership[i, self.group_positions[group["group_id"]]] = 1
+
+    def eval_routes(self):
+        # (sources, destinations) local route towards the destination
+        main_route_table = None
+        subnet_route_tables = {}
+        for route_table in self.route_tables:
+            for association in route_table.get("associations", []):
+                if association.get("main"):
+                    main_route_table = route_table
+                elif association.get("subnet_id"):
+                    subnet_route_tables[association["subnet_id"]] = route_table
+
+        local = np.zeros((len(self.subnet_ids), len(self.interfaces)), dtype=bool)
+        for index, subnet_id in enumerate(self.subnet_ids):
+            route_table = subnet_route_tables.get(subnet_id, main_route_table)
+            if route_table is None:
+                continue
+            routes = RouteTable(route_table.get("routes", []), self.prefix_lists)
+            for j, eni in enumerate(self.interfaces):
+                route = routes.lookup(eni["private_ip_address"])
+                local[index, j] = route is not None and route.get("gateway_id") == "local"
+        return local[self.subnet_index, :]
+
+    def eval_security_groups(self, egress):
+        # (sources, destinations, ports) allowed by the source egress rules when egress is True,
+        # by the destination ingress rules otherwise
+        groups = dict((group["group_id"], group) for group in self.security_groups)
+        rules = []
+        for group_id in self.group_ids:
+            if group_id not in groups:
+                self.fail_json(msg="Security group {0} not found".format(group_id))
+            permissions = groups[group_id].get("ip_permissions_egress" if egress else "ip_permissions") or []
+            for index, rule in enumerate(permissions):
+                rules.append(
+                    compile_security_group_rule(
+                        group_id, "egress" if egress else "ingress", index, rule, self.prefix_lists
+                    )
+                )
+
+        count = len(self.interfaces)
+        if not rules:
+            return np.zeros((count, count, len(self.ports)), dtype=bool)
+
+        # (groups, rules) rule ownership and group references
+        owner = np.zeros((len(self.group_ids), len(rules)), dtype=np.float32)
+        referenced = np.zeros((len(self.group_ids), len(rules)), dtype=np.float32)
+        # (rules, ports)
+        port_ok = np.zeros((len(rules), len(self.ports)), dtype=np.float32)
+        cidr_rule = []
+        cidr_from = []
+        cidr_to = []
+        for r, rule in enumerate(rules):
+            owner[self.group_positions[rule.group_id], r] = 1
+            for group_id in rule.group_ids:
+                if group_id in self.group_positions:
+                    referenced[self.group_positions[group_id], r] = 1
+            for p, port in enumerate(self.ports):
+                port_ok[r, p] = rule_allows_port(rule, port)
+            for version, first, last in rule.networks:
+                if version == 4:
+                    cidr_rule.append(r)
+                    cidr_from.append(first)
+                    cidr_to.append(last)
+
+        # (interfaces, rules) the interface is the remote end of the rule
+        remote = self.membership @ referenced
+        if cidr_rule:
+            cidr_rule = np.array(cidr_rule, dtype=np.int64)
+            inside = (self.ips[:, None] >= np.array(cidr_from, dtype=np.int64)[None, :]) & (
+                self.ips[:, None] <= np.array(cidr_to, dtype=np.int64)[None, :]
+            )
+            incidence = np.zeros((len(cidr_rule), len(rules)), dtype=np.float32)
+            incidence[np.arange(len(cidr_rule)), cidr_rule] = 1
+            remote = remote + inside.astype(np.float32) @ incidence
+        remote = (remote > 0).astype(np.float32)
+        # (interfaces, rules) the interface owns the rule
+        local = ((self.membership @ owner) > 0).astype(np.float32)
+
+        allowed = np.zeros((count, count, len(self.ports)), dtype=bool)
+        for p in range(len(self.ports)):
+            if egress:
+                allowed[:, :, p] = ((local * port_ok[:, p][None, :]) @ remote.T) > 0
+            else:
+                allowed[:, :, p] = (remote @ (local * port_ok[:, p][None, :]).T) > 0
+        return allowed
+
+    def eval_network_acls(self):
+        # (sources, destinations, ports) allowed by the source and destination subnets network ACLs
+        subnet_acls = {}
+        for acl in self.network_acls:
+            for subnet_id in acl.get("subnets", []):
+                subnet_acls[subnet_id] = acl
+
+        src_port_range = parse_port_range(self.src_port_range)
+        if src_port_range:
+            return_from = np.array([src_port_range[0]], dtype=np.int64)
+            return_to = np.array([src_port_range[1]], dtype=np.int64)
+        else:
+            # Without a source port range, only rules for all protocols match the return traffic
+            return_from = np.array([1], dtype=np.int64)
+            return_to = np.array([0], dtype=np.int64)
+
+        count = len(self.interfaces)
+        # (subnets, interfaces, ports) and (subnets, interfaces)
+        outbound = np.zeros((len(self.subnet_ids), count, len(self.ports)), dtype=bool)
+        outbound_return = np.zeros((len(self.subnet_ids), count), dtype=bool)
+        inbound = np.zeros((len(self.subnet_ids), count, len(self.ports)), dtype=bool)
+        inbound_return = np.zeros((len(self.subnet_ids), count), dtype=bool)
+        for index, subnet_id in enumerate(self.subnet_ids):
+            acl = subnet_acls.get(subnet_id)
+            if acl is None:
+                self.fail_json(msg="No network ACL found for subnet {0}".format(subnet_id))
+            egress_rules = parse_network_acl_entries(acl.get("egress", []))
+            ingress_rules = parse_network_acl_entries(acl.get("ingress", []))
+            outbound[index] = first_match_allows(egress_rules, self.ips, self.ips, self.port_numbers, self.port_numbers)
+            inbound[index] = first_match_allows(ingress_rules, self.ips, self.ips, self.port_numbers, self.port_numbers)
+            outbound_return[index] = first_match_allows(egress_rules, self.ips, self.ips, return_from, return_to)[:, 0]
+            inbound_return[index] = first_match_allows(ingress_rules, self.ips, self.ips, return_from, return_to)[:, 0]
+
+        src = self.subnet_index
+        allowed = (
+            outbound[src, :, :]
+            & inbound_return[src, :][:, :, None]
+            & inbound[src, :, :].transpose(1, 0, 2)
+            & outbound_return[src, :].T[:, :, None]
+        )
+        same_subnet = src[:, None] == src[None, :]
+        allowed[same_subnet] = True
+        return allowed
+
+    def execute_module(self):
+        try:
+            with phase("load"):
+                self.load_interfaces()
+            with phase("routes"):
+                routes = self.eval_routes()
+            with phase("security_groups"):
+                security_groups = self.eval_security_groups(egress=True) & self.eval_security_groups(egress=False)
+            with phase("network_acls"):
+                network_acls = self.eval_network_acls()
+            allowed = routes[:, :, None] & security_groups & network_acls
+            count = len(self.interfaces)
+            allowed[np.arange(count), np.arange(count), :] = False
+            total = count * (count - 1) * len(self.ports)
+            matrix = {}
+            for p, port in enumerate(self.ports):
+                matrix[str(port)] = ["".join("1" if value else "0" for value in row) for row in allowed[:, :, p]]
+
+            self.exit_json(
+                network_interfaces=self.interfaces,
+                matrix=matrix,
+                allowed=int(allowed.sum()),
+                denied=int(total - allowed.sum()),
+            )
+        except Exception as e:
+            self.fail_json(msg="Connectivity matrix evaluation failed: {0}".format(e))
+
+
+def main():
+    EvalConnectivityMatrix()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: eval_connectivity_regions
+short_description: Troubleshoot the same connectivity flows in several AWS regions concurrently
+description:
+  - Troubleshoot a list of flows in every region of a list, the same way as M(cloud.aws_troubleshooting.connectivity_troubleshooter).
+  - Regions are evaluated concurrently, the flows of a region are evaluated concurrently with a bounded number of workers.
+  - The resources described in a region are shared by all the flows of the region.
+  - Sources and destinations can be selected with network interface filters, so that the same flows apply to every region.
+  - Given the results of a previous run and the resources changed since, only the flows depending on a changed resource
+    are evaluated again, see O(previous_results).
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  regions:
+    description:
+    - The AWS regions to evaluate the flows in.
+    type: list
+    elements: str
+    required: true
+  flows:
+    description:
+    - The flows to evaluate in each region.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description:
+        - A name identifying the flow in the results.
+        type: str
+      source_ip:
+        description:
+        - The private IPv4 address or the IPv6 address of the source.
+        - Mutually exclusive with O(flows[].source_filters).
+        type: str
+      source_filters:
+        description:
+        - Filters selecting the source network interface, as supported by M(amazon.aws.ec2_eni_info).
+        - When several network interfaces match, the one with the lowest ID is used.
+        - Mutually exclusive with O(flows[].source_ip).
+        type: dict
+      source_vpc:
+        description:
+        - The VPC ID of the source.
+        type: str
+      source_port_range:
+        description:
+        - The port range used by the source for the return traffic.
+        type: str
+      destination_ip:
+        description:
+        - The IPv4 or IPv6 address of the destination.
+        - Mutually exclusive with O(flows[].destination_filters).
+        type: str
+      destination_filters:
+        description:
+        - Filters selecting the destination network interface, as supported by M(amazon.aws.ec2_eni_info).
+        - When several network interfaces match, the one with the lowest ID is used.
+        - Mutually exclusive with O(flows[].destination_ip).
+        type: dict
+      destination_port:
+        description:
+        - The destination port.
+        type: int
+        required: true
+      destination_vpc:
+        description:
+        - The VPC ID of the destination.
+        type: str
+  max_concurrent_regions:
+    description:
+    - The maximum number of regions evaluated at the same time.
+    type: int
+    default: 4
+  max_concurrent_requests:
+    description:
+    - The maximum number of flows evaluated at the same time in a region.
+    - Each flow makes its describe calls sequentially, this bounds the concurrent API requests per region.
+    type: int
+    default: 4
+  previous_results:
+    description:
+    - The RV(results) of a previous run.
+    - The previous result of a flow is returned again when the flow is unchanged and none of its RV(results[].dependencies)
+      is in O(changed_resources).
+    - Flows whose previous evaluation failed with an error are always evaluated again.
+    type: list
+    elements: dict
+    default: []
+  changed_resources:
+    description:
+    - The IDs of the security groups, network ACLs, route tables, network interfaces, NAT gateways, VPC peering
+      connections, transit gateways, transit gateway attachments, transit gateway route tables and managed prefix lists
+      changed since O(previous_results) were computed.
+    - The subnets associated with a changed route table or network ACL, the VPC of a changed main route table, and the
+      transit gateway of a changed transit gateway attachment or route table, are looked up so that new associations and
+      attachments are taken into account.
+    - Network interfaces created since the previous run for the source or destination of a flow are not detected.
+    type: list
+    elements: str
+    default: []
+extends_documentation_fragment:
+  - amazon.aws.common.modules
+  - amazon.aws.region.modules
+  - amazon.aws.boto3
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Check that the app tier reaches the database tier in every region
+  cloud.aws_troubleshooting.eval_connectivity_regions:
+    regions:
+      - us-east-1
+      - eu-west-1
+      - ap-southeast-2
+    flows:
+      - name: app-to-db
+        source_filters:
+          tag:Tier: app
+        destination_filters:
+          description: RDSNetworkInterface
+          tag:Tier: db
+        destination_port: 5432
+        source_port_range: "1024-65535"
+    max_concurrent_regions: 8
+  register: fleet
+
+- name: Show the denied flows
+  ansible.builtin.debug:
+    msg: "{{ fleet.results | rejectattr('status', 'equalto', 'allowed') }}"
+
+- name: Evaluate again the flows depending on an edited security group
+  cloud.aws_troubleshooting.eval_connectivity_regions:
+    regions:
+      - us-east-1
+      - eu-west-1
+      - ap-southeast-2
+    flows: "{{ fleet.results | map(attribute='flow') | unique }}"
+    previous_results: "{{ fleet.results }}"
+    changed_resources:
+      - sg-0f1c4bbd2f6c44b4b
+  register: fleet
+"""
+
+
+RETURN = r"""
+results:
+  type: list
+  elements: dict
+  description: The result of each flow in each region, ordered by region and flow.
+  returned: always
+  contains:
+    region:
+      type: str
+      description: The region of the flow.
+      sample: 'us-east-1'
+    name:
+      type: str
+      description: The name of the flow.
+      sample: 'app-to-db'
+    source_ip:
+      type: str
+      description: The source IP address, when it could be resolved.
+      sample: '10.0.1.15'
+    destination_ip:
+      type: str
+      description: The destination IP address, when it could be resolved.
+      sample: '10.0.2.30'
+    destination_port:
+      type: int
+      description: The destination port.
+      sample: 5432
+    status:
+      type: str
+      description:
+        - V(allowed) when the traffic is allowed, V(denied) when it is not.
+        - V(error) when the resources of the flow could not be described.
+      sample: 'allowed'
+    next_hop:
+      type: str
+      description: The next hop towards the destination.
+      returned: when the traffic is allowed
+      sample: 'local'
+    result:
+      type: list
+      elements: str
+      description: The evaluation messages.
+      returned: when the traffic is allowed
+      sample: ["Security Groups rules validation successful", "Network ACLs evaluation successful"]
+    msg:
+      type: str
+      description: Why the traffic is not allowed or the flow could not be evaluated.
+      returned: when the traffic is not allowed
+      sample: 'Egress rules on source do not allow traffic towards destination: 10.0.2.30 : 5432'
+    explanation:
+      type: list
+      elements: dict
+      description:
+        - What decided the verdict of each check of the flow, see the RV(explanation) of
+          M(cloud.aws_troubleshooting.connectivity_troubleshooter).
+      returned: when O(explain=true) and the flow was evaluated
+      sample: [{"check": "route", "destination_ip": "10.0.2.30", "scan_depth": 17,
+                "route": {"destination_cidr_block": "10.0.0.0/16", "next_hop": "local"}}]
+    flow:
+      type: dict
+      description: The flow definition, as given in O(flows).
+      sample: {"name": "app-to-db", "destination_port": 5432}
+    dependencies:
+      type: list
+      elements: str
+      description: The IDs of the resources, subnets, VPCs and transit gateways the evaluation of the flow depends on.
+      sample: ["eni-0b9da14cbd81d415c", "acl-0a8b7c6d5e4f3a2b1", "rtb-0c1d2e3f4a5b6c7d8", "sg-0f1c4bbd2f6c44b4b"]
+    reevaluated:
+      type: bool
+      description: Whether the flow was evaluated, or its result taken from O(previous_results).
+      sample: true
+summary:
+  type: dict
+  description: The number of allowed, denied and errored flows, keyed by region.
+  returned: always
+  sample: {"us-east-1": {"allowed": 1, "denied": 0, "error": 0}}
+reevaluated:
+  type: int
+  description: The number of flows evaluated, the other results were taken from O(previous_results).
+  returned: always
+  sample: 3
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(describe_calls), C(describe_cache_hits) or C(route_lookups).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_connectivity_regions
+    started: 1791331200.123
+    total_ms: 384.206
+    phases_ms:
+      describe: 382.537
+      eval_security_groups: 0.412
+      eval_network_acls: 0.527
+    counters:
+      describe_calls: 6
+      describe_cache_hits: 2
+      routes_indexed: 4
+      route_lookups: 2
+      cidrs_parsed: 12
+      security_group_rules_scanned: 4
+      network_acl_rules_scanned: 8
+"""
+
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
+from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    DependencyRecorder,
+    Troubleshooter,
+    expand_changed_resources,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_info import Describer
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
+
+FLOW_OPTIONS = dict(
+    name=dict(type="str"),
+    source_ip=dict(type="str"),
+    source_filters=dict(type="dict"),
+    source_vpc=dict(type="str"),
+    source_port_range=dict(type="str"),
+    destination_ip=dict(type="str"),
+    destination_filters=dict(type="dict"),
+    destination_port=dict(type="int", required=True),
+    destination_vpc=dict(type="str"),
+)
+
+
+def resolve_ip(describe, ip, filters, end):
+    # The IP address of the flow end, or of the first network interface matching its filters
+    if ip:
+        return ip
+    network_interfaces = describe("network_interfaces", filters)
+    if not network_interfaces:
+        raise ConnectivityError("No network interface matches the {0} filters".format(end))
+    return sorted(network_interfaces, key=lambda eni: eni["network_interface_id"])[0]["private_ip_address"]
+
+
+def flow_definition(flow):
+    # The flow options that are set, so that the definition can be given again in flows
+    return dict((key, value) for key, value in (flow or {}).items() if value is not None)
+
+
+def flow_key(region, flow):
+    return region, json.dumps(flow_definition(flow), sort_keys=True)
+
+
+def eval_flow(describe, region, flow, explain=False, prefix_lists=None):
+    describe = DependencyRecorder(describe)
+    result = dict(region=region, name=flow["name"], destination_port=flow["destination_port"])
+    explanation = [] if explain else None
+    if explanation is not None:
+        result["explanation"] = explanation
+    try:
+        params = dict(flow)
+        params["source_ip"] = result["source_ip"] = resolve_ip(
+            describe, flow["source_ip"], flow["source_filters"], "source"
+        )
+        params["destination_ip"] = result["destination_ip"] = resolve_ip(
+            describe, flow["destination_ip"], flow["destination_filters"], "destination"
+        )
+        next_hop, messages = Troubleshooter(describe, explanation, prefix_lists).troubleshoot(params)
+        result.update(status="allowed", next_hop=next_hop, result=messages)
+    except ConnectivityError as e:
+        result.update(status="denied", msg=str(e))
+    except AnsibleAWSError as e:
+        result.update(status="error", msg=str(e))
+    result.update(flow=flow_definition(flow), dependencies=sorted(describe.dependencies), reevaluated=True)
+    return result
+
+
+def eval_region(
+    client, region, flows, max_workers, previous_results, changed_resources, explain=False, prefix_lists=None
+):
+    describe = Describer(client)
+
+    # Previous results are kept unless they depend on a changed resource
+    previous = {}
+    if previous_results:
+        try:
+            changed = expand_changed_resources(describe, changed_resources)
+        except AnsibleAWSError:
+            changed = None
+        for result in previous_results:
+            if changed is None or result.get("status") not in ("allowed", "denied"):
+                continue
+            if not changed.intersection(result.get("dependencies") or []):
+                previous[flow_key(region, result.get("flow"))] = dict(result, reevaluated=False)
+
+    def evaluate(flow):
+        return previous.get(flow_key(region, flow)) or eval_flow(describe, region, flow, explain, prefix_lists)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(evaluate, flows))
+
+
+class EvalConnectivityRegions:
+    def __init__(self):
+        argument_spec = dict(
+            regions=dict(type="list", elements="str", required=True),
+            flows=dict(
+                type="list",
+                elements="dict",
+                required=True,
+                options=FLOW_OPTIONS,
+                mutually_exclusive=[["source_ip", "source_filters"], ["destination_ip", "destination_filters"]],
+                required_one_of=[["source_ip", "source_filters"], ["destination_ip", "destination_filters"]],
+            ),
+            max_concurrent_regions=dict(type="int", default=4),
+            max_concurrent_requests=dict(type="int", default=4),
+            previous_results=dict(type="list", elements="dict", default=[]),
+            changed_resources=dict(type="list", elements="str", default=[]),
+            explain=dict(type="bool", default=False),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        self.module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
+
+        for key in argument_spec:
+            setattr(self, key, self.module.params.get(key))
+
+        with module_timings(self.module):
+            self.execute_module()
+
+    def execute_module(self):
+        if self.max_concurrent_regions < 1 or self.max_concurrent_requests < 1:
+            self.module.fail_json(msg="max_concurrent_regions and max_concurrent_requests must be greater than 0")
+
+        regions = list(dict.fromkeys(self.regions))
+        # boto3 clients are thread safe, unlike their creation
+        clients = dict((region, self.module.client("ec2", region=region)) for region in regions)
+
+        previous_results = dict((region, []) for region in regions)
+        for result in self.previous_results:
+            if result.get("region") in previous_results:
+                previous_results[result["region"]].append(result)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrent_regions, len(regions) or 1)) as executor:
+            futures = [
+                executor.submit(
+                    eval_region,
+                    clients[region],
+                    region,
+                    self.flows,
+                    self.max_concurrent_requests,
+                    previous_results[region],
+                    self.changed_resources,
+                    self.explain,
+                    self.prefix_lists,
+                )
+                for region in regions
+            ]
+            results = [result for future in futures for result in future.result()]
+
+        summary = dict((region, dict(allowed=0, denied=0, error=0)) for region in regions)
+        for result in results:
+            summary[result["region"]][result["status"]] += 1
+
+        self.module.exit_json(
+            changed=False,
+            results=results,
+            summary=summary,
+            reevaluated=len([result for result in results if result["reevaluated"]]),
+        )
+
+
+def main():
+    EvalConnectivityRegions()
+
+
+if __name__ == "__main__":
+    main()
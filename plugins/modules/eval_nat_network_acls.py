@@ -56,6 +56,10 @@ options:
     type: list
     elements: dict
     required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
 """
 
 
@@ -110,12 +114,139 @@ result:
   description: Results from evaluating NAT network ACLS.
   returned: success
   sample: 'NAT Network ACLs evaluation successful'
+explanation:
+  description:
+    - What decided the verdict of each check, in evaluation order, the network ACL checks of the NAT gateway subnet
+      towards the destination then towards the source, and the route check of the NAT gateway subnet towards the
+      destination. The evaluation stops at the first check denying the traffic.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: The kind of check, C(network_acl) or C(route).
+      type: str
+    subnet_id:
+      description: The NAT gateway subnet, O(nat_subnet_id), for network ACL checks.
+      type: str
+    direction:
+      description: C(egress) or C(ingress), for network ACL checks.
+      type: str
+    remote_ip:
+      description: The IP address at the other end of the traffic, O(dst_ip) or O(src_ip), for network ACL checks.
+      type: str
+    ports:
+      description:
+        - The first and last port of the traffic, O(dst_port) twice for the request, O(src_port_range) for the return
+          traffic, for network ACL checks.
+        - C(null) for the return traffic without O(src_port_range), only entries for all protocols match it.
+      type: list
+      elements: int
+    allowed:
+      description: Whether the check allows the traffic, for network ACL checks.
+      type: bool
+    rule:
+      description:
+        - The first network ACL entry matching the traffic, C(null) when no entry matches, the traffic is then denied.
+      type: dict
+      contains:
+        rule_number:
+          description: The rule number of the entry.
+          type: int
+        protocol:
+          description: The protocol of the entry, C(all) for all protocols.
+          type: str
+        rule_action:
+          description: C(allow) or C(deny).
+          type: str
+        cidr_block:
+          description: The IPv4 or IPv6 CIDR block of the entry.
+          type: str
+        port_from:
+          description: The first port of the entry, C(null) for all protocols.
+          type: int
+        port_to:
+          description: The last port of the entry, C(null) for all protocols.
+          type: int
+    destination_ip:
+      description: The destination address looked up in O(routes), for route checks.
+      type: str
+    route:
+      description:
+        - The longest prefix match route, with its C(destination_cidr_block) and C(next_hop), C(null) if none.
+        - For a managed prefix list route, C(destination_cidr_block) is the matched CIDR of the prefix list
+          C(destination_prefix_list_id).
+      type: dict
+    scan_depth:
+      description: The number of entries scanned up to the match, or of route table trie nodes walked.
+      type: int
+  sample:
+    - check: network_acl
+      subnet_id: subnet-0d8ddbeaa790da839
+      direction: egress
+      remote_ip: 172.32.2.13
+      ports: [3389, 3389]
+      allowed: true
+      rule:
+        rule_number: 100
+        protocol: all
+        rule_action: allow
+        cidr_block: 0.0.0.0/0
+        port_from: null
+        port_to: null
+      scan_depth: 1
+    - check: route
+      destination_ip: 8.8.8.8
+      route:
+        destination_cidr_block: 0.0.0.0/0
+        next_hop: igw-0b9da14cbd81d415c
+      scan_depth: 1
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(network_acl_rules_scanned), C(cidrs_parsed) or C(route_lookups).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_nat_network_acls
+    started: 1791331200.123
+    total_ms: 0.402
+    phases_ms:
+      eval_nat_network_acls: 0.311
+    counters:
+      cidrs_parsed: 8
+      network_acl_rules_scanned: 6
+      routes_indexed: 3
+      route_lookups: 1
 """
 
 
-from ipaddress import ip_address, ip_network
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    eval_nat_network_acls,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
 
 
 class EvalNatNetworkAcls(AnsibleModule):
@@ -129,6 +260,9 @@ class EvalNatNetworkAcls(AnsibleModule):
             nat_subnet_id=dict(type="str", required=True),
             nat_network_acls=dict(type="list", elements="dict", required=True),
             routes=dict(type="list", elements="dict", required=True),
+            explain=dict(type="bool", default=False),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
         )
 
         super(EvalNatNetworkAcls, self).__init__(argument_spec=argument_spec)
@@ -136,211 +270,29 @@ class EvalNatNetworkAcls(AnsibleModule):
         for key in argument_spec:
             setattr(self, key, self.params.get(key))
 
-        self.execute_module()
-
-    def eval_nat_nacls(self):
-        src_ip = ip_address(self.src_ip)
-        dst_ip = ip_address(self.dst_ip)
-        dst_port = int(self.dst_port)
-        src_port_from = None
-        src_port_to = None
-        # entry list format
-        keys = [
-            "rule_number",
-            "protocol",
-            "rule_action",
-            "cidr_block",
-            "icmp_type",
-            "icmp_code",
-            "port_from",
-            "port_to",
-        ]
-        if self.src_port_range:
-            src_port_from = int(self.src_port_range.split("-")[0])
-            src_port_to = int(self.src_port_range.split("-")[1])
-
-        egress_acls = [acl["egress"] for acl in self.nat_network_acls if acl["egress"]][0]
-        ingress_acls = [acl["ingress"] for acl in self.nat_network_acls if acl["ingress"]][0]
-
-        def check_egress_towards_dst(acls, dst_ip, dst_port):
-            for item in acls:
-                acl = dict(zip(keys, item))
-                # Check ipv4 acl rule only
-                if acl.get("cidr_block"):
-                    # Check IP
-                    if dst_ip in ip_network(acl["cidr_block"], strict=False):
-                        # Check Port
-                        if (acl.get("protocol") == "all") or (
-                            dst_port
-                            in range(
-                                acl["port_from"],
-                                acl["port_to"] + 1,
-                            )
-                        ):
-                            # Check Action
-                            if acl["rule_action"] == "allow":
-                                break
-                            else:
-                                self.fail_json(
-                                    msg=f"NatGateway Subnet {self.src_subnet_id}\
-                                       Network Acl Egress Rules do not allow\
-                                       outbound traffic to destination: \
-                                       {self.dst_ip} : {str(dst_port)}"
-                                )
-
-            self.fail_json(
-                msg="NatGateway Subnet {0} Network Acl Egress Rules do not allow outbound traffic to destination: {1} : {2}".format(
-                    self.src_subnet_id, self.dst_ip, str(dst_port)
-                )
-            )
-
-        def check_ingress_from_dst(acls, src_ip):
-            for item in acls:
-                acl = dict(zip(keys, item))
-                # Check ipv4 acl rule only
-                if acl.get("cidr_block"):
-                    # Check IP
-                    if src_ip in ip_network(acl["cidr_block"], strict=False):
-                        # Check Port
-                        if (acl.get("protocol") == "all") or (
-                            src_port_from
-                            and src_port_to
-                            and set(range(src_port_from, src_port_to)).issubset(
-                                range(
-                                    acl["port_from"],
-                                    acl["port_to"] + 1,
-                                )
-                            )
-                        ):
-                            # Check Action
-                            if acl["rule_action"] == "allow":
-                                break
-                            else:
-                                self.fail_json(
-                                    msg=f"NatGateway Subnet {self.src_subnet_id} \
-                                        Network Acl Ingress Rules do not allow \
-                                        inbound traffic from destination: {self.dst_ip}"
-                                )
-
-            self.fail_json(
-                msg="NatGateway Subnet {0} Network Acl Ingress Rules do not allow inbound traffic from destination: {1}".format(
-                    self.src_subnet_id, self.dst_ip
-                )
-            )
-
-        def check_ingress_from_src(acls, src_ip, dst_port):
-            for item in acls:
-                acl = dict(zip(keys, item))
-                # Check ipv4 acl rule only
-                if acl.get("cidr_block"):
-                    # Check IP
-                    if src_ip in ip_network(acl["cidr_block"], strict=False):
-                        # Check Port
-                        if (acl.get("protocol") == "all") or (
-                            dst_port
-                            in range(
-                                acl["port_from"],
-                                acl["port_to"] + 1,
-                            )
-                        ):
-                            # Check Action
-                            if acl["rule_action"] == "allow":
-                                break
-                            else:
-                                self.fail_json(
-                                    msg="NatGateway Subnet Network Acl \
-                                          Ingress Rules do not allow inbound \
-                                          traffic from source: {0} towards destination port {1}".format(
-                                        self.src_ip, str(dst_port)
-                                    )
-                                )
-
-            self.fail_json(
-                msg="NatGateway Subnet Network Acl Ingress Rules do not allow inbound traffic from source {0} towards destination port {1}".format(
-                    self.src_ip, str(dst_port)
-                )
-            )
-
-        def check_egress_towards_src(acls, dst_ip):
-            for item in acls:
-                acl = dict(zip(keys, item))
-                # Check ipv4 acl rule only
-                if acl.get("cidr_block"):
-                    # Check IP
-                    if dst_ip in ip_network(acl["cidr_block"], strict=False):
-                        # Check Port
-                        if (acl.get("protocol") == "all") or (
-                            src_port_from
-                            and src_port_to
-                            and set(range(src_port_from, src_port_to)).issubset(
-                                range(
-                                    acl["port_from"],
-                                    acl["port_to"] + 1,
-                                )
-                            )
-                        ):
-                            # Check Action
-                            if acl["rule_action"] == "allow":
-                                break
-                            else:
-                                self.fail_json(
-                                    msg="NatGateway Subnet Network Acl Egress Rules do not allow outbound traffic to source: {0}".format(
-                                        self.src_ip
-                                    )
-                                )
-
-            self.fail_json(
-                msg=f"NatGateway Subnet Network Acl Egress Rules do not allow outbound traffic to source: {0}".format(
-                    self.src_ip
-                )
-            )
-
-        check_egress_towards_dst(egress_acls, dst_ip, dst_port)
-        check_ingress_from_dst(ingress_acls, dst_ip)
-
-        if self.src_subnet_id == self.nat_subnet_id:
-            return True
-
-        check_ingress_from_src(ingress_acls, src_ip, dst_port)
-        check_egress_towards_src(egress_acls, src_ip)
-
-        return True
-
-    def get_nat_next_hop(self):
-        destination = ip_address(self.dst_ip)
-        most_specific = -1
-        next_hop = None
-
-        if self.src_subnet_id == self.nat_subnet_id:
-            self.fail_json(
-                msg="NatGateway and Source cannot be placed in the same subnet, NatGateway should be in a public subnet"
-            )
-
-        for route in self.routes:
-            # Confirms whether the source has a public IP address associated with the resource, if the route destination is an internet gateway.
-            if route.get("destination_cidr_block"):
-                mask = int(route["destination_cidr_block"].split("/")[1])
-                if (
-                    "destination_prefix_list_id" not in str(route)
-                    and destination in ip_network(route["destination_cidr_block"], strict=False)
-                    and mask > most_specific
-                ):
-                    if route["state"] != "blackhole":
-                        most_specific = mask
-                        next_hop = route
-        # 0.0.0.0/0
-        if most_specific >= 0 and "igw-" in str(next_hop):
-            return True
-        self.fail_json(msg="No Internet Gateway route found for destination: {0}".format(self.dst_ip))
+        with module_timings(self):
+            self.execute_module()
 
     def execute_module(self):
+        explanation = [] if self.explain else None
+        details = {} if explanation is None else dict(explanation=explanation)
         try:
             # Evaluate ingress and egress NAT network ACLs
-            self.eval_nat_nacls()
-            self.get_nat_next_hop()
-            self.exit_json(result="NAT Network ACLs evaluation successful")
-        except Exception as e:
-            self.fail_json(msg="NAT Network ACLs evaluation failed: {0}".format(e))
+            result = eval_nat_network_acls(
+                self.src_ip,
+                self.src_subnet_id,
+                self.dst_ip,
+                self.dst_port,
+                self.nat_subnet_id,
+                self.nat_network_acls,
+                self.routes,
+                src_port_range=self.src_port_range,
+                prefix_lists=self.prefix_lists,
+                explanation=explanation,
+            )
+            self.exit_json(result=result, **details)
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **details)
 
 
 def main():
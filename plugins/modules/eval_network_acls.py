@@ -16,7 +16,7 @@ author:
 options:
   src_ip:
     description:
-    - The private IPv4 address of the AWS resource in your Amazon VPC you want to test connectivity from.
+    - The private IPv4 address or the IPv6 address of the AWS resource in your Amazon VPC you want to test connectivity from.
     type: str
     required: true
   src_subnet_id:
@@ -31,7 +31,7 @@ options:
     required: false
   dst_ip:
     description:
-    - The IPv4 address of the resource you want to connect to.
+    - The IPv4 or IPv6 address of the resource you want to connect to.
     type: str
     required: true
   dst_port:
@@ -56,6 +56,9 @@ options:
     type: list
     elements: dict
     required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.timings
 """
 
 
@@ -116,12 +119,121 @@ result:
   description: Results from evaluating ingress and egress network ACLs.
   returned: success
   sample: 'Network ACLs evaluation successful'
+explanation:
+  description:
+    - What decided the verdict of each network ACL check, in evaluation order, the source subnet egress and ingress
+      checks then the destination subnet ingress and egress checks. The evaluation stops at the first check denying
+      the traffic.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: The kind of check, always C(network_acl).
+      type: str
+    subnet_id:
+      description: The subnet whose network ACL is checked, O(src_subnet_id) or O(dst_subnet_id).
+      type: str
+    direction:
+      description: C(egress) or C(ingress).
+      type: str
+    remote_ip:
+      description: The IP address at the other end of the traffic, O(dst_ip) or O(src_ip).
+      type: str
+    ports:
+      description:
+        - The first and last port of the traffic, O(dst_port) twice for the request, O(src_port_range) for the return
+          traffic.
+        - C(null) for the return traffic without O(src_port_range), only entries for all protocols match it.
+      type: list
+      elements: int
+    allowed:
+      description: Whether the check allows the traffic.
+      type: bool
+    rule:
+      description:
+        - The first network ACL entry matching the traffic, C(null) when no entry matches, the traffic is then denied.
+      type: dict
+      contains:
+        rule_number:
+          description: The rule number of the entry.
+          type: int
+        protocol:
+          description: The protocol of the entry, C(all) for all protocols.
+          type: str
+        rule_action:
+          description: C(allow) or C(deny).
+          type: str
+        cidr_block:
+          description: The IPv4 or IPv6 CIDR block of the entry.
+          type: str
+        port_from:
+          description: The first port of the entry, C(null) for all protocols.
+          type: int
+        port_to:
+          description: The last port of the entry, C(null) for all protocols.
+          type: int
+    scan_depth:
+      description: The number of entries scanned up to the match.
+      type: int
+  sample:
+    - check: network_acl
+      subnet_id: subnet-0d8ddbeaa790da839
+      direction: egress
+      remote_ip: 172.32.2.13
+      ports: [3389, 3389]
+      allowed: true
+      rule:
+        rule_number: 100
+        protocol: all
+        rule_action: allow
+        cidr_block: 0.0.0.0/0
+        port_from: null
+        port_to: null
+      scan_depth: 1
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(network_acl_rules_scanned) or C(cidrs_parsed).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_network_acls
+    started: 1791331200.123
+    total_ms: 0.254
+    phases_ms:
+      eval_network_acls: 0.2
+    counters:
+      cidrs_parsed: 4
+      network_acl_rules_scanned: 4
 """
 
 
-from ipaddress import ip_address, ip_network
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    eval_network_acls,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
 
 
 class EvalNetworkAcls(AnsibleModule):
@@ -135,6 +247,8 @@ class EvalNetworkAcls(AnsibleModule):
             dst_port=dict(type="str", required=True),
             src_network_acls=dict(type="list", elements="dict", required=True),
             dst_network_acls=dict(type="list", elements="dict", required=True),
+            explain=dict(type="bool", default=False),
+            **TIMINGS_ARGUMENT_SPEC,
         )
 
         super(EvalNetworkAcls, self).__init__(argument_spec=argument_spec)
@@ -142,194 +256,28 @@ class EvalNetworkAcls(AnsibleModule):
         for key in argument_spec:
             setattr(self, key, self.params.get(key))
 
-        self.execute_module()
-
-    def eval_nacls(self):
-        src_port_from = None
-        src_port_to = None
-        # entry list format
-        keys = [
-            "rule_number",
-            "protocol",
-            "rule_action",
-            "cidr_block",
-            "icmp_type",
-            "icmp_code",
-            "port_from",
-            "port_to",
-        ]
-        if self.src_port_range:
-            src_port_from = int(self.src_port_range.split("-")[0])
-            src_port_to = int(self.src_port_range.split("-")[1])
-        src_ip = ip_address(self.src_ip)
-        dst_ip = ip_address(self.dst_ip)
-        dst_port = int(self.dst_port)
-
-        if self.src_subnet_id == self.dst_subnet_id:
-            return True
-
-        def eval_src_nacls(acls):
-            def check_egress_acls(acls, dst_ip, dst_port):
-                for item in acls:
-                    acl = dict(zip(keys, item))
-                    # Check ipv4 acl rule only
-                    if acl.get("cidr_block"):
-                        # Check IP
-                        if dst_ip in ip_network(acl["cidr_block"], strict=False):
-                            # Check Port
-                            if (acl.get("protocol") == "all") or (
-                                dst_port
-                                in range(
-                                    acl["port_from"],
-                                    acl["port_to"] + 1,
-                                )
-                            ):
-                                # Check Action
-                                if acl["rule_action"] == "allow":
-                                    return True
-                                else:
-                                    self.fail_json(
-                                        msg=f"Source Subnet Network Acl Egress Rules do not allow outbound traffic to destination: {0} : {1}".format(
-                                            self.dst_ip, str(dst_port)
-                                        )
-                                    )
-
-                self.fail_json(
-                    msg="Source Subnet Network Acl Egress Rules do not allow outbound traffic to destination: {0} : {1}".format(
-                        self.dst_ip, str(dst_port)
-                    )
-                )
-
-            def check_ingress_acls(acls, src_ip):
-                for item in acls:
-                    acl = dict(zip(keys, item))
-                    # Check ipv4 acl rule only
-                    if acl.get("cidr_block"):
-                        # Check IP
-                        if src_ip in ip_network(acl["cidr_block"], strict=False):
-                            # Check Port
-                            if (acl.get("protocol") == "all") or (
-                                src_port_from
-                                and src_port_to
-                                and set(range(src_port_from, src_port_to)).issubset(
-                                    range(
-                                        acl["port_from"],
-                                        acl["port_to"] + 1,
-                                    )
-                                )
-                            ):
-                                # Check Action
-                                if acl["rule_action"] == "allow":
-                                    return True
-                                else:
-                                    self.fail_json(
-                                        msg="Source Subnet Network Acl Ingress Rules do not allow inbound traffic from destination: {0}".format(
-                                            self.dst_ip
-                                        )
-                                    )
-
-                self.fail_json(
-                    msg="Source Subnet Network Acl Ingress Rules do not allow inbound traffic from destination: {0}".format(
-                        self.dst_ip
-                    )
-                )
-
-            egress_acls = [acl["egress"] for acl in acls if acl["egress"]][0]
-            ingress_acls = [acl["ingress"] for acl in acls if acl["ingress"]][0]
-
-            src_egress_check_pass = check_egress_acls(egress_acls, dst_ip, dst_port)
-            src_ingress_check_pass = check_ingress_acls(ingress_acls, dst_ip)
-
-            if src_ingress_check_pass and src_egress_check_pass:
-                return True
-
-        def eval_dst_nacls(acls):
-            def check_egress_acls(acls, dst_ip):
-                for item in acls:
-                    acl = dict(zip(keys, item))
-                    # Check ipv4 acl rule only
-                    if acl.get("cidr_block"):
-                        # Check IP
-                        if dst_ip in ip_network(acl["cidr_block"], strict=False):
-                            # Check Port
-                            if (acl.get("protocol") == "all") or (
-                                src_port_from
-                                and src_port_to
-                                and set(range(src_port_from, src_port_to)).issubset(
-                                    range(
-                                        acl["port_from"],
-                                        acl["port_to"] + 1,
-                                    )
-                                )
-                            ):
-                                # Check Action
-                                if acl["rule_action"] == "allow":
-                                    break
-                                else:
-                                    self.fail_json(
-                                        msg="Destination Subnet Network Acl Egress Rules do not allow outbound traffic to source: {0}".format(
-                                            self.src_ip
-                                        )
-                                    )
-                self.fail_json(
-                    msg="Destination Subnet Network Acl Egress Rules do not allow outbound traffic to source: {0}".format(
-                        self.src_ip
-                    )
-                )
-
-            def check_ingress_acls(acls, src_ip, dst_port):
-                for item in acls:
-                    acl = dict(zip(keys, item))
-                    # Check ipv4 acl rule only
-                    if acl.get("cidr_block"):
-                        # Check IP
-                        if src_ip in ip_network(acl["cidr_block"], strict=False):
-                            # Check Port
-                            if (acl.get("protocol") == "all") or (
-                                dst_port
-                                in range(
-                                    acl["port_from"],
-                                    acl["port_to"] + 1,
-                                )
-                            ):
-                                # Check Action
-                                if acl["rule_action"] == "allow":
-                                    return True
-                                else:
-                                    self.fail_json(
-                                        msg="Destination Subnet Network Acl Ingress Rules do not allow inbound traffic from source: {0} \
-                                            towards destination port {1}".format(
-                                            self.src_ip, str(self.dst_port)
-                                        )
-                                    )
-
-                self.fail_json(
-                    msg="Destination Subnet Network Acl Ingress Rules do not allow inbound traffic from source: {0} towards destination port {1}".format(
-                        self.src_ip, str(self.dst_port)
-                    )
-                )
-
-            egress_acls = [acl["egress"] for acl in acls if acl["egress"]][0]
-            ingress_acls = [acl["ingress"] for acl in acls if acl["ingress"]][0]
-
-            dst_ingress_check_pass = check_ingress_acls(ingress_acls, src_ip, dst_port)
-            dst_egress_check_pass = check_egress_acls(egress_acls, src_ip)
-
-            if dst_ingress_check_pass and dst_egress_check_pass:
-                return True
-
-        eval_src_nacls(self.src_network_acls)
-        eval_dst_nacls(self.dst_network_acls)
-
-        return True
+        with module_timings(self):
+            self.execute_module()
 
     def execute_module(self):
+        explanation = [] if self.explain else None
+        details = {} if explanation is None else dict(explanation=explanation)
         try:
             # Evaluate Ingress and Egress network ACLs
-            self.eval_nacls()
-            self.exit_json(result="Network ACLs evaluation successful")
-        except Exception as e:
-            self.fail_json(msg="Network ACLs evaluation failed: {0}".format(e))
+            result = eval_network_acls(
+                self.src_ip,
+                self.src_subnet_id,
+                self.dst_ip,
+                self.dst_subnet_id,
+                self.dst_port,
+                self.src_network_acls,
+                self.dst_network_acls,
+                src_port_range=self.src_port_range,
+                explanation=explanation,
+            )
+            self.exit_json(result=result, **details)
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **details)
 
 
 def main():
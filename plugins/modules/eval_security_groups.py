@@ -12,12 +12,14 @@ short_description: Evaluate ingress and egress security group rules
 description:
   - Evaluates ingress and egress security group rules.
   - Confirms whether the security group rules allow the needed traffic between the source and destination resources.
+  - An egress or ingress rule allows the traffic when it covers the port and either the remote address or one of the remote
+    security groups.
 author:
   - Alina Buzachis (@alinabuzachis)
 options:
   src_ip:
     description:
-    - The private IPv4 address of the AWS resource in your Amazon VPC you want to test connectivity from.
+    - The private IPv4 address or the IPv6 address of the AWS resource in your Amazon VPC you want to test connectivity from.
     type: str
     required: true
   src_security_groups:
@@ -28,7 +30,7 @@ options:
     required: true
   dst_ip:
     description:
-    - The IPv4 address of the resource you want to connect to.
+    - The IPv4 or IPv6 address of the resource you want to connect to.
     type: str
     required: true
   dst_port:
@@ -48,6 +50,10 @@ options:
     type: list
     elements: dict
     required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
 """
 
 
@@ -118,12 +124,156 @@ result:
   description: Results from evaluating ingress and egress security group rules.
   returned: success
   sample: 'Security Groups rules evaluation successful'
+explanation:
+  description:
+    - What decided the verdict of the source egress check and of the destination ingress check, in this order. The
+      evaluation stops at the first check denying the traffic.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: The kind of check, always C(security_group).
+      type: str
+    security_groups:
+      description: The security groups whose rules are checked, O(src_security_groups) or O(dst_security_groups).
+      type: list
+      elements: str
+    direction:
+      description: C(egress) for the source check, C(ingress) for the destination check.
+      type: str
+    remote_ip:
+      description: The IP address at the other end of the traffic, O(dst_ip) or O(src_ip).
+      type: str
+    remote_security_groups:
+      description: The security groups at the other end of the traffic, that rules may reference.
+      type: list
+      elements: str
+    port:
+      description: The destination port.
+      type: int
+    allowed:
+      description: Whether the check allows the traffic.
+      type: bool
+    rule:
+      description:
+        - The first security group rule allowing the traffic, C(null) when no rule does, the traffic is then denied.
+      type: dict
+      contains:
+        group_id:
+          description: The security group of the rule.
+          type: str
+        direction:
+          description: C(egress) or C(ingress).
+          type: str
+        index:
+          description: The index of the rule in the egress or ingress rules of the group.
+          type: int
+        ip_protocol:
+          description: The protocol of the rule, C(-1) for all protocols.
+          type: str
+        from_port:
+          description: The first port of the rule, C(null) for all protocols.
+          type: int
+        to_port:
+          description: The last port of the rule, C(null) for all protocols.
+          type: int
+        referenced_group_id:
+          description: The security group of the other end referenced by the rule.
+          type: str
+          returned: when the rule matches by security group reference
+        cidr_ip:
+          description: The IPv4 CIDR block of the rule containing the remote address.
+          type: str
+          returned: when the rule matches an IPv4 address
+        cidr_ipv6:
+          description: The IPv6 CIDR block of the rule containing the remote address.
+          type: str
+          returned: when the rule matches an IPv6 address
+        prefix_list_id:
+          description: The managed prefix list the matched CIDR block belongs to.
+          type: str
+          returned: when the rule matches through a managed prefix list
+    scan_depth:
+      description: The number of rules scanned up to the match.
+      type: int
+  sample:
+    - check: security_group
+      security_groups: [sg-0a1b2c3d4e5f60718]
+      direction: egress
+      remote_ip: 10.0.2.30
+      remote_security_groups: [sg-0f9e8d7c6b5a49382]
+      port: 5432
+      allowed: true
+      rule:
+        group_id: sg-0a1b2c3d4e5f60718
+        direction: egress
+        index: 0
+        ip_protocol: "-1"
+        from_port: null
+        to_port: null
+        cidr_ip: 0.0.0.0/0
+      scan_depth: 1
+    - check: security_group
+      security_groups: [sg-0f9e8d7c6b5a49382]
+      direction: ingress
+      remote_ip: 10.0.1.15
+      remote_security_groups: [sg-0a1b2c3d4e5f60718]
+      port: 5432
+      allowed: true
+      rule:
+        group_id: sg-0f9e8d7c6b5a49382
+        direction: ingress
+        index: 2
+        ip_protocol: tcp
+        from_port: 5432
+        to_port: 5432
+        referenced_group_id: sg-0a1b2c3d4e5f60718
+      scan_depth: 3
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(security_group_rules_scanned) or C(cidrs_parsed).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_security_groups
+    started: 1791331200.123
+    total_ms: 0.201
+    phases_ms:
+      eval_security_groups: 0.15
+    counters:
+      cidrs_parsed: 2
+      security_group_rules_scanned: 2
 """
 
 
-from ipaddress import ip_address, ip_network
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    eval_security_groups,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
 
 
 class EvalSecurityGroups(AnsibleModule):
@@ -135,6 +285,9 @@ class EvalSecurityGroups(AnsibleModule):
             dst_port=dict(type="int", required=True),
             dst_security_groups=dict(type="list", elements="str", required=True),
             security_groups=dict(type="list", elements="dict", required=True),
+            explain=dict(type="bool", default=False),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
         )
 
         super(EvalSecurityGroups, self).__init__(argument_spec=argument_spec)
@@ -142,89 +295,27 @@ class EvalSecurityGroups(AnsibleModule):
         for key in argument_spec:
             setattr(self, key, self.params.get(key))
 
-        self.execute_module()
-
-    def eval_sg_rules(self):
-        src_ip = ip_address(self.src_ip)
-        dst_ip = ip_address(self.dst_ip)
-        dst_port = int(self.dst_port)
-
-        def eval_src_egress_rules():
-            for src_security_group in self.src_security_groups:
-                sg = [group for group in self.security_groups if group["group_id"] == src_security_group][0]
-                for rule in sg["ip_permissions_egress"]:
-                    if (
-                        (rule.get("ip_protocol") == "-1")
-                        or (rule.get("from_port") == -1 and rule.get("to_port") == -1)
-                        or (dst_port in range(rule.get("from_port"), rule.get("to_port") + 1))
-                    ):
-                        for cidr in rule["ip_ranges"]:
-                            if dst_ip in ip_network(cidr["cidr_ip"], strict=False):
-                                return True
-                        for group in rule["user_id_group_pairs"]:
-                            if any(sg in group["group_id"] for sg in self.dst_security_groups):
-                                return True
-            self.fail_json(
-                msg="Egress rules on source do not allow traffic towards destination: {0} : {1}".format(
-                    self.dst_ip, str(dst_port)
-                )
-            )
-
-        def eval_dst_ingress_rules():
-            for dst_security_group in self.dst_security_groups:
-                sg = [group for group in self.security_groups if group["group_id"] == dst_security_group][0]
-                for rule in sg["ip_permissions"]:
-                    if (
-                        (rule.get("ip_protocol") == "-1")
-                        or (rule.get("from_port") == -1 and rule.get("to_port") == -1)
-                        or (dst_port in range(rule.get("from_port"), rule.get("to_port") + 1))
-                    ):
-                        for cidr in rule["ip_ranges"]:
-                            if src_ip in ip_network(cidr["cidr_ip"], strict=False):
-                                return True
-                        for group in rule["user_id_group_pairs"]:
-                            if any(sg in group["group_id"] for sg in self.src_security_groups):
-                                return True
-            self.fail_json(
-                msg="Ingress rules on destination do not allow traffic from source: {0} towards destination port {1}".format(
-                    self.src_ip, str(dst_port)
-                )
-            )
-
-        eval_src_egress_rules()
-        eval_dst_ingress_rules()
-
-        return True
-
-    def check_src_egress_rules(self):
-        dst_ip = ip_address(self.dst_ip)
-        dst_port = int(self.dst_port)
-
-        for sg_id in self.src_security_groups:
-            sg = [group for group in self.security_groups if group["group_id"] == sg_id][0]
-            for rule in sg["ip_permissions_egress"]:
-                if (
-                    (rule.get("ip_protocol") == "-1")
-                    or (rule.get("from_port") == -1 and rule.get("to_port") == -1)
-                    or (dst_port in range(rule.get("from_port"), rule.get("to_port") + 1))
-                ):
-                    for cidr in rule["ip_ranges"]:
-                        if dst_ip in ip_network(cidr["cidr_ip"], strict=False):
-                            return True
-        self.fail_json(
-            msg="Egress rules on source do not allow traffic towards destination: {0} : {1}".format(
-                self.dst_ip, str(dst_port)
-            )
-        )
+        with module_timings(self):
+            self.execute_module()
 
     def execute_module(self):
+        explanation = [] if self.explain else None
+        details = {} if explanation is None else dict(explanation=explanation)
         try:
             # Evaluate Ingress and Egress security groups rules
-            self.check_src_egress_rules()
-            self.eval_sg_rules()
-            self.exit_json(result="Security Groups rules validation successful")
-        except Exception as e:
-            self.fail_json(msg="Security Groups rules validation failed: {0}".format(e))
+            result = eval_security_groups(
+                self.security_groups,
+                self.src_ip,
+                self.src_security_groups,
+                self.dst_ip,
+                self.dst_port,
+                self.dst_security_groups,
+                prefix_lists=self.prefix_lists,
+                explanation=explanation,
+            )
+            self.exit_json(result=result, **details)
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **details)
 
 
 def main():
@@ -12,6 +12,7 @@ short_description: Evaluate source IP, security groups and network ACLs
 description:
   - Evaluate source IP, security groups and network ACLs.
   - Confirms whether the source has a public IP address associated with the resource, if the route destination is an internet gateway.
+  - For an IPv6 source, confirms whether the IPv6 address is assigned to the source network interface instead.
   - Confirms whether the security group rules allow the needed traffic from the source to the destination resource.
   - Confirms whether the network ACLs allow the needed traffic from the source resource.
 author:
@@ -19,7 +20,7 @@ author:
 options:
   src_ip:
     description:
-    - The private IPv4 address of the AWS resource in your Amazon VPC you want to test connectivity from.
+    - The private IPv4 address or the IPv6 address of the AWS resource in your Amazon VPC you want to test connectivity from.
     type: str
     required: true
   src_subnet_id:
@@ -34,7 +35,7 @@ options:
     required: false
   dst_ip:
     description:
-    - The IPv4 address of the resource you want to connect to.
+    - The IPv4 or IPv6 address of the resource you want to connect to.
     type: str
     required: true
   dst_port:
@@ -59,6 +60,10 @@ options:
     type: list
     elements: dict
     required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
 """
 
 
@@ -176,12 +181,123 @@ result:
   description: Results from evaluating source IP, security groups and network ACLs.
   returned: success
   sample: 'Source evaluation successful'
+explanation:
+  description:
+    - What decided the verdict of each check, in evaluation order. The evaluation stops at the first check denying the
+      traffic.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: The kind of check, one of C(security_group), C(network_acl) and C(route).
+      type: str
+    direction:
+      description: C(egress) or C(ingress), for security group and network ACL checks.
+      type: str
+    subnet_id:
+      description: The subnet whose network ACL is checked.
+      type: str
+    security_groups:
+      description: The security groups checked.
+      type: list
+      elements: str
+    remote_ip:
+      description: The IP address at the other end of the traffic.
+      type: str
+    remote_security_groups:
+      description: The security groups at the other end of the traffic, that rules may reference.
+      type: list
+      elements: str
+    port:
+      description: The destination port, for security group checks.
+      type: int
+    ports:
+      description: The first and last port of the traffic, for network ACL checks.
+      type: list
+      elements: int
+    allowed:
+      description: Whether the check allows the traffic.
+      type: bool
+    rule:
+      description:
+        - The first security group rule allowing the traffic, with the C(cidr_ip), C(cidr_ipv6) or the
+          C(referenced_group_id) it matched and its C(index) in the rules of the group, or the first matching network ACL entry.
+        - C(prefix_list_id) is the managed prefix list the matched C(cidr_ip) belongs to, if any.
+        - C(null) when no rule matches, the traffic is then denied.
+      type: dict
+    destination_ip:
+      description: The address looked up in the route table, for route checks.
+      type: str
+    route:
+      description:
+        - The longest prefix match route, with its C(destination_cidr_block) and C(next_hop), C(null) if none.
+        - For a managed prefix list route, C(destination_cidr_block) is the matched CIDR of the prefix list
+          C(destination_prefix_list_id).
+      type: dict
+    scan_depth:
+      description: The number of rules scanned up to the match, or of route table trie nodes walked.
+      type: int
+  sample:
+    - check: network_acl
+      subnet_id: subnet-0d8ddbeaa790da839
+      direction: egress
+      remote_ip: 172.32.2.13
+      ports: [3389, 3389]
+      allowed: true
+      rule:
+        rule_number: 100
+        protocol: all
+        rule_action: allow
+        cidr_block: 0.0.0.0/0
+        port_from: 0
+        port_to: 65535
+      scan_depth: 1
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(security_group_rules_scanned) or C(network_acl_rules_scanned).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_src_igw_route
+    started: 1791331200.123
+    total_ms: 0.347
+    phases_ms:
+      eval_src_igw_route: 0.284
+    counters:
+      cidrs_parsed: 6
+      security_group_rules_scanned: 1
+      network_acl_rules_scanned: 2
 """
 
 
-from ipaddress import ip_address, ip_network
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    eval_src_igw_route,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
 
 
 class EvalSrcIgwRoute(AnsibleModule):
@@ -195,6 +311,9 @@ class EvalSrcIgwRoute(AnsibleModule):
             src_subnet_id=dict(type="str", required=True),
             src_security_groups_info=dict(type="list", elements="dict", required=True),
             src_network_acls=dict(type="list", elements="dict", required=True),
+            explain=dict(type="bool", default=False),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
         )
 
         super(EvalSrcIgwRoute, self).__init__(argument_spec=argument_spec)
@@ -202,142 +321,28 @@ class EvalSrcIgwRoute(AnsibleModule):
         for key in argument_spec:
             setattr(self, key, self.params.get(key))
 
-        self.execute_module()
-
-    def eval_src_public_ip(self):
-        private_ips = self.src_network_interface["private_ip_addresses"]
-
-        for private_ip in private_ips:
-            if private_ip["private_ip_address"] == self.src_ip:
-                if "public_ip" in str(private_ip):
-                    return True
-
-        self.fail_json(msg="A public IP or Elastic IP is required at source to connect to a public destination")
-
-    def eval_src_egress_rule(self):
-        dst_ip = ip_address(self.dst_ip)
-        dst_port = int(self.dst_port)
-
-        for sg in self.src_security_groups_info:
-            for rule in sg["ip_permissions_egress"]:
-                if (
-                    (rule.get("ip_protocol") == "-1")
-                    or (rule.get("from_port") == -1 and rule.get("to_port") == -1)
-                    or (dst_port in range(rule.get("from_port"), rule.get("to_port") + 1))
-                ):
-                    for cidr in rule["ip_ranges"]:
-                        if dst_ip in ip_network(cidr["cidr_ip"], strict=False):
-                            return True
-        self.fail_json(
-            msg="Egress rules on source do not allow traffic towards destination: {0} : {1}".format(
-                self.dst_ip, str(dst_port)
-            )
-        )
-
-    def eval_src_nacls(self):
-        def check_egress_acls(acls, dst_ip, dst_port):
-            for item in acls:
-                acl = dict(zip(keys, item))
-                # Check ipv4 acl rule only
-                if acl.get("cidr_block"):
-                    # Check IP
-                    if dst_ip in ip_network(acl["cidr_block"], strict=False):
-                        # Check Port
-                        if (acl.get("protocol") == "all") or (
-                            dst_port
-                            in range(
-                                acl["port_from"],
-                                acl["port_to"] + 1,
-                            )
-                        ):
-                            # Check Action
-                            if acl["rule_action"] == "allow":
-                                return True
-                            else:
-                                self.fail_json(
-                                    msg="Source Subnet {0} Network Acl Egress Rules do not allow outbound traffic to destination: {1} : {2}".format(
-                                        self.src_subnet_id,
-                                        self.dst_ip,
-                                        str(self.dst_port),
-                                    )
-                                )
-            self.fail_json(
-                msg="Source Subnet {0} Network Acl Egress Rules do not allow outbound traffic to destination: {1} : {2}".format(
-                    self.src_subnet_id, self.dst_ip, str(self.dst_port)
-                )
-            )
-
-        def check_ingress_acls(acls, src_ip):
-            for item in acls:
-                acl = dict(zip(keys, item))
-                # Check ipv4 acl rule only
-                if acl.get("cidr_block"):
-                    # Check IP
-                    if src_ip in ip_network(acl["cidr_block"], strict=False):
-                        # Check Port
-                        if (acl.get("protocol") == "all") or (
-                            src_port_from
-                            and src_port_to
-                            and set(range(src_port_from, src_port_to)).issubset(
-                                range(
-                                    acl["port_from"],
-                                    acl["port_to"] + 1,
-                                )
-                            )
-                        ):
-                            # Check Action
-                            if acl["rule_action"] == "allow":
-                                return True
-                            else:
-                                self.fail_json(
-                                    msg="Source Subnet {0} Network Acl Ingress Rules do not allow inbound traffic from destination: {1}".format(
-                                        self.src_subnet_id, self.dst_ip
-                                    )
-                                )
-            self.fail_json(
-                msg="Source Subnet {0} Network Acl Ingress Rules do not allow inbound traffic from destination: {1}".format(
-                    self.src_subnet_id, self.dst_ip
-                )
-            )
-
-        dst_ip = ip_address(self.dst_ip)
-        dst_port = int(self.dst_port)
-        src_port_from = None
-        src_port_to = None
-        if self.src_port_range:
-            src_port_from = int(self.src_port_range.split("-")[0])
-            src_port_to = int(self.src_port_range.split("-")[1])
-        # entry list format
-        keys = [
-            "rule_number",
-            "protocol",
-            "rule_action",
-            "cidr_block",
-            "icmp_type",
-            "icmp_code",
-            "port_from",
-            "port_to",
-        ]
-
-        egress_acls = [acl["egress"] for acl in self.src_network_acls if acl["egress"]][0]
-        ingress_acls = [acl["ingress"] for acl in self.src_network_acls if acl["ingress"]][0]
-
-        src_egress_check_pass = check_egress_acls(egress_acls, dst_ip, dst_port)
-        src_ingress_check_pass = check_ingress_acls(ingress_acls, dst_ip)
-
-        if src_ingress_check_pass and src_egress_check_pass:
-            return True
-
-        self.fail_json(msg="Network ACLs do not allow traffic")
+        with module_timings(self):
+            self.execute_module()
 
     def execute_module(self):
+        explanation = [] if self.explain else None
+        details = {} if explanation is None else dict(explanation=explanation)
         try:
-            self.eval_src_public_ip()
-            self.eval_src_egress_rule()
-            self.eval_src_nacls()
-            self.exit_json(result="Source evaluation successful")
-        except Exception as e:
-            self.fail_json(msg="Source evaluation failed: {0}".format(e))
+            result = eval_src_igw_route(
+                self.src_ip,
+                self.src_network_interface,
+                self.src_subnet_id,
+                self.dst_ip,
+                self.dst_port,
+                self.src_security_groups_info,
+                self.src_network_acls,
+                src_port_range=self.src_port_range,
+                prefix_lists=self.prefix_lists,
+                explanation=explanation,
+            )
+            self.exit_json(result=result, **details)
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **details)
 
 
 def main():
@@ -0,0 +1,441 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: eval_subnet_reachability
+short_description: Build a subnet to subnet reachability index
+description:
+  - Evaluate route tables, VPC peering connections and network ACLs once for every (source subnet, destination subnet, port)
+    combination and return the result as reachability matrices, one per port.
+  - A subnet reaches another one when the route tables of both subnets have a C(local) route towards the other subnet in the
+    same VPC, or a route through the same active VPC peering connection between their VPCs.
+  - Network ACLs are evaluated the same way as M(cloud.aws_troubleshooting.eval_network_acls), for every address of the
+    subnets. A subnet block is allowed when the first rule matching any of its addresses allows it and contains the whole block.
+  - Traffic inside a subnet is always reachable.
+  - Only IPv4 is evaluated, the subnets are matched by their IPv4 CIDR block, and IPv6 routes and network ACL entries
+    never match.
+  - Questions are answered with O(queries), each one is a lookup in the precomputed matrices.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+requirements:
+  - numpy
+options:
+  subnets:
+    description:
+    - The subnets to index, as returned by M(amazon.aws.ec2_vpc_subnet_info).
+    type: list
+    elements: dict
+    required: true
+  ports:
+    description:
+    - The destination port numbers to evaluate.
+    type: list
+    elements: int
+    required: true
+  src_port_range:
+    description:
+    - The port range used by the source resources for the return traffic.
+    type: str
+    required: false
+  network_acls:
+    description:
+    - Network ACLs of the subnets, as returned by M(amazon.aws.ec2_vpc_nacl_info).
+    type: list
+    elements: dict
+    required: true
+  route_tables:
+    description:
+    - Route tables of the subnets VPCs, as returned by M(amazon.aws.ec2_vpc_route_table_info).
+    - Subnets without an explicit association use the main route table of their VPC.
+    type: list
+    elements: dict
+    required: true
+  vpc_peering_connections:
+    description:
+    - VPC peering connections between the subnets VPCs, as returned by M(amazon.aws.ec2_vpc_peering_info).
+    - Only active peering connections are used.
+    type: list
+    elements: dict
+    default: []
+  transitive:
+    description:
+    - Also compute the transitive closure of the reachability matrices.
+    - VPC peering connections do not forward traffic transitively, the closure tells which subnets can be reached through
+      relays such as proxies or bastion hosts in intermediate subnets.
+    type: bool
+    default: false
+  queries:
+    description:
+    - Reachability questions to answer from the index.
+    type: list
+    elements: dict
+    default: []
+    suboptions:
+      source_subnet:
+        description:
+        - The source subnet ID.
+        type: str
+        required: true
+      destination_subnet:
+        description:
+        - The destination subnet ID.
+        type: str
+        required: true
+      port:
+        description:
+        - The destination port, one of O(ports).
+        type: int
+        required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Build the reachability index of two peered VPCs
+  cloud.aws_troubleshooting.eval_subnet_reachability:
+    subnets: "{{ vpc_subnets.subnets }}"
+    ports:
+      - 443
+      - 5432
+    src_port_range: "1024-65535"
+    network_acls: "{{ vpc_nacls.nacls }}"
+    route_tables: "{{ vpc_route_tables.route_tables }}"
+    vpc_peering_connections: "{{ vpc_peers.vpc_peering_connections }}"
+    transitive: true
+    queries:
+      - source_subnet: subnet-0d1ad4e9a8ebb5a63
+        destination_subnet: subnet-0b6e2a0c42b0a4d1f
+        port: 5432
+  register: reachability
+"""
+
+
+RETURN = r"""
+subnets:
+  type: list
+  elements: str
+  description: The indexed subnet IDs, in the order used for the matrix rows and columns.
+  returned: success
+  sample: ["subnet-0d1ad4e9a8ebb5a63", "subnet-0b6e2a0c42b0a4d1f"]
+matrix:
+  type: dict
+  description:
+    - Reachability keyed by destination port.
+    - Each port maps to one string per source subnet, the character at index j is C(1) when the destination subnet j
+      is reachable and C(0) otherwise.
+  returned: success
+  sample: {"443": ["11", "01"]}
+closure:
+  type: dict
+  description: The transitive closure of O(matrix), in the same format.
+  returned: when O(transitive=true)
+  sample: {"443": ["11", "01"]}
+answers:
+  type: list
+  elements: dict
+  description: The answers to O(queries), in the same order.
+  returned: success
+  contains:
+    source_subnet:
+      type: str
+      description: The source subnet ID.
+      sample: 'subnet-0d1ad4e9a8ebb5a63'
+    destination_subnet:
+      type: str
+      description: The destination subnet ID.
+      sample: 'subnet-0b6e2a0c42b0a4d1f'
+    port:
+      type: int
+      description: The destination port.
+      sample: 5432
+    reachable:
+      type: bool
+      description: Whether the destination subnet is reachable from the source subnet.
+      sample: true
+    reachable_through_relays:
+      type: bool
+      description: Whether the destination subnet is reachable in the transitive closure.
+      returned: when O(transitive=true)
+      sample: true
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(routes_indexed), C(route_lookups) or C(cidrs_parsed).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_subnet_reachability
+    started: 1791331200.123
+    total_ms: 2.411
+    phases_ms:
+      load: 0.159
+      routes: 0.67
+      network_acls: 1.427
+      closure: 0.102
+    counters:
+      routes_indexed: 9
+      route_lookups: 32
+      cidrs_parsed: 23
+"""
+
+
+from ipaddress import ip_address, ip_network
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_acls import (
+    first_match_allows,
+    parse_network_acl_entries,
+    parse_port_range,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.route_table import (
+    RouteTable,
+    get_route_target,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+    phase,
+)
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def transitive_closure(reachable):
+    # Repeated squaring of the boolean adjacency matrix, log2(n) products at most
+    closure = reachable.copy()
+    while True:
+        extended = closure | ((closure.astype(np.int32) @ closure.astype(np.int32)) > 0)
+        if (extended == closure).all():
+            return closure
+        closure = extended
+
+
+class EvalSubnetReachability(AnsibleModule):
+    def __init__(self):
+        argument_spec = dict(
+            subnets=dict(type="list", elements="dict", required=True),
+            ports=dict(type="list", elements="int", required=True),
+            src_port_range=dict(type="str", required=False),
+            network_acls=dict(type="list", elements="dict", required=True),
+            route_tables=dict(type="list", elements="dict", required=True),
+            vpc_peering_connections=dict(type="list", elements="dict", default=[]),
+            transitive=dict(type="bool", default=False),
+            queries=dict(
+                type="list",
+                elements="dict",
+                default=[],
+                options=dict(
+                    source_subnet=dict(type="str", required=True),
+                    destination_subnet=dict(type="str", required=True),
+                    port=dict(type="int", required=True),
+                ),
+            ),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        super(EvalSubnetReachability, self).__init__(argument_spec=argument_spec)
+
+        if not HAS_NUMPY:
+            self.fail_json(msg=missing_required_lib("numpy"))
+
+        for key in argument_spec:
+            setattr(self, key, self.params.get(key))
+
+        with module_timings(self):
+            self.execute_module()
+
+    def load_subnets(self):
+        self.subnet_ids = []
+        self.vpc_ids = []
+        block_from = []
+        block_to = []
+        for subnet in self.subnets:
+            network = ip_network(subnet["cidr_block"])
+            self.subnet_ids.append(subnet.get("id") or subnet["subnet_id"])
+            self.vpc_ids.append(subnet["vpc_id"])
+            block_from.append(int(network.network_address))
+            block_to.append(int(network.broadcast_address))
+        self.block_from = np.array(block_from, dtype=np.int64)
+        self.block_to = np.array(block_to, dtype=np.int64)
+        self.subnet_positions = dict((subnet_id, index) for index, subnet_id in enumerate(self.subnet_ids))
+        self.port_positions = dict((port, index) for index, port in enumerate(self.ports))
+
+    def route_targets(self):
+        # (sources, destinations) target of the source subnet route towards every address of the destination subnet,
+        # None when the addresses of the destination subnet are not routed the same way
+        main_route_tables = {}
+        subnet_route_tables = {}
+        for route_table in self.route_tables:
+            for association in route_table.get("associations", []):
+                if association.get("main"):
+                    main_route_tables[route_table.get("vpc_id")] = route_table
+                elif association.get("subnet_id"):
+                    subnet_route_tables[association["subnet_id"]] = route_table
+
+        count = len(self.subnet_ids)
+        targets = [[None] * count for _ in range(count)]
+        for i, subnet_id in enumerate(self.subnet_ids):
+            route_table = subnet_route_tables.get(subnet_id, main_route_tables.get(self.vpc_ids[i]))
+            if route_table is None:
+                continue
+            routes = RouteTable(route_table.get("routes", []), self.prefix_lists)
+            for j in range(count):
+                first = routes.lookup(str(ip_address(int(self.block_from[j]))))
+                last = routes.lookup(str(ip_address(int(self.block_to[j]))))
+                if first is not None and last is not None and get_route_target(first) == get_route_target(last):
+                    targets[i][j] = get_route_target(first)
+        return targets
+
+    def eval_routes(self):
+        # (sources, destinations) the forward and return routes both exist
+        peerings = {}
+        for peering in self.vpc_peering_connections:
+            if (peering.get("status") or {}).get("code") != "active":
+                continue
+            vpcs = frozenset([peering["accepter_vpc_info"].get("vpc_id"), peering["requester_vpc_info"].get("vpc_id")])
+            peerings[peering["vpc_peering_connection_id"]] = vpcs
+
+        targets = self.route_targets()
+        count = len(self.subnet_ids)
+        routed = np.zeros((count, count), dtype=bool)
+        for i in range(count):
+            for j in range(count):
+                target = targets[i][j]
+                if target is None or target != targets[j][i]:
+                    continue
+                if target == "local":
+                    routed[i, j] = self.vpc_ids[i] == self.vpc_ids[j]
+                elif target in peerings:
+                    routed[i, j] = peerings[target] == frozenset([self.vpc_ids[i], self.vpc_ids[j]])
+        return routed
+
+    def eval_network_acls(self):
+        # (sources, destinations, ports) allowed by the source and destination subnets network ACLs
+        subnet_acls = {}
+        for acl in self.network_acls:
+            for subnet_id in acl.get("subnets", []):
+                subnet_acls[subnet_id] = acl
+
+        src_port_range = parse_port_range(self.src_port_range)
+        if src_port_range:
+            return_from = np.array([src_port_range[0]], dtype=np.int64)
+            return_to = np.array([src_port_range[1]], dtype=np.int64)
+        else:
+            # Without a source port range, only rules for all protocols match the return traffic
+            return_from = np.array([1], dtype=np.int64)
+            return_to = np.array([0], dtype=np.int64)
+        ports = np.array(self.ports, dtype=np.int64)
+
+        count = len(self.subnet_ids)
+        # (subnets, peer subnets, ports) and (subnets, peer subnets)
+        outbound = np.zeros((count, count, len(self.ports)), dtype=bool)
+        outbound_return = np.zeros((count, count), dtype=bool)
+        inbound = np.zeros((count, count, len(self.ports)), dtype=bool)
+        inbound_return = np.zeros((count, count), dtype=bool)
+        for index, subnet_id in enumerate(self.subnet_ids):
+            acl = subnet_acls.get(subnet_id)
+            if acl is None:
+                self.fail_json(msg="No network ACL found for subnet {0}".format(subnet_id))
+            egress_rules = parse_network_acl_entries(acl.get("egress", []))
+            ingress_rules = parse_network_acl_entries(acl.get("ingress", []))
+            outbound[index] = first_match_allows(egress_rules, self.block_from, self.block_to, ports, ports)
+            inbound[index] = first_match_allows(ingress_rules, self.block_from, self.block_to, ports, ports)
+            outbound_return[index] = first_match_allows(
+                egress_rules, self.block_from, self.block_to, return_from, return_to
+            )[:, 0]
+            inbound_return[index] = first_match_allows(
+                ingress_rules, self.block_from, self.block_to, return_from, return_to
+            )[:, 0]
+
+        return outbound & inbound_return[:, :, None] & inbound.transpose(1, 0, 2) & outbound_return.T[:, :, None]
+
+    def to_strings(self, reachable):
+        return dict(
+            (str(port), ["".join("1" if value else "0" for value in row) for row in reachable[:, :, p]])
+            for p, port in enumerate(self.ports)
+        )
+
+    def answer(self, query, reachable, closure):
+        for key, positions in (
+            ("source_subnet", self.subnet_positions),
+            ("destination_subnet", self.subnet_positions),
+            ("port", self.port_positions),
+        ):
+            if query[key] not in positions:
+                self.fail_json(msg="{0} {1} is not indexed".format(key, query[key]))
+        index = (
+            self.subnet_positions[query["source_subnet"]],
+            self.subnet_positions[query["destination_subnet"]],
+            self.port_positions[query["port"]],
+        )
+        result = dict(query, reachable=bool(reachable[index]))
+        if closure is not None:
+            result["reachable_through_relays"] = bool(closure[index])
+        return result
+
+    def execute_module(self):
+        try:
+            with phase("load"):
+                self.load_subnets()
+            with phase("routes"):
+                routes = self.eval_routes()
+            with phase("network_acls"):
+                network_acls = self.eval_network_acls()
+            reachable = routes[:, :, None] & network_acls
+            count = len(self.subnet_ids)
+            reachable[np.arange(count), np.arange(count), :] = True
+
+            closure = None
+            if self.transitive:
+                with phase("closure"):
+                    closure = np.stack([transitive_closure(reachable[:, :, p]) for p in range(len(self.ports))], axis=2)
+
+            result = dict(
+                subnets=self.subnet_ids,
+                matrix=self.to_strings(reachable),
+                answers=[self.answer(query, reachable, closure) for query in self.queries],
+            )
+            if closure is not None:
+                result["closure"] = self.to_strings(closure)
+            self.exit_json(**result)
+        except Exception as e:
+            self.fail_json(msg="Subnet reachability evaluation failed: {0}".format(e))
+
+
+def main():
+    EvalSubnetReachability()
+
+
+if __name__ == "__main__":
+    main()
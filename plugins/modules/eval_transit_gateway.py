@@ -0,0 +1,257 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: eval_transit_gateway
+short_description: Evaluate the transit gateway path between Source and Destination
+description:
+  - Evaluate the transit gateway path between Source and Destination VPCs.
+  - Confirms whether the source VPC has an available attachment to the transit gateway.
+  - Confirms whether the transit gateway route table associated with the source attachment routes the destination to the
+    attachment of the destination VPC, and is not a blackhole route.
+  - Confirms whether the transit gateway route table associated with the destination attachment routes the source back
+    to the source attachment.
+  - Confirms whether the destination subnet route table routes the source back through the transit gateway.
+  - The longest prefix match index of each transit gateway route table is built once per described route table.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  src_ip:
+    description:
+    - The private IPv4 address or the IPv6 address of the AWS resource in your Amazon VPC you want to test connectivity from.
+    type: str
+    required: true
+  src_vpc_id:
+    description:
+    - The ID of the source VPC.
+    type: str
+    required: true
+  dst_ip:
+    description:
+    - The IPv4 or IPv6 address of the resource you want to connect to.
+    type: str
+    required: true
+  dst_vpc_id:
+    description:
+    - The ID of the destination VPC.
+    type: str
+    required: true
+  transit_gateway_id:
+    description:
+    - The ID of the transit gateway, the next hop of the source subnet route table.
+    type: str
+    required: true
+  attachments:
+    description:
+    - The VPC attachments of the transit gateway, as returned by M(amazon.aws.ec2_transit_gateway_vpc_attachment_info).
+    type: list
+    elements: dict
+    required: true
+  route_tables:
+    description:
+    - The route tables of the transit gateway, as returned by M(cloud.aws_troubleshooting.transit_gateway_route_table_info).
+    type: list
+    elements: dict
+    required: true
+  dst_routes:
+    description:
+    - The routes of the destination subnet route table.
+    type: list
+    elements: dict
+    required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Evaluate the transit gateway path
+  cloud.aws_troubleshooting.eval_transit_gateway:
+    src_ip: "10.1.0.9"
+    src_vpc_id: "vpc-0e50f118140008d0c"
+    dst_ip: "10.2.0.12"
+    dst_vpc_id: "vpc-09620d5e5c8622e06"
+    transit_gateway_id: "tgw-0c4ab6e9fe6a1b1a2"
+    attachments:
+      - transit_gateway_attachment_id: "tgw-attach-0d1ad4e9a8ebb5a63"
+        transit_gateway_id: "tgw-0c4ab6e9fe6a1b1a2"
+        vpc_id: "vpc-0e50f118140008d0c"
+        state: "available"
+      - transit_gateway_attachment_id: "tgw-attach-07c4e1a3b5d2f6e8a"
+        transit_gateway_id: "tgw-0c4ab6e9fe6a1b1a2"
+        vpc_id: "vpc-09620d5e5c8622e06"
+        state: "available"
+    route_tables:
+      - transit_gateway_route_table_id: "tgw-rtb-0a2b6e1c4d8f9e7a1"
+        associations:
+          - transit_gateway_attachment_id: "tgw-attach-0d1ad4e9a8ebb5a63"
+          - transit_gateway_attachment_id: "tgw-attach-07c4e1a3b5d2f6e8a"
+        routes:
+          - destination_cidr_block: "10.1.0.0/16"
+            state: "active"
+            type: "propagated"
+            transit_gateway_attachments:
+              - resource_id: "vpc-0e50f118140008d0c"
+                resource_type: "vpc"
+                transit_gateway_attachment_id: "tgw-attach-0d1ad4e9a8ebb5a63"
+          - destination_cidr_block: "10.2.0.0/16"
+            state: "active"
+            type: "propagated"
+            transit_gateway_attachments:
+              - resource_id: "vpc-09620d5e5c8622e06"
+                resource_type: "vpc"
+                transit_gateway_attachment_id: "tgw-attach-07c4e1a3b5d2f6e8a"
+    dst_routes:
+      - destination_cidr_block: "10.2.0.0/16"
+        gateway_id: "local"
+      - destination_cidr_block: "10.0.0.0/8"
+        transit_gateway_id: "tgw-0c4ab6e9fe6a1b1a2"
+"""
+
+
+RETURN = r"""
+result:
+  type: str
+  description: Results from evaluating the transit gateway path.
+  returned: success
+  sample: 'Transit gateway evaluation successful'
+explanation:
+  description:
+    - What decided the verdict of each check, in evaluation order. The evaluation stops at the first check denying the
+      traffic.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: The kind of check, C(transit_gateway_route) or C(route) for the destination subnet route table.
+      type: str
+    transit_gateway_route_table_id:
+      description: The transit gateway route table looked up, for transit gateway route checks.
+      type: str
+    destination_ip:
+      description: The address looked up in the route table.
+      type: str
+    route:
+      description:
+        - The longest prefix match route, with its C(destination_cidr_block) and C(next_hop), C(null) if none.
+        - The next hop of a transit gateway route is its attachment, C(null) for a blackhole route.
+        - For a managed prefix list route, C(destination_cidr_block) is the matched CIDR of the prefix list
+          C(destination_prefix_list_id).
+      type: dict
+    scan_depth:
+      description: The number of route table trie nodes walked.
+      type: int
+  sample:
+    - check: transit_gateway_route
+      transit_gateway_route_table_id: tgw-rtb-0a2b6e1c4d8f9e7a1
+      destination_ip: 10.2.0.12
+      route:
+        destination_cidr_block: 10.2.0.0/16
+        next_hop: tgw-attach-07c4e1a3b5d2f6e8a
+      scan_depth: 17
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(routes_indexed) or C(route_lookups).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_transit_gateway
+    started: 1791331200.123
+    total_ms: 1.254
+    phases_ms:
+      transit_gateway_index: 0.873
+    counters:
+      routes_indexed: 2
+      route_lookups: 3
+"""
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    eval_transit_gateway,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
+
+
+class EvalTransitGateway(AnsibleModule):
+    def __init__(self):
+        argument_spec = dict(
+            src_ip=dict(type="str", required=True),
+            src_vpc_id=dict(type="str", required=True),
+            dst_ip=dict(type="str", required=True),
+            dst_vpc_id=dict(type="str", required=True),
+            transit_gateway_id=dict(type="str", required=True),
+            attachments=dict(type="list", elements="dict", required=True),
+            route_tables=dict(type="list", elements="dict", required=True),
+            dst_routes=dict(type="list", elements="dict", required=True),
+            explain=dict(type="bool", default=False),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        super(EvalTransitGateway, self).__init__(argument_spec=argument_spec)
+
+        for key in argument_spec:
+            setattr(self, key, self.params.get(key))
+
+        with module_timings(self):
+            self.execute_module()
+
+    def execute_module(self):
+        explanation = [] if self.explain else None
+        details = {} if explanation is None else dict(explanation=explanation)
+        try:
+            result = eval_transit_gateway(
+                self.src_ip,
+                self.src_vpc_id,
+                self.dst_ip,
+                self.dst_vpc_id,
+                self.transit_gateway_id,
+                self.attachments,
+                self.route_tables,
+                self.dst_routes,
+                prefix_lists=self.prefix_lists,
+                explanation=explanation,
+            )
+            self.exit_json(result=result, **details)
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **details)
+
+
+def main():
+    EvalTransitGateway()
+
+
+if __name__ == "__main__":
+    main()
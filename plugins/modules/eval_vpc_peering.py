@@ -18,7 +18,7 @@ author:
 options:
     src_ip:
         description:
-        - The private IPv4 address of the AWS resource in your Amazon VPC you want to test connectivity from.
+        - The private IPv4 address or the IPv6 address of the AWS resource in your Amazon VPC you want to test connectivity from.
         type: str
         required: true
     dst_vpc:
@@ -42,6 +42,10 @@ options:
         type: list
         elements: dict
         required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
 """
 
 
@@ -104,12 +108,80 @@ result:
     description: Results from evaluating VPC peering.
     returned: success
     sample: 'VPC peering evaluation successful'
+explanation:
+  description:
+    - The route check of the destination subnet route table towards the source.
+    - Empty when the peering connection is rejected before the route is looked up.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: The kind of check, always C(route).
+      type: str
+    destination_ip:
+      description: The source address looked up in O(routes).
+      type: str
+    route:
+      description:
+        - The longest prefix match route, with its C(destination_cidr_block) and C(next_hop), C(null) if none.
+        - For a managed prefix list route, C(destination_cidr_block) is the matched CIDR of the prefix list
+          C(destination_prefix_list_id).
+      type: dict
+    scan_depth:
+      description: The number of route table trie nodes walked by the lookup.
+      type: int
+  sample:
+    - check: route
+      destination_ip: 10.0.1.15
+      route:
+        destination_cidr_block: 10.0.0.0/16
+        next_hop: pcx-0f0cbaf2c3e5f4b1a
+      scan_depth: 17
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(routes_indexed) or C(route_lookups).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.eval_vpc_peering
+    started: 1791331200.123
+    total_ms: 0.137
+    phases_ms:
+      eval_vpc_peering: 0.093
+    counters:
+      routes_indexed: 3
+      route_lookups: 1
 """
 
 
-from ipaddress import ip_address, ip_network
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    eval_vpc_peering,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
 
 
 class EvalVpcPeering(AnsibleModule):
@@ -120,6 +192,9 @@ class EvalVpcPeering(AnsibleModule):
             peering_id=dict(type="str", required=True),
             routes=dict(type="list", elements="dict", required=True),
             vpc_peering_connection=dict(type="dict", required=True),
+            explain=dict(type="bool", default=False),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
         )
 
         super(EvalVpcPeering, self).__init__(argument_spec=argument_spec)
@@ -127,58 +202,25 @@ class EvalVpcPeering(AnsibleModule):
         for key in argument_spec:
             setattr(self, key, self.params.get(key))
 
-        self.execute_module()
-
-    def check_vpc_peering_connection(self):
-        if (
-            self.vpc_peering_connection["accepter_vpc_info"]["region"]
-            == self.vpc_peering_connection["requester_vpc_info"]["region"]
-        ):
-            pass
-        else:
-            self.fail_json(msg="Troubleshooting Cross Region peering connection is not yet supported")
-        if self.dst_vpc and self.dst_vpc != "":
-            if self.dst_vpc in str(self.peering_info):
-                pass
-            else:
-                self.fail_json(
-                    msg="Kindly check the VPC peering route in route table at the source resource subnet, it does not match the expected destination VPC"
-                )
-
-        return True
-
-    def eval_peer_route_table(self):
-        src_ip = ip_address(self.src_ip)
-        most_specific = -1
-        next_hop = {}
-
-        for route in self.routes:
-            if route.get("destination_cidr_block"):
-                mask = int(route["destination_cidr_block"].split("/")[1])
-                if (
-                    "destination_prefix_list_id" not in str(route)
-                    and src_ip in ip_network(route["destination_cidr_block"], strict=False)
-                    and mask > most_specific
-                ):
-                    if route["state"] != "blackhole":
-                        most_specific = mask
-                        next_hop = route
-        if next_hop.get("vpc_peering_connection_id") == self.peering_id:
-            return True
-        else:
-            self.fail_json(
-                msg="Destination Subnet route table does not contain a valid peering route for source: {0}".format(
-                    self.scr_ip
-                )
-            )
+        with module_timings(self):
+            self.execute_module()
 
     def execute_module(self):
+        explanation = [] if self.explain else None
+        details = {} if explanation is None else dict(explanation=explanation)
         try:
-            self.check_vpc_peering_connection()
-            self.eval_peer_route_table()
-            self.exit_json(result="VPC peering evaluation successful")
-        except Exception as e:
-            self.fail_json(msg="VPC peering evaluation failed: {0}".format(e))
+            result = eval_vpc_peering(
+                self.src_ip,
+                self.peering_id,
+                self.routes,
+                self.vpc_peering_connection,
+                dst_vpc=self.dst_vpc,
+                prefix_lists=self.prefix_lists,
+                explanation=explanation,
+            )
+            self.exit_json(result=result, **details)
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **details)
 
 
 def main():
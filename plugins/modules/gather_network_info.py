@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: gather_network_info
+short_description: Gather the network configuration of AWS resources concurrently
+description:
+  - Describe the subnets, network ACLs, security groups, subnet route tables and main route tables of AWS resources.
+  - The describe calls are independent, they run concurrently with paginated results.
+  - Resources are returned in the same format as the amazon.aws information modules.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  subnet_ids:
+    description:
+    - The IDs of the subnets to describe with their network ACLs and route tables.
+    type: list
+    elements: str
+    default: []
+  security_group_ids:
+    description:
+    - The IDs of the security groups to describe.
+    type: list
+    elements: str
+    default: []
+  vpc_id:
+    description:
+    - The ID of the VPC whose main route table is described.
+    type: str
+extends_documentation_fragment:
+  - amazon.aws.common.modules
+  - amazon.aws.region.modules
+  - amazon.aws.boto3
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Gather the network configuration of an EC2 instance
+  cloud.aws_troubleshooting.gather_network_info:
+    subnet_ids:
+      - subnet-0d1ad4e9a8ebb5a63
+    security_group_ids:
+      - sg-0f1c4bbd2f6c44b4b
+    vpc_id: vpc-0e50f118140008d0c
+  register: ec2_network
+"""
+
+
+RETURN = r"""
+subnets:
+  description: The subnets, as returned by M(amazon.aws.ec2_vpc_subnet_info).
+  returned: always
+  type: list
+  elements: dict
+nacls:
+  description: The network ACLs associated with the subnets, as returned by M(amazon.aws.ec2_vpc_nacl_info).
+  returned: always
+  type: list
+  elements: dict
+security_groups:
+  description: The security groups, as returned by M(amazon.aws.ec2_security_group_info).
+  returned: always
+  type: list
+  elements: dict
+route_tables:
+  description: The route tables associated with the subnets, as returned by M(amazon.aws.ec2_vpc_route_table_info).
+  returned: always
+  type: list
+  elements: dict
+vpc_route_tables:
+  description: The main route table of the VPC, as returned by M(amazon.aws.ec2_vpc_route_table_info).
+  returned: always
+  type: list
+  elements: dict
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(describe_calls) or C(transit_gateway_route_searches).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.gather_network_info
+    started: 1791331200.123
+    total_ms: 102.716
+    phases_ms:
+      describe: 102.125
+    counters:
+      describe_calls: 5
+      describe_cache_hits: 1
+"""
+
+
+from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
+from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_info import gather_network_info
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
+
+
+class GatherNetworkInfo:
+    def __init__(self):
+        argument_spec = dict(
+            subnet_ids=dict(type="list", elements="str", default=[]),
+            security_group_ids=dict(type="list", elements="str", default=[]),
+            vpc_id=dict(type="str"),
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        self.module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
+
+        for key in argument_spec:
+            setattr(self, key, self.module.params.get(key))
+
+        with module_timings(self.module):
+            self.execute_module()
+
+    def execute_module(self):
+        client = self.module.client("ec2")
+        try:
+            result = gather_network_info(
+                client,
+                subnet_ids=self.subnet_ids,
+                security_group_ids=self.security_group_ids,
+                vpc_id=self.vpc_id,
+            )
+        except AnsibleAWSError as e:
+            self.module.fail_json_aws_error(e)
+        self.module.exit_json(changed=False, **result)
+
+
+def main():
+    GatherNetworkInfo()
+
+
+if __name__ == "__main__":
+    main()
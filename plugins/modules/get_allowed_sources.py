@@ -0,0 +1,212 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: get_allowed_sources
+short_description: Return the sources allowed to reach a destination port
+description:
+  - Answer the reverse of the question of M(cloud.aws_troubleshooting.validate_security_group_rules) and
+    M(cloud.aws_troubleshooting.validate_network_acls), which sources can reach a destination, e.g. an RDS instance, on
+    a port.
+  - The ingress rules of the destination security groups, the ingress entries of the destination network ACLs and the
+    routes of the destination route tables are each scanned once and inverted into address ranges, candidate sources are
+    not enumerated.
+  - A source CIDR is allowed when a security group rule allows it, every network ACL allows it and every route table has a
+    route back to it.
+  - The members of the security groups referenced by the security group rules are allowed too, the network ACLs and route
+    tables must then allow their addresses. O(network_interfaces) are resolved against both.
+  - The network ACL rules for the return traffic and the egress rules of the sources are not evaluated.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  dest_port:
+    description:
+    - Destination Endpoint Port.
+    type: int
+    required: true
+  protocol:
+    description:
+    - Protocol of the traffic.
+    type: str
+    default: tcp
+  dest_security_groups:
+    description:
+    - Destination Security Groups, as returned by M(amazon.aws.ec2_security_group_info).
+    type: list
+    elements: dict
+    required: true
+  dest_network_acl_rules:
+    description:
+    - Network ACLs of the destination subnets, as returned by M(amazon.aws.ec2_vpc_nacl_info).
+    - A source must be allowed by all of them, whichever subnet the destination is in.
+    type: list
+    elements: dict
+    default: []
+  dest_route_tables:
+    description:
+    - Route tables of the destination subnets, as returned by M(amazon.aws.ec2_vpc_route_table_info).
+    - A source must be routed back by all of them, whichever subnet the destination is in.
+    type: list
+    elements: dict
+    default: []
+  network_interfaces:
+    description:
+    - Network interfaces to resolve, as returned by M(amazon.aws.ec2_eni_info).
+    - A network interface is allowed when one of its addresses is in an allowed CIDR, or when it is a member of a
+      referenced security group and the network ACLs and route tables allow its address.
+    type: list
+    elements: dict
+    default: []
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: List the sources allowed to reach an RDS instance on port 5432
+  cloud.aws_troubleshooting.get_allowed_sources:
+    dest_port: 5432
+    dest_security_groups: "{{ rds_security_groups.security_groups }}"
+    dest_network_acl_rules: "{{ rds_network_acls.nacls }}"
+    dest_route_tables: "{{ rds_route_tables.route_tables }}"
+    network_interfaces: "{{ vpc_network_interfaces.network_interfaces }}"
+  register: allowed_sources
+"""
+
+
+RETURN = r"""
+cidrs:
+  description:
+    - The source CIDRs allowed, as the smallest list of CIDRs covering them, IPv4 ones first.
+  type: list
+  elements: str
+  returned: success
+  sample:
+    - 10.1.0.0/23
+    - 10.1.4.0/24
+security_group_ids:
+  description:
+    - The security groups referenced by the destination security group rules, their members are allowed when the network
+      ACLs and route tables allow their addresses.
+  type: list
+  elements: str
+  returned: success
+  sample:
+    - sg-0bd2d9a14af8a8998
+network_interfaces:
+  description: The network interfaces of O(network_interfaces) allowed, one item per allowed address.
+  type: list
+  elements: dict
+  returned: success
+  contains:
+    network_interface_id:
+      description: The ID of the network interface.
+      type: str
+    ip_address:
+      description: The allowed address of the network interface.
+      type: str
+    allowed_by:
+      description:
+        - C(cidr) when a security group rule allows the address, C(security_group) when it allows a group of the network
+          interface.
+      type: str
+  sample:
+    - network_interface_id: eni-0d1ad4e9a8ebb5a63
+      ip_address: 10.1.0.9
+      allowed_by: security_group
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(security_group_rules_scanned) or C(network_acl_rules_scanned).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.get_allowed_sources
+    started: 1791331200.123
+    total_ms: 1.254
+    phases_ms:
+      security_group_sources: 0.412
+      network_acl_sources: 0.203
+      route_sources: 0.118
+    counters:
+      security_group_rules_scanned: 12
+      network_acl_rules_scanned: 5
+      routes_examined: 3
+"""
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.allowed_sources import allowed_sources
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
+
+
+class GetAllowedSources(AnsibleModule):
+    def __init__(self):
+        argument_spec = dict(
+            dest_port=dict(type="int", required=True),
+            protocol=dict(type="str", default="tcp"),
+            dest_security_groups=dict(type="list", elements="dict", required=True),
+            dest_network_acl_rules=dict(type="list", elements="dict", default=[]),
+            dest_route_tables=dict(type="list", elements="dict", default=[]),
+            network_interfaces=dict(type="list", elements="dict", default=[]),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        super(GetAllowedSources, self).__init__(argument_spec=argument_spec, supports_check_mode=True)
+
+        for key in argument_spec:
+            setattr(self, key, self.params.get(key))
+
+        with module_timings(self):
+            self.execute_module()
+
+    def execute_module(self):
+        try:
+            result = allowed_sources(
+                self.dest_security_groups,
+                self.dest_port,
+                network_acls=self.dest_network_acl_rules,
+                route_tables=self.dest_route_tables,
+                network_interfaces=self.network_interfaces,
+                protocol=self.protocol,
+                prefix_lists=self.prefix_lists,
+            )
+        except (KeyError, ValueError) as e:
+            self.fail_json(msg="Failed to compute the allowed sources: {0}".format(e))
+        self.exit_json(**result)
+
+
+def main():
+    GetAllowedSources()
+
+
+if __name__ == "__main__":
+    main()
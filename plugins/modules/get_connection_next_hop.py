@@ -17,15 +17,27 @@ author:
 options:
   dst_ip:
     description:
-    - The IPv4 address of the resource you want to connect to.
+    - The IPv4 or IPv6 address of the resource you want to connect to.
+    - Mutually exclusive with C(dst_ips), one of them is required.
     type: str
-    required: true
+  dst_ips:
+    description:
+    - A list of IPv4 or IPv6 addresses to resolve the next hop for, against the same C(routes).
+    - Destinations without a matching route are returned with a null next hop instead of failing the module.
+    - Mutually exclusive with C(dst_ip), one of them is required.
+    type: list
+    elements: str
+    version_added: 5.0.0
   routes:
     description:
     - Source VPC route tables.
     type: list
     elements: dict
     required: true
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.prefix_lists
+  - cloud.aws_troubleshooting.timings
 """
 
 
@@ -48,6 +60,19 @@ EXAMPLES = r"""
         network_interface_id: null
         origin: "CreateRoute"
         state: "active"
+
+- name: Get connection next hop type for several destinations
+  cloud.aws_troubleshooting.get_connection_next_hop:
+    dst_ips:
+      - "172.32.2.13"
+      - "8.8.8.8"
+    routes:
+      - destination_cidr_block: "172.32.0.0/16"
+        gateway_id: "local"
+        state: "active"
+      - destination_cidr_block: "0.0.0.0/0"
+        gateway_id: "igw-0b9da14cbd81d415c"
+        state: "active"
 """
 
 
@@ -55,68 +80,148 @@ RETURN = r"""
 next_hop:
   type: str
   description: Results from get connection next hop type.
-  returned: success
+  returned: when C(dst_ip) is provided
   sample: 'local'
+next_hops:
+  type: dict
+  description: Next hop and matched route destination for each destination address, keyed by address.
+  returned: when C(dst_ips) is provided
+  contains:
+    next_hop:
+      type: str
+      description: The route target, null when no route matches the destination.
+      sample: 'igw-0b9da14cbd81d415c'
+    destination_cidr_block:
+      type: str
+      description:
+        - The destination CIDR block of the matched route, null when no route matches the destination.
+        - The IPv6 CIDR block for a C(destination_ipv6_cidr_block) route.
+      sample: '0.0.0.0/0'
+  sample: {
+    "172.32.2.13": {"next_hop": "local", "destination_cidr_block": "172.32.0.0/16"},
+    "8.8.8.8": {"next_hop": "igw-0b9da14cbd81d415c", "destination_cidr_block": "0.0.0.0/0"}
+  }
+explanation:
+  description: The longest prefix match route of each destination, in the order of the destinations.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: Always C(route).
+      type: str
+    destination_ip:
+      description: The destination address looked up.
+      type: str
+    route:
+      description:
+        - The matched route, with its C(destination_cidr_block) and C(next_hop), C(null) if none.
+        - For a managed prefix list route, C(destination_cidr_block) is the matched CIDR of the prefix list
+          C(destination_prefix_list_id).
+      type: dict
+    scan_depth:
+      description: The number of route table trie nodes walked by the lookup.
+      type: int
+  sample:
+    - check: route
+      destination_ip: 8.8.8.8
+      route:
+        destination_cidr_block: 0.0.0.0/0
+        next_hop: igw-0b9da14cbd81d415c
+      scan_depth: 1
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(routes_indexed) or C(route_lookups).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.get_connection_next_hop
+    started: 1791331200.123
+    total_ms: 0.216
+    phases_ms:
+      index: 0.156
+      lookup: 0.027
+    counters:
+      routes_indexed: 2
+      route_lookups: 1
 """
 
 
-from ipaddress import ip_address, ip_network
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    ConnectivityError,
+    get_next_hop,
+    get_next_hops,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.prefix_lists import PREFIX_LISTS_ARGUMENT_SPEC
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
 
 
 class GetConnectionNextHopType(AnsibleModule):
     def __init__(self):
         argument_spec = dict(
-            dst_ip=dict(type="str", required=True),
+            dst_ip=dict(type="str"),
+            dst_ips=dict(type="list", elements="str"),
             routes=dict(type="list", elements="dict", required=True),
+            explain=dict(type="bool", default=False),
+            **PREFIX_LISTS_ARGUMENT_SPEC,
+            **TIMINGS_ARGUMENT_SPEC,
         )
 
-        super(GetConnectionNextHopType, self).__init__(argument_spec=argument_spec)
+        super(GetConnectionNextHopType, self).__init__(
+            argument_spec=argument_spec,
+            mutually_exclusive=[["dst_ip", "dst_ips"]],
+            required_one_of=[["dst_ip", "dst_ips"]],
+        )
 
         for key in argument_spec:
             setattr(self, key, self.params.get(key))
 
-        self.execute_module()
-
-    def get_next_hop(self):
-        destination = ip_address(self.dst_ip)
-        most_specific = -1
-        next_hop = None
-
-        for route in self.routes:
-            if route.get("destination_cidr_block"):
-                mask = int(route["destination_cidr_block"].split("/")[1])
-                if (
-                    "destination_prefix_list_id" not in str(route)
-                    and destination in ip_network(route["destination_cidr_block"], strict=False)
-                    and mask > most_specific
-                ):
-                    if route["state"] != "blackhole":
-                        most_specific = mask
-                        next_hop = route
-        # 0.0.0.0/0
-        if most_specific >= 0:
-            return (
-                next_hop.get("egress_only_internet_gateway_id")
-                or next_hop.get("gateway_id")
-                or next_hop.get("instance_id")
-                or next_hop.get("network_interface_id")
-                or next_hop.get("local_gateway_id")
-                or next_hop.get("nat_gateway_id")
-                or next_hop.get("transit_gateway_id")
-                or next_hop.get("vpc_peering_connection_id")
-            )
-        self.fail_json(msg="No route found for destination: {0}".format(self.dst_ip))
+        with module_timings(self):
+            self.execute_module()
 
     def execute_module(self):
-        next_hop = None
+        explanation = [] if self.explain else None
+        details = {} if explanation is None else dict(explanation=explanation)
 
         try:
-            next_hop = self.get_next_hop()
-            self.exit_json(next_hop=next_hop)
+            if self.dst_ips is not None:
+                self.exit_json(
+                    next_hops=get_next_hops(
+                        self.routes, self.dst_ips, prefix_lists=self.prefix_lists, explanation=explanation
+                    ),
+                    **details,
+                )
+            self.exit_json(
+                next_hop=get_next_hop(
+                    self.routes, self.dst_ip, prefix_lists=self.prefix_lists, explanation=explanation
+                ),
+                **details,
+            )
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **details)
         except Exception as e:
-            self.fail_json(msg="Failed to get connection next hop type: {0}".format(e))
+            self.fail_json(msg="Failed to get connection next hop type: {0}".format(e), **details)
 
 
 def main():
@@ -0,0 +1,314 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: probe_tcp_connectivity
+short_description: Probe the TCP reachability of many targets concurrently
+description:
+  - Open and close a TCP connection to each target of a list, to confirm the verdicts of the evaluation modules, e.g.
+    M(cloud.aws_troubleshooting.eval_connectivity_regions), with real traffic.
+  - The targets are probed concurrently, with a bounded number of connections in progress, each connection attempt must
+    be established within a deadline.
+  - The latency of the established connections is reported per target, and as percentiles and a histogram for all the
+    targets.
+  - The probes are made from the host the module runs on, delegate the task to the source of the flows to probe them.
+  - No data is sent, the connections are closed once established.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  targets:
+    description:
+    - The targets to open a TCP connection to.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description:
+        - A name identifying the target in the results.
+        type: str
+      host:
+        description:
+        - The IP address or the host name of the target.
+        type: str
+        required: true
+      port:
+        description:
+        - The TCP port of the target.
+        type: int
+        required: true
+      timeout:
+        description:
+        - The deadline of each connection attempt to the target, in seconds, instead of O(timeout).
+        type: float
+      expected:
+        description:
+        - Whether the target is expected to be reachable, e.g. whether an evaluation module allows the traffic.
+        - RV(results[].agrees) reports whether the probe confirms it.
+        type: bool
+  timeout:
+    description:
+    - The deadline of each connection attempt, in seconds.
+    type: float
+    default: 3.0
+  attempts:
+    description:
+    - The number of connection attempts to each target, one after the other.
+    - A target is reachable when one attempt establishes a connection.
+    type: int
+    default: 1
+  max_concurrent_connections:
+    description:
+    - The maximum number of connection attempts in progress at the same time.
+    type: int
+    default: 64
+  histogram_buckets_ms:
+    description:
+    - The upper bounds of the latency histogram buckets, in milliseconds.
+    type: list
+    elements: float
+    default: [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Check that the application instance reaches the database tier
+  cloud.aws_troubleshooting.probe_tcp_connectivity:
+    targets:
+      - name: app-to-db-1
+        host: 10.0.2.30
+        port: 5432
+        expected: true
+      - name: app-to-db-2
+        host: 10.0.3.30
+        port: 5432
+        expected: true
+      - name: app-to-admin
+        host: 10.0.4.10
+        port: 22
+        timeout: 1
+        expected: false
+    attempts: 3
+  delegate_to: app-instance
+  register: probes
+
+- name: Show the targets whose probe does not confirm the evaluation
+  ansible.builtin.debug:
+    msg: "{{ probes.results | selectattr('agrees', 'defined') | rejectattr('agrees') }}"
+"""
+
+
+RETURN = r"""
+results:
+  type: list
+  elements: dict
+  description: The result of each target, in order of O(targets).
+  returned: always
+  contains:
+    name:
+      type: str
+      description: The name of the target.
+      returned: when O(targets[].name) is set
+      sample: 'app-to-db-1'
+    host:
+      type: str
+      description: The host of the target.
+      sample: '10.0.2.30'
+    port:
+      type: int
+      description: The port of the target.
+      sample: 5432
+    status:
+      type: str
+      description:
+        - V(reachable) when a connection was established.
+        - Otherwise the failure of the last attempt, V(refused) when the connection was refused, V(timeout) when it was
+          not established within the deadline, V(error) when it failed otherwise, e.g. on a name resolution failure.
+      sample: 'reachable'
+    attempts:
+      type: int
+      description: The number of connection attempts.
+      sample: 3
+    established:
+      type: int
+      description: The number of connections established.
+      sample: 3
+    latencies_ms:
+      type: list
+      elements: float
+      description:
+        - The time to establish each connection, in milliseconds, including the name resolution of host names.
+      sample: [1.236, 0.912, 0.874]
+    msg:
+      type: str
+      description: Why no connection was established.
+      returned: when the target is not reachable
+      sample: 'No connection established within 1.0 seconds'
+    expected:
+      type: bool
+      description: Whether the target is expected to be reachable.
+      returned: when O(targets[].expected) is set
+      sample: true
+    agrees:
+      type: bool
+      description: Whether the target is reachable as expected.
+      returned: when O(targets[].expected) is set
+      sample: true
+summary:
+  type: dict
+  description: The number of targets by status, and the latency of all the connections established.
+  returned: always
+  contains:
+    reachable:
+      type: int
+      description: The number of targets reachable.
+    refused:
+      type: int
+      description: The number of targets refusing the connections.
+    timeout:
+      type: int
+      description: The number of targets not answering within the deadline.
+    error:
+      type: int
+      description: The number of targets the connections failed to otherwise.
+    disagreements:
+      type: int
+      description: The number of targets not reachable as expected.
+    latency_ms:
+      type: dict
+      description:
+        - The minimum, maximum and mean latency and its 50th, 90th, 95th and 99th percentiles, in milliseconds.
+        - Null when no connection was established.
+    histogram:
+      type: list
+      elements: dict
+      description:
+        - The number of connections by latency bucket, see O(histogram_buckets_ms).
+        - A connection is counted in the first bucket whose C(le_ms) its latency does not exceed, the last bucket, with a
+          null C(le_ms), counts the latencies above every bound.
+  sample:
+    reachable: 2
+    refused: 0
+    timeout: 1
+    error: 0
+    disagreements: 0
+    latency_ms:
+      min: 0.874
+      max: 1.581
+      mean: 1.104
+      p50: 1.012
+      p90: 1.581
+      p95: 1.581
+      p99: 1.581
+    histogram:
+      - {"le_ms": 1.0, "count": 2}
+      - {"le_ms": 2.0, "count": 4}
+      - {"le_ms": 5.0, "count": 0}
+      - {"le_ms": null, "count": 0}
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(tcp_connections_attempted) or C(tcp_connections_established).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.probe_tcp_connectivity
+    started: 1791331200.123
+    total_ms: 1012.254
+    phases_ms:
+      probe: 1008.412
+    counters:
+      tcp_connections_attempted: 9
+      tcp_connections_established: 6
+"""
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.tcp_probe import (
+    HISTOGRAM_BUCKETS_MS,
+    probe,
+    summarize,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
+
+TARGET_OPTIONS = dict(
+    name=dict(type="str"),
+    host=dict(type="str", required=True),
+    port=dict(type="int", required=True),
+    timeout=dict(type="float"),
+    expected=dict(type="bool"),
+)
+
+
+class ProbeTcpConnectivity(AnsibleModule):
+    def __init__(self):
+        argument_spec = dict(
+            targets=dict(type="list", elements="dict", required=True, options=TARGET_OPTIONS),
+            timeout=dict(type="float", default=3.0),
+            attempts=dict(type="int", default=1),
+            max_concurrent_connections=dict(type="int", default=64),
+            histogram_buckets_ms=dict(type="list", elements="float", default=list(HISTOGRAM_BUCKETS_MS)),
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        super(ProbeTcpConnectivity, self).__init__(argument_spec=argument_spec, supports_check_mode=True)
+
+        for key in argument_spec:
+            setattr(self, key, self.params.get(key))
+
+        with module_timings(self):
+            self.execute_module()
+
+    def execute_module(self):
+        if self.attempts < 1 or self.max_concurrent_connections < 1:
+            self.fail_json(msg="attempts and max_concurrent_connections must be greater than 0")
+        if self.timeout <= 0 or any(
+            target["timeout"] is not None and target["timeout"] <= 0 for target in self.targets
+        ):
+            self.fail_json(msg="timeout must be greater than 0")
+        invalid = [target["port"] for target in self.targets if not 0 < target["port"] <= 65535]
+        if invalid:
+            self.fail_json(msg="Invalid port(s) {0}".format(", ".join(str(port) for port in invalid)))
+
+        results = probe(
+            self.targets,
+            attempts=self.attempts,
+            timeout=self.timeout,
+            max_concurrent_connections=self.max_concurrent_connections,
+        )
+        self.exit_json(results=results, summary=summarize(results, self.histogram_buckets_ms))
+
+
+def main():
+    ProbeTcpConnectivity()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: resource_info
+short_description: Describe AWS resources with snapshot capture and replay
+description:
+  - Run an AWS information module, such as M(amazon.aws.ec2_eni_info), and return its result unchanged.
+  - In capture mode, the result of each describe call is also written to a local snapshot file.
+  - In replay mode, results are read from the snapshot file and no AWS API call is made, no credentials are needed.
+  - When C(cache_ttl) is set, results are cached on the controller and reused by later runs until they expire.
+  - The play C(module_defaults), such as C(group/aws), are applied to the information module.
+  - This is an action plugin, the information module runs on the target only when the result is not replayed.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  module:
+    description:
+    - The name of the information module to run.
+    - Required unless O(run_finished=true).
+    type: str
+  module_args:
+    description:
+    - The arguments of the information module.
+    type: dict
+    default: {}
+  run_id:
+    description:
+    - Identifier of the run the describe results are memoized for, e.g. the time the run started at.
+    - A describe call repeated with the same module and arguments during the run returns the memoized result, no AWS API
+      call is made.
+    - The memo writes the describe results to disk on the controller, in the C(memo) directory of O(cache_dir), per run
+      and host, whatever O(cache_ttl). It is removed by a task with O(run_finished=true) once the run finishes,
+      otherwise a day after the run.
+    - The memo is not used with O(cache_bypass=true).
+    type: str
+  run_finished:
+    description:
+    - Remove the memo of O(run_id) for the host instead of running an information module.
+    type: bool
+    default: false
+  snapshot_mode:
+    description:
+    - C(disabled) runs the information module.
+    - C(capture) runs the information module and stores its result in C(snapshot_file).
+    - C(replay) returns the result stored in C(snapshot_file) and fails when the describe call was not captured.
+    type: str
+    default: disabled
+    choices: ['disabled', 'capture', 'replay']
+  snapshot_file:
+    description:
+    - Path of the snapshot file on the controller.
+    - Required when C(snapshot_mode) is C(capture) or C(replay).
+    type: path
+  cache_ttl:
+    description:
+    - Number of seconds a cached describe result is reused.
+    - C(0) disables the cache.
+    type: int
+    default: 0
+  cache_dir:
+    description:
+    - Directory of the describe cache on the controller.
+    type: path
+    default: ~/.ansible/cache/aws_troubleshooting
+  cache_invalidate:
+    description:
+    - Resource IDs, e.g. C(sg-0123456789abcdef0), and information modules, by FQCN or short name, e.g.
+      C(ec2_security_group_info), whose cached results are discarded.
+    - A resource ID discards the cached results whose module arguments, e.g. filters, or whose result contain it, e.g.
+      the security groups described with the changed one. List the subnet or the VPC of a new route table or network ACL
+      association, the cached results of the subnet or VPC lookups do not contain the new resource.
+    - An information module discards every cached result of the module.
+    - The describe call is made and its fresh result replaces the cached one.
+    type: list
+    elements: str
+    default: []
+  cache_bypass:
+    description:
+    - Do not read nor write the describe cache, nor the memo of O(run_id).
+    type: bool
+    default: false
+notes:
+  - Describe calls are identified by module, module arguments and region; credentials are not part of the identity.
+  - A snapshot captured in a single region can be replayed without configuring a region.
+  - Cached results are not shared between profiles, access keys, regions and endpoints, whether they are set by module
+    arguments or by the C(AWS_PROFILE), C(AWS_ACCESS_KEY_ID), C(AWS_REGION), C(AWS_DEFAULT_REGION) or C(AWS_URL)
+    environment variables and their aliases.
+  - The describe cache is only used when the information module runs on the controller, the environment of a remote
+    host is not known.
+  - C(snapshot_mode=replay) takes precedence over the memo of the run, which takes precedence over the describe cache.
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Gather information about source ENI and record it
+  cloud.aws_troubleshooting.resource_info:
+    module: amazon.aws.ec2_eni_info
+    module_args:
+      filters:
+        addresses.private-ip-address: "172.32.1.31"
+    snapshot_mode: capture
+    snapshot_file: /tmp/incident-1234.json
+  register: src_eni
+
+- name: Reuse security groups described less than 5 minutes ago
+  cloud.aws_troubleshooting.resource_info:
+    module: amazon.aws.ec2_security_group_info
+    module_args:
+      filters:
+        group-id: sg-0123456789abcdef0
+    cache_ttl: 300
+  register: security_groups
+
+- name: Rerun the connectivity_troubleshooter role after a security group change
+  ansible.builtin.include_role:
+    name: cloud.aws_troubleshooting.connectivity_troubleshooter
+  vars:
+    connectivity_troubleshooter_destination_ip: 172.31.2.8
+    connectivity_troubleshooter_destination_port: 443
+    connectivity_troubleshooter_source_ip: 172.31.2.7
+    connectivity_troubleshooter_cache_ttl: 300
+    connectivity_troubleshooter_cache_invalidate:
+      - sg-0123456789abcdef0
+
+- name: Describe the source ENI once for the tasks of a run
+  cloud.aws_troubleshooting.resource_info:
+    module: amazon.aws.ec2_eni_info
+    module_args:
+      filters:
+        addresses.private-ip-address: "172.32.1.31"
+    run_id: "{{ run_started }}"
+  register: src_eni
+
+- name: Remove the describe results memoized for the run
+  cloud.aws_troubleshooting.resource_info:
+    run_id: "{{ run_started }}"
+    run_finished: true
+
+- name: Replay the connectivity_troubleshooter role from a snapshot
+  ansible.builtin.include_role:
+    name: cloud.aws_troubleshooting.connectivity_troubleshooter
+  vars:
+    connectivity_troubleshooter_destination_ip: 172.31.2.8
+    connectivity_troubleshooter_destination_port: 443
+    connectivity_troubleshooter_source_ip: 172.31.2.7
+    connectivity_troubleshooter_snapshot_mode: replay
+    connectivity_troubleshooter_snapshot_file: /tmp/incident-1234.json
+"""
+
+
+RETURN = r"""
+# The result of the information module, e.g. network_interfaces for amazon.aws.ec2_eni_info
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(describe_calls), C(describe_memo_hits) or C(describe_snapshot_replays).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.resource_info
+    started: 1791331200.123
+    total_ms: 1435.818
+    phases_ms:
+      describe: 1435.76
+    counters:
+      describe_calls: 1
+"""
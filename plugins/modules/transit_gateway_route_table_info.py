@@ -0,0 +1,179 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: transit_gateway_route_table_info
+short_description: Describe transit gateway route tables with their associations and routes
+description:
+  - Describe transit gateway route tables, with the attachments associated with each route table and its active and
+    blackhole routes.
+  - The associations and routes of the route tables are fetched concurrently.
+  - A route search returns at most 1000 routes, larger route tables are searched again per half of the address space
+    until every search is complete.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  filters:
+    description:
+    - A dict of filters to apply, e.g. C(transit-gateway-id).
+    - See U(https://docs.aws.amazon.com/AWSEC2/latest/APIReference/API_DescribeTransitGatewayRouteTables.html) for
+      possible filters.
+    type: dict
+    default: {}
+notes:
+  - Describe the route tables of a transit gateway with the C(transit-gateway-id) filter so that the result can be
+    shared by the flows through that transit gateway.
+extends_documentation_fragment:
+  - amazon.aws.common.modules
+  - amazon.aws.region.modules
+  - amazon.aws.boto3
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Describe the route tables of a transit gateway
+  cloud.aws_troubleshooting.transit_gateway_route_table_info:
+    filters:
+      transit-gateway-id: tgw-0c4ab6e9fe6a1b1a2
+  register: tgw_route_tables
+"""
+
+
+RETURN = r"""
+transit_gateway_route_tables:
+  description: The transit gateway route tables.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    transit_gateway_route_table_id:
+      description: The ID of the transit gateway route table.
+      type: str
+      sample: tgw-rtb-0a2b6e1c4d8f9e7a1
+    transit_gateway_id:
+      description: The ID of the transit gateway.
+      type: str
+      sample: tgw-0c4ab6e9fe6a1b1a2
+    state:
+      description: The state of the transit gateway route table.
+      type: str
+      sample: available
+    default_association_route_table:
+      description: Whether this is the default association route table of the transit gateway.
+      type: bool
+    default_propagation_route_table:
+      description: Whether this is the default propagation route table of the transit gateway.
+      type: bool
+    associations:
+      description: The attachments associated with the route table.
+      type: list
+      elements: dict
+      sample:
+        - resource_id: vpc-0e50f118140008d0c
+          resource_type: vpc
+          state: associated
+          transit_gateway_attachment_id: tgw-attach-0d1ad4e9a8ebb5a63
+    routes:
+      description: The active and blackhole routes of the route table.
+      type: list
+      elements: dict
+      sample:
+        - destination_cidr_block: 10.1.0.0/16
+          state: active
+          transit_gateway_attachments:
+            - resource_id: vpc-0e50f118140008d0c
+              resource_type: vpc
+              transit_gateway_attachment_id: tgw-attach-0d1ad4e9a8ebb5a63
+          type: propagated
+    tags:
+      description: The tags of the route table.
+      type: dict
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(transit_gateway_route_searches).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.transit_gateway_route_table_info
+    started: 1791331200.123
+    total_ms: 184.254
+    phases_ms: {}
+    counters:
+      transit_gateway_route_searches: 2
+"""
+
+
+from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
+from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
+from ansible_collections.amazon.aws.plugins.module_utils.transformation import ansible_dict_to_boto3_filter_list
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_info import (
+    describe_transit_gateway_route_tables,
+    format_transit_gateway_route_table,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
+
+
+class TransitGatewayRouteTableInfo:
+    def __init__(self):
+        argument_spec = dict(
+            filters=dict(type="dict", default={}),
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        self.module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
+
+        for key in argument_spec:
+            setattr(self, key, self.module.params.get(key))
+
+        with module_timings(self.module):
+            self.execute_module()
+
+    def execute_module(self):
+        client = self.module.client("ec2")
+        try:
+            route_tables = describe_transit_gateway_route_tables(
+                client, Filters=ansible_dict_to_boto3_filter_list(self.filters)
+            )
+        except AnsibleAWSError as e:
+            self.module.fail_json_aws_error(e)
+        self.module.exit_json(
+            changed=False,
+            transit_gateway_route_tables=[
+                format_transit_gateway_route_table(route_table) for route_table in route_tables
+            ],
+        )
+
+
+def main():
+    TransitGatewayRouteTableInfo()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: validate_connectivity
+short_description: Evaluates security group rules, network ACLs and route tables in one task
+description:
+  - Run the checks of M(cloud.aws_troubleshooting.validate_security_group_rules),
+    M(cloud.aws_troubleshooting.validate_network_acls) and M(cloud.aws_troubleshooting.validate_route_tables) in a single
+    task, on the results of M(cloud.aws_troubleshooting.gather_network_info) for the Source and the Destination.
+  - Source can be an EC2 instance trying to connect to an RDS instance (Destination).
+  - Every check is run whichever denies the traffic, the verdicts of all the checks are reported together.
+  - The security group rules and network ACLs are evaluated for each address of O(src_private_ip), the traffic is allowed
+    when it is for all of them.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  src_network_info:
+    description:
+    - The subnets, network ACLs, security groups and route tables of the Source, as returned by
+      M(cloud.aws_troubleshooting.gather_network_info).
+    type: dict
+    required: true
+  src_private_ip:
+    description:
+    - Source Private IPs.
+    type: list
+    elements: str
+    required: true
+  dest_network_info:
+    description:
+    - The subnets, network ACLs, security groups and route tables of the Destination, as returned by
+      M(cloud.aws_troubleshooting.gather_network_info).
+    type: dict
+    required: true
+  dest_port:
+    description:
+    - Destination Endpoint Ports, each a port or a port range such as C(1024-65535).
+    type: list
+    elements: str
+    required: true
+  checks:
+    description:
+    - The checks to run.
+    type: list
+    elements: str
+    choices: ['security_groups', 'network_acls', 'route_tables']
+    default: ['security_groups', 'network_acls', 'route_tables']
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.timings
+"""
+
+EXAMPLES = r"""
+- name: Gather the network configuration of the RDS instance
+  cloud.aws_troubleshooting.gather_network_info:
+    subnet_ids: "{{ rds_subnet_ids }}"
+    security_group_ids: "{{ rds_security_group_ids }}"
+    vpc_id: "{{ rds_vpc_id }}"
+  register: rds_network_info
+
+- name: Gather the network configuration of the EC2 instance
+  cloud.aws_troubleshooting.gather_network_info:
+    subnet_ids:
+      - "{{ ec2_subnet_id }}"
+    security_group_ids: "{{ ec2_security_group_ids }}"
+    vpc_id: "{{ ec2_vpc_id }}"
+  register: ec2_network_info
+
+- name: Evaluate security group rules, network ACLs and route tables from EC2 instance to RDS Instance
+  cloud.aws_troubleshooting.validate_connectivity:
+    src_network_info: "{{ ec2_network_info }}"
+    src_private_ip:
+      - "172.10.3.10"
+    dest_network_info: "{{ rds_network_info }}"
+    dest_port:
+      - 5432
+"""
+
+RETURN = r"""
+result:
+  type: str
+  description: Results from evaluating the security group rules, network ACLs and route tables.
+  returned: success
+  sample: 'Connectivity validation successful'
+verdicts:
+  description:
+    - The verdict of each check of O(checks), keyed by check.
+  type: dict
+  returned: when the checks are run
+  contains:
+    allowed:
+      description: Whether the check allows the traffic.
+      type: bool
+    result:
+      description: The result of the check, when it allows the traffic.
+      type: str
+    msg:
+      description: Why the check denies the traffic.
+      type: str
+    allowed_ports:
+      description: The destination ports and port ranges the check allows traffic on, for the security group and network ACL
+        checks.
+      type: list
+      elements: str
+    denied_ports:
+      description: The destination ports and port ranges the check denies traffic on, for the security group and network ACL
+        checks.
+      type: list
+      elements: str
+    denied_addresses:
+      description: The addresses of O(src_private_ip) the check denies traffic from, for the security group and network ACL
+        checks.
+      type: list
+      elements: str
+  sample:
+    security_groups:
+      allowed: true
+      result: Security Group validation successful
+      allowed_ports:
+        - "5432"
+      denied_ports: []
+      denied_addresses: []
+    network_acls:
+      allowed: false
+      msg: >-
+        Network acl acl-01124846ef9f50ff2 is not allowing traffic for port(s) 5432.Please review network acl for
+        ingress rules allowing port(s) 5432
+      allowed_ports: []
+      denied_ports:
+        - "5432"
+      denied_addresses:
+        - "172.10.3.10"
+    route_tables:
+      allowed: true
+      result: Resources located in the same VPC.
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(security_group_rules_scanned) or C(network_acl_rules_scanned).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.validate_connectivity
+    started: 1791331200.123
+    total_ms: 1.254
+    phases_ms:
+      validate_security_group_rules: 0.412
+      validate_network_acls: 0.203
+      validate_route_tables: 0.118
+    counters:
+      security_group_rules_scanned: 12
+      network_acl_rules_scanned: 5
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.validation import (
+    CONNECTIVITY_CHECKS,
+    validate_connectivity,
+)
+
+
+class ValidateConnectivity(AnsibleModule):
+    def __init__(self):
+        argument_spec = dict(
+            src_network_info=dict(type="dict", required=True),
+            src_private_ip=dict(type="list", elements="str", required=True),
+            dest_network_info=dict(type="dict", required=True),
+            dest_port=dict(type="list", elements="str", required=True),
+            checks=dict(
+                type="list", elements="str", choices=list(CONNECTIVITY_CHECKS), default=list(CONNECTIVITY_CHECKS)
+            ),
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        super(ValidateConnectivity, self).__init__(argument_spec=argument_spec)
+
+        for key in argument_spec:
+            setattr(self, key, self.params.get(key))
+
+        with module_timings(self):
+            self.execute_module()
+
+    def execute_module(self):
+        if not self.src_private_ip:
+            self.fail_json(msg="src_private_ip must contain at least one address")
+        try:
+            verdicts = validate_connectivity(
+                self.src_network_info,
+                self.src_private_ip,
+                self.dest_network_info,
+                self.dest_port,
+                checks=self.checks,
+            )
+        except (KeyError, ValueError) as e:
+            self.fail_json(msg="Failed to validate connectivity: {0}".format(e))
+        failures = [
+            verdicts[name]["msg"] for name in CONNECTIVITY_CHECKS if not verdicts.get(name, {}).get("allowed", True)
+        ]
+        if failures:
+            self.fail_json(msg=" ".join(failures), verdicts=verdicts)
+        self.exit_json(result="Connectivity validation successful", verdicts=verdicts)
+
+
+def main():
+    ValidateConnectivity()
+
+
+if __name__ == "__main__":
+    main()
@@ -30,9 +30,10 @@ options:
     required: true
   dest_port:
     description:
-    - Destination Endpoint Ports.
+    - Destination Endpoint Ports, each a port or a port range such as C(1024-65535).
+    - Each network ACL is evaluated for all the ports in a single pass over its entries.
     type: list
-    elements: int
+    elements: str
     required: true
   src_network_acl_rules:
     description:
@@ -46,7 +47,9 @@ options:
     type: list
     elements: str
     required: true
-
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.explain
+  - cloud.aws_troubleshooting.timings
 """
 
 EXAMPLES = r"""
@@ -91,43 +94,106 @@ result:
   description: Results from comparing the Source network ACLs to the Destination network ACLs.
   returned: success
   sample: 'Network ACL validation successful'
+allowed_ports:
+  description: The destination ports and port ranges every network ACL allows traffic on.
+  type: list
+  elements: str
+  returned: always
+  sample:
+    - "5432"
+denied_ports:
+  description: The destination ports and port ranges some network ACL denies traffic on.
+  type: list
+  elements: str
+  returned: always
+  sample:
+    - "1024-5431"
+    - "5433-65535"
+explanation:
+  description:
+    - The entry deciding the traffic of each destination port range, for each network ACL and direction, in evaluation
+      order.
+  type: list
+  elements: dict
+  returned: when O(explain=true)
+  contains:
+    check:
+      description: Always C(network_acl).
+      type: str
+    network_acl_id:
+      description: The ID of the network ACL.
+      type: str
+    direction:
+      description: C(egress) for the source network ACLs, C(ingress) for the destination ones.
+      type: str
+    ports:
+      description: The destination port or port range decided by the entry.
+      type: str
+    allowed:
+      description: Whether the network ACL allows the traffic.
+      type: bool
+    rule:
+      description:
+        - The first matching entry, C(null) when no entry matches, the traffic is then denied.
+      type: dict
+    scan_depth:
+      description: The number of entries scanned up to the match.
+      type: int
+  sample:
+    - check: network_acl
+      network_acl_id: acl-0a0d2ed2ad8b4b4d4
+      direction: egress
+      ports: "5432"
+      allowed: true
+      rule:
+        rule_number: 100
+        protocol: all
+        rule_action: allow
+        cidr_block: 0.0.0.0/0
+        port_from: null
+        port_to: null
+      scan_depth: 1
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(network_acl_rules_scanned).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.validate_network_acls
+    started: 1791331200.123
+    total_ms: 0.652
+    phases_ms:
+      network_acl_egress: 0.171
+      network_acl_ingress: 0.348
+      validate_network_acls: 0.589
+    counters:
+      network_acl_rules_scanned: 16
 """
 
-from collections import namedtuple
-from ipaddress import ip_address, ip_network
-
 from ansible.module_utils.basic import AnsibleModule
-
-# NACL Entry format
-# [
-#   100,            -> Rule number
-#   "all",          -> protocol
-#   "allow",        -> Rule action
-#   "0.0.0.0/0",    -> CIDR block
-#   null,           -> icmp type
-#   null,           -> icmp code
-#   0,              -> port range from
-#   65535           -> port range to
-# ]
-NACLEntry = namedtuple(
-    "NACLEntry",
-    [
-        "rule_number",
-        "protocol",
-        "rule_action",
-        "cidr_block",
-        "icmp_type",
-        "icmp_code",
-        "port_range_from",
-        "port_range_to",
-    ],
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import ConnectivityError
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
 )
-
-
-def is_port_in_range(port, from_port, to_port):
-    if from_port is not None and to_port is not None:
-        return port in range(from_port, to_port + 1)
-    return True
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.validation import validate_network_acls
 
 
 class ValidateNetworkACL(AnsibleModule):
@@ -135,9 +201,11 @@ class ValidateNetworkACL(AnsibleModule):
         argument_spec = dict(
             dest_subnet_cidrs=dict(type="list", elements="str", required=True),
             dest_network_acl_rules=dict(type="list", elements="dict", required=True),
-            dest_port=dict(type="list", elements="int", required=True),
+            dest_port=dict(type="list", elements="str", required=True),
             src_network_acl_rules=dict(type="list", elements="dict", required=True),
             src_private_ip=dict(type="list", elements="str", required=True),
+            explain=dict(type="bool", default=False),
+            **TIMINGS_ARGUMENT_SPEC,
         )
 
         super(ValidateNetworkACL, self).__init__(argument_spec=argument_spec)
@@ -145,66 +213,26 @@ class ValidateNetworkACL(AnsibleModule):
         for key in argument_spec:
             setattr(self, key, self.params.get(key))
 
-        self.execute_module()
-
-    def evaluate_network_traffic(self, acl, egress=True):
-        allowed_ports = []
-        denied_ports = []
-
-        for port in self.dest_port:
-            if port in allowed_ports or port in denied_ports:
-                continue
-            acl_entries = acl.get("egress", []) if egress else acl.get("ingress", [])
-            for entry in acl_entries:
-                nacl_entry = NACLEntry(*entry)
-
-                if egress:
-                    # Evaluate traffic based on CIDR when egress is set to True
-                    eval_traffic = (
-                        ip_network(nacl_entry.cidr_block, strict=False).overlaps(ip_network(cidr, strict=False))
-                        for cidr in self.dest_subnet_cidrs
-                    )
-                else:
-                    # Evaluate traffic based on IP when egress is set to False
-                    eval_traffic = (
-                        ip_address(ip) in ip_network(nacl_entry.cidr_block, strict=False) for ip in self.src_private_ip
-                    )
-
-                if (
-                    nacl_entry.protocol in ("all", "tcp")
-                    and is_port_in_range(port, nacl_entry.port_range_from, nacl_entry.port_range_to)
-                    and any(eval_traffic)
-                ):
-                    if nacl_entry.rule_action == "allow":
-                        allowed_ports.append(port)
-                    else:
-                        denied_ports.append(port)
-
-        if len(denied_ports) > 0:
-            acl_type = "egress" if egress else "ingress"
-            self.fail_json(
-                msg="Network acl {id} is not allowing traffic for port(s) {ports}."
-                "Please review network acl for {acl_type} rules allowing port(s) {ports}".format(
-                    id=acl.get("nacl_id"),
-                    ports=denied_ports,
-                    acl_type=acl_type,
-                )
-            )
+        with module_timings(self):
+            self.execute_module()
 
     def execute_module(self):
+        explanation = [] if self.explain else None
+        details = {} if explanation is None else dict(explanation=explanation)
+        verdict = {}
         try:
-            # Verify Egress traffic from Source to Destination subnets
-            for acl in self.src_network_acl_rules:
-                self.evaluate_network_traffic(acl, egress=True)
-
-            # Verify Ingress traffic to Destination from Source Instance IP
-            for acl in self.dest_network_acl_rules:
-                self.evaluate_network_traffic(acl, egress=False)
-
-            self.exit_json(result="Network ACL validation successful")
-
-        except Exception as e:
-            self.fail_json(msg="Network ACL validation failed: {0}".format(e))
+            result = validate_network_acls(
+                self.src_network_acl_rules,
+                self.src_private_ip,
+                self.dest_network_acl_rules,
+                self.dest_subnet_cidrs,
+                self.dest_port,
+                explanation=explanation,
+                verdict=verdict,
+            )
+            self.exit_json(result=result, **verdict, **details)
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **verdict, **details)
 
 
 def main():
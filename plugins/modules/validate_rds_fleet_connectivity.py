@@ -0,0 +1,508 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+DOCUMENTATION = r"""
+---
+module: validate_rds_fleet_connectivity
+short_description: Evaluate the connectivity of many EC2 instances to many RDS instances
+description:
+  - Run the checks of M(cloud.aws_troubleshooting.validate_connectivity) from every EC2 instance of a fleet, e.g. of an Auto
+    Scaling group, to every selected RDS instance, e.g. of a DB subnet group.
+  - The EC2 instances are described in pages of O(page_size) instances, the RDS instances are described once.
+  - The subnets, network ACLs, security groups and route tables of all the EC2 and RDS instances are described once, with
+    one call per resource type.
+  - The EC2 instances in the same subnet with the same security groups are evaluated together, once per RDS instance, for
+    the private IP addresses of all of them.
+  - The checks are evaluated on the primary subnet and the security groups of each EC2 instance, as by the
+    P(cloud.aws_troubleshooting.troubleshoot_rds_connectivity#role) role.
+version_added: 5.0.0
+author:
+  - Ansible Cloud Content Team
+options:
+  ec2_instance_ids:
+    description:
+    - The IDs of the EC2 instances to evaluate the connectivity from.
+    - At least one of O(ec2_instance_ids) and O(ec2_instance_filters) is required, when both are set the instances must match
+      both.
+    type: list
+    elements: str
+  ec2_instance_filters:
+    description:
+    - Filters selecting the EC2 instances to evaluate the connectivity from, as supported by M(amazon.aws.ec2_instance_info),
+      e.g. C(tag:aws:autoscaling:groupName).
+    - Terminated and shutting down instances are ignored unless an C(instance-state-name) filter is set.
+    type: dict
+  db_instance_ids:
+    description:
+    - The identifiers of the RDS instances to evaluate the connectivity to.
+    - At least one of O(db_instance_ids) and O(db_subnet_group_name) is required, when both are set the RDS instances must
+      match both.
+    type: list
+    elements: str
+  db_subnet_group_name:
+    description:
+    - The name of a DB subnet group, the connectivity is evaluated to every RDS instance of the group.
+    type: str
+  page_size:
+    description:
+    - The maximum number of EC2 instances returned by each C(DescribeInstances) call, between 5 and 1000.
+    type: int
+    default: 1000
+  checks:
+    description:
+    - The checks to run.
+    type: list
+    elements: str
+    choices: ['security_groups', 'network_acls', 'route_tables']
+    default: ['security_groups', 'network_acls', 'route_tables']
+extends_documentation_fragment:
+  - amazon.aws.common.modules
+  - amazon.aws.region.modules
+  - amazon.aws.boto3
+  - cloud.aws_troubleshooting.timings
+"""
+
+
+EXAMPLES = r"""
+- name: Check that the instances of an Auto Scaling group reach every database of a DB subnet group
+  cloud.aws_troubleshooting.validate_rds_fleet_connectivity:
+    ec2_instance_filters:
+      tag:aws:autoscaling:groupName: app-asg
+      instance-state-name: running
+    db_subnet_group_name: app-db-subnets
+  register: fleet
+
+- name: Show the instances which cannot reach a database
+  ansible.builtin.debug:
+    msg: "{{ fleet.results | rejectattr('status', 'equalto', 'allowed') }}"
+"""
+
+
+RETURN = r"""
+results:
+  type: list
+  elements: dict
+  description: The result of each group of EC2 instances for each RDS instance, ordered by RDS instance and group.
+  returned: always
+  contains:
+    db_instance_identifier:
+      type: str
+      description: The identifier of the RDS instance.
+      sample: 'app-db-1'
+    db_port:
+      type: int
+      description: The port of the RDS instance endpoint.
+      returned: when the RDS instance has an endpoint
+      sample: 5432
+    vpc_id:
+      type: str
+      description: The VPC of the EC2 instances.
+      sample: 'vpc-0c1d2e3f4a5b6c7d8'
+    subnet_id:
+      type: str
+      description: The subnet of the EC2 instances.
+      sample: 'subnet-0a1b2c3d4e5f6a7b8'
+    security_group_ids:
+      type: list
+      elements: str
+      description: The security groups of the EC2 instances.
+      sample: ['sg-0f1c4bbd2f6c44b4b']
+    instance_ids:
+      type: list
+      elements: str
+      description: The EC2 instances of the group.
+      sample: ['i-0a1b2c3d4e5f6a7b8', 'i-0b1c2d3e4f5a6b7c8']
+    private_ips:
+      type: list
+      elements: str
+      description: The private IP addresses of the EC2 instances of the group.
+      sample: ['10.0.1.15', '10.0.1.16']
+    denied_instance_ids:
+      type: list
+      elements: str
+      description:
+        - The EC2 instances of the group with an address denied by a check.
+        - All the EC2 instances of the group when the route tables deny the traffic or it could not be evaluated.
+      sample: ['i-0b1c2d3e4f5a6b7c8']
+    status:
+      type: str
+      description:
+        - V(allowed) when every check allows the traffic from all the EC2 instances of the group, V(denied) when a check
+          denies it from one of them, see RV(results[].denied_instance_ids).
+        - V(error) when the RDS instance is not available or the checks could not be evaluated.
+      sample: 'denied'
+    result:
+      type: str
+      description: The evaluation result.
+      returned: when the traffic is allowed
+      sample: 'Connectivity validation successful'
+    msg:
+      type: str
+      description: Why the traffic is not allowed or could not be evaluated.
+      returned: when the traffic is not allowed
+      sample: >-
+        Network acl acl-01124846ef9f50ff2 is not allowing traffic for port(s) 5432.Please review network acl for
+        ingress rules allowing port(s) 5432
+    verdicts:
+      type: dict
+      description: The verdict of each check, see the RV(verdicts) of M(cloud.aws_troubleshooting.validate_connectivity).
+      returned: when the checks are run
+      sample:
+        security_groups:
+          allowed: true
+          result: Security Group validation successful
+          allowed_ports:
+            - "5432"
+          denied_ports: []
+summary:
+  type: dict
+  description:
+    - The number of EC2 instances whose traffic is allowed, denied or could not be evaluated, keyed by RDS instance.
+  returned: always
+  sample: {"app-db-1": {"allowed": 298, "denied": 2, "error": 0}}
+missing_instance_ids:
+  type: list
+  elements: str
+  description: The IDs of O(ec2_instance_ids) which were not found or did not match O(ec2_instance_filters).
+  returned: always
+  sample: []
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(instances_described), C(instance_groups) or C(network_acl_rules_scanned).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.validate_rds_fleet_connectivity
+    started: 1791331200.123
+    total_ms: 412.254
+    phases_ms:
+      describe_instances: 201.412
+      describe: 163.203
+      validate_network_acls: 4.118
+    counters:
+      describe_calls: 7
+      instances_described: 300
+      instance_groups: 3
+      network_acl_rules_scanned: 1820
+"""
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible_collections.amazon.aws.plugins.module_utils.ec2 import describe_instances
+from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
+from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
+from ansible_collections.amazon.aws.plugins.module_utils.rds import describe_db_instances
+from ansible_collections.amazon.aws.plugins.module_utils.transformation import ansible_dict_to_boto3_filter_list
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_info import (
+    gather_network_info,
+    select_network_info,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    count,
+    module_timings,
+    phase,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.validation import (
+    CONNECTIVITY_CHECKS,
+    validate_connectivity,
+)
+
+# The maximum number of values of a describe filter
+MAX_FILTER_VALUES = 200
+
+LIVE_INSTANCE_STATES = ["pending", "running", "stopping", "stopped"]
+
+
+def describe_fleet_instances(client, instance_ids, filters, page_size):
+    """Describe the EC2 instances matching instance_ids and filters, page by page.
+
+    The instance IDs are given as an instance-id filter, at most
+    MAX_FILTER_VALUES per call, as DescribeInstances does not page the
+    results of an InstanceIds request.
+    """
+    filters = dict(filters or {})
+    filters.setdefault("instance-state-name", LIVE_INSTANCE_STATES)
+    batches = []
+    remaining = list(instance_ids or [])
+    while remaining:
+        batches.append(remaining[:MAX_FILTER_VALUES])
+        remaining = remaining[MAX_FILTER_VALUES:]
+
+    instances = []
+    for batch in batches or [None]:
+        batch_filters = dict(filters, **{"instance-id": batch}) if batch else filters
+        count("describe_calls")
+        reservations = describe_instances(
+            client,
+            Filters=ansible_dict_to_boto3_filter_list(batch_filters),
+            PaginationConfig=dict(PageSize=page_size),
+        )
+        for reservation in reservations or []:
+            instances.extend(reservation.get("Instances") or [])
+    count("instances_described", len(instances))
+    return instances
+
+
+def instance_private_ips(instance):
+    addresses = [
+        address["PrivateIpAddress"]
+        for network_interface in instance.get("NetworkInterfaces") or []
+        for address in network_interface.get("PrivateIpAddresses") or []
+    ]
+    if not addresses and instance.get("PrivateIpAddress"):
+        addresses.append(instance["PrivateIpAddress"])
+    return addresses
+
+
+def group_instances(instances, instance_ips):
+    """Group the EC2 instances by VPC, subnet and security groups, in order of first instance.
+
+    The private IP addresses of each instance are set in instance_ips.
+    """
+    groups = {}
+    for instance in instances:
+        if not instance.get("SubnetId"):
+            continue
+        security_group_ids = sorted(set(group["GroupId"] for group in instance.get("SecurityGroups") or []))
+        key = (instance["VpcId"], instance["SubnetId"], tuple(security_group_ids))
+        group = groups.setdefault(
+            key,
+            dict(
+                vpc_id=instance["VpcId"],
+                subnet_id=instance["SubnetId"],
+                security_group_ids=security_group_ids,
+                instance_ids=[],
+                private_ips=[],
+            ),
+        )
+        instance_ips[instance["InstanceId"]] = instance_private_ips(instance)
+        group["instance_ids"].append(instance["InstanceId"])
+        group["private_ips"].extend(instance_ips[instance["InstanceId"]])
+    count("instance_groups", len(groups))
+    return list(groups.values())
+
+
+def db_instance_path(db_instance):
+    # The subnets, security groups and VPC of an RDS instance, as by the troubleshoot_rds_connectivity role
+    subnet_group = db_instance.get("DBSubnetGroup") or {}
+    return dict(
+        vpc_id=subnet_group.get("VpcId"),
+        subnet_ids=[subnet["SubnetIdentifier"] for subnet in subnet_group.get("Subnets") or []],
+        security_group_ids=[group["VpcSecurityGroupId"] for group in db_instance.get("VpcSecurityGroups") or []],
+    )
+
+
+def denied_instances(group, verdicts, instance_ips):
+    # The instances with an address a check denies, all of them for a check of the whole group
+    denied = set()
+    for name in CONNECTIVITY_CHECKS:
+        verdict = verdicts.get(name, {})
+        if verdict.get("allowed", True):
+            continue
+        if "denied_addresses" not in verdict:
+            return list(group["instance_ids"])
+        denied.update(verdict["denied_addresses"])
+    return [
+        instance_id
+        for instance_id in group["instance_ids"]
+        if denied.intersection(instance_ips[instance_id]) or not instance_ips[instance_id]
+    ]
+
+
+def eval_group(group, db_instance, src_network_info, dest_network_info, instance_ips, checks):
+    result = dict(db_instance_identifier=db_instance["DBInstanceIdentifier"])
+    endpoint = db_instance.get("Endpoint") or {}
+    if endpoint.get("Port") is not None:
+        result["db_port"] = endpoint["Port"]
+    result.update(group)
+
+    if db_instance.get("DBInstanceStatus") != "available":
+        result.update(
+            denied_instance_ids=list(group["instance_ids"]),
+            status="error",
+            msg="Bad DB instance status, expecting 'available', found '{0}'".format(
+                db_instance.get("DBInstanceStatus")
+            ),
+        )
+        return result
+    if not group["private_ips"]:
+        result.update(
+            status="error",
+            msg="The EC2 instances have no private IP address",
+            denied_instance_ids=list(group["instance_ids"]),
+        )
+        return result
+
+    try:
+        verdicts = validate_connectivity(
+            src_network_info, group["private_ips"], dest_network_info, [result["db_port"]], checks=checks
+        )
+    except (KeyError, ValueError) as e:
+        result.update(
+            status="error",
+            msg="Failed to validate connectivity: {0}".format(e),
+            denied_instance_ids=list(group["instance_ids"]),
+        )
+        return result
+
+    failures = [
+        verdicts[name]["msg"] for name in CONNECTIVITY_CHECKS if not verdicts.get(name, {}).get("allowed", True)
+    ]
+    if failures:
+        result.update(status="denied", msg=" ".join(failures))
+    else:
+        result.update(status="allowed", result="Connectivity validation successful")
+    result.update(verdicts=verdicts, denied_instance_ids=denied_instances(group, verdicts, instance_ips))
+    return result
+
+
+class ValidateRdsFleetConnectivity:
+    def __init__(self):
+        argument_spec = dict(
+            ec2_instance_ids=dict(type="list", elements="str"),
+            ec2_instance_filters=dict(type="dict"),
+            db_instance_ids=dict(type="list", elements="str"),
+            db_subnet_group_name=dict(type="str"),
+            page_size=dict(type="int", default=1000),
+            checks=dict(
+                type="list", elements="str", choices=list(CONNECTIVITY_CHECKS), default=list(CONNECTIVITY_CHECKS)
+            ),
+            **TIMINGS_ARGUMENT_SPEC,
+        )
+
+        self.module = AnsibleAWSModule(
+            argument_spec=argument_spec,
+            required_one_of=[
+                ["ec2_instance_ids", "ec2_instance_filters"],
+                ["db_instance_ids", "db_subnet_group_name"],
+            ],
+            supports_check_mode=True,
+        )
+
+        for key in argument_spec:
+            setattr(self, key, self.module.params.get(key))
+
+        with module_timings(self.module):
+            self.execute_module()
+
+    def describe_db_instances(self, client):
+        params = {}
+        if self.db_instance_ids:
+            params["Filters"] = ansible_dict_to_boto3_filter_list({"db-instance-id": self.db_instance_ids})
+        count("describe_calls")
+        db_instances = describe_db_instances(client, **params) or []
+        if self.db_subnet_group_name:
+            db_instances = [
+                db_instance
+                for db_instance in db_instances
+                if (db_instance.get("DBSubnetGroup") or {}).get("DBSubnetGroupName") == self.db_subnet_group_name
+            ]
+        return sorted(db_instances, key=lambda db_instance: db_instance["DBInstanceIdentifier"])
+
+    def execute_module(self):
+        if not 5 <= self.page_size <= 1000:
+            self.module.fail_json(msg="page_size must be between 5 and 1000")
+
+        ec2_client = self.module.client("ec2")
+        rds_client = self.module.client("rds")
+        instance_ids = list(dict.fromkeys(self.ec2_instance_ids or []))
+
+        try:
+            # The EC2 and RDS instances do not depend on each other
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                instances = executor.submit(
+                    describe_fleet_instances, ec2_client, instance_ids, self.ec2_instance_filters, self.page_size
+                )
+                db_instances = executor.submit(self.describe_db_instances, rds_client)
+                with phase("describe_instances"):
+                    instances = instances.result()
+                    db_instances = db_instances.result()
+        except AnsibleAWSError as e:
+            self.module.fail_json_aws_error(e)
+
+        missing = sorted(set(self.db_instance_ids or []) - set(db["DBInstanceIdentifier"] for db in db_instances))
+        if missing:
+            self.module.fail_json(msg="No DB instance found with identifier(s) {0}".format(", ".join(missing)))
+        if not db_instances:
+            self.module.fail_json(msg="No DB instance found in DB subnet group '{0}'".format(self.db_subnet_group_name))
+        if not instances:
+            self.module.fail_json(msg="No EC2 instance found")
+
+        instance_ips = {}
+        groups = group_instances(instances, instance_ips)
+        db_paths = dict((db["DBInstanceIdentifier"], db_instance_path(db)) for db in db_instances)
+
+        # One describe call per resource type for all the network paths
+        subnet_ids, security_group_ids, vpc_ids = set(), set(), set()
+        for path in [dict(group, subnet_ids=[group["subnet_id"]]) for group in groups] + list(db_paths.values()):
+            subnet_ids.update(path["subnet_ids"])
+            security_group_ids.update(path["security_group_ids"])
+            if path["vpc_id"]:
+                vpc_ids.add(path["vpc_id"])
+        try:
+            network_info = gather_network_info(
+                ec2_client, sorted(subnet_ids), sorted(security_group_ids), sorted(vpc_ids)
+            )
+        except AnsibleAWSError as e:
+            self.module.fail_json_aws_error(e)
+
+        src_network_info = [
+            select_network_info(network_info, [group["subnet_id"]], group["security_group_ids"], group["vpc_id"])
+            for group in groups
+        ]
+        results = []
+        summary = {}
+        for db_instance in db_instances:
+            identifier = db_instance["DBInstanceIdentifier"]
+            path = db_paths[identifier]
+            dest_network_info = select_network_info(
+                network_info, path["subnet_ids"], path["security_group_ids"], path["vpc_id"]
+            )
+            summary[identifier] = dict(allowed=0, denied=0, error=0)
+            for group, group_network_info in zip(groups, src_network_info):
+                result = eval_group(
+                    group, db_instance, group_network_info, dest_network_info, instance_ips, self.checks
+                )
+                denied = len(result["denied_instance_ids"])
+                summary[identifier]["allowed"] += len(group["instance_ids"]) - denied
+                summary[identifier]["error" if result["status"] == "error" else "denied"] += denied
+                results.append(result)
+
+        found = set(instance["InstanceId"] for instance in instances)
+        self.module.exit_json(
+            changed=False,
+            results=results,
+            summary=summary,
+            missing_instance_ids=[instance_id for instance_id in instance_ids if instance_id not in found],
+        )
+
+
+def main():
+    ValidateRdsFleetConnectivity()
+
+
+if __name__ == "__main__":
+    main()
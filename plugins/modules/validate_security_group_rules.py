@@ -30,8 +30,11 @@ options:
     required: true
   dest_port:
     description:
-    - Destination Endpoint Port.
-    type: int
+    - Destination Endpoint Ports, each a port or a port range such as C(1024-65535).
+    - A single port is accepted as well.
+    - Each security group rule is scanned once for all the ports.
+    type: list
+    elements: str
     required: true
   protocol:
     description:
@@ -49,7 +52,8 @@ options:
     - Source Private IP.
     type: str
     required: true
-
+extends_documentation_fragment:
+  - cloud.aws_troubleshooting.timings
 """
 
 EXAMPLES = r"""
@@ -104,6 +108,22 @@ EXAMPLES = r"""
         owner_id: "0000000000000"
         vpc_id: "vpc-0bee28efef41e1de4"
     src_private_ip: "172.10.3.10"
+
+- name: Evaluate Security group rules for the ports of a multi-engine database cluster and a port range
+  cloud.aws_troubleshooting.validate_security_group_rules:
+    dest_subnet_cidrs: "{{ dest_subnet_cidrs }}"
+    dest_security_groups: "{{ dest_security_groups }}"
+    dest_port:
+      - 3306
+      - 5432
+      - 8000-8100
+    src_security_groups: "{{ src_security_groups }}"
+    src_private_ip: "172.10.3.10"
+  register: security_groups
+
+- name: Show the denied ports
+  ansible.builtin.debug:
+    var: security_groups.denied_ports
 """
 
 RETURN = r"""
@@ -112,12 +132,63 @@ result:
   description: Results from comparing the Source security group rules to the Destination security group rules
   returned: success
   sample: 'Security Group validation successful'
+allowed_ports:
+  description: The destination ports and port ranges the security groups allow traffic on, both egress and ingress.
+  type: list
+  elements: str
+  returned: always
+  sample:
+    - "5432"
+denied_ports:
+  description: The destination ports and port ranges the security groups deny traffic on, egress or ingress.
+  type: list
+  elements: str
+  returned: always
+  sample:
+    - "3306"
+timings:
+  description:
+    - The wall time of the phases of the run and its work counters.
+    - The time of the phases run by concurrent threads adds up.
+  type: dict
+  returned: when O(collect_timings=true)
+  contains:
+    module:
+      description: The name of the module.
+      type: str
+    started:
+      description: The epoch time the run started at.
+      type: float
+    total_ms:
+      description: The wall time of the run, in milliseconds.
+      type: float
+    phases_ms:
+      description: The wall time of each phase, in milliseconds.
+      type: dict
+    counters:
+      description: The work counters, e.g. C(security_group_rules_scanned).
+      type: dict
+  sample:
+    module: cloud.aws_troubleshooting.validate_security_group_rules
+    started: 1791331200.123
+    total_ms: 13.912
+    phases_ms:
+      security_group_egress: 10.475
+      security_group_ingress: 3.229
+      validate_security_group_rules: 13.75
+    counters:
+      security_group_rules_scanned: 600
 """
 
-import copy
-from ipaddress import ip_address, ip_network
-
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import ConnectivityError
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    module_timings,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.validation import (
+    validate_security_group_rules,
+)
 
 
 class ValidateSecurityGroupRules(AnsibleModule):
@@ -125,102 +196,36 @@ class ValidateSecurityGroupRules(AnsibleModule):
         argument_spec = dict(
             dest_subnet_cidrs=dict(type="list", elements="str", required=True),
             dest_security_groups=dict(type="list", elements="dict", required=True),
-            dest_port=dict(type="int", required=True),
+            dest_port=dict(type="list", elements="str", required=True),
             src_security_groups=dict(type="list", elements="dict", required=True),
             src_private_ip=dict(type="str", required=True),
             protocol=dict(type="str", default="tcp"),
+            **TIMINGS_ARGUMENT_SPEC,
         )
 
         super(ValidateSecurityGroupRules, self).__init__(argument_spec=argument_spec)
 
-        self.execute_module()
-
-    def evaluate_security_group_rules_basedon_cidr(self, security_group, security_group_ids):
-        remote_cidrs = self.params.get("dest_subnet_cidrs")
-        required_cidrs = copy.deepcopy(remote_cidrs)
-        dest_port = self.params.get("dest_port")
-        protocol = self.params.get("protocol")
-        for rule in security_group.get("ip_permissions_egress", []):
-            if (rule["ip_protocol"] == protocol and dest_port in range(rule["from_port"], rule["to_port"] + 1)) or (
-                rule["ip_protocol"] == "-1"
-            ):
-                for group in rule["user_id_group_pairs"]:
-                    if group["group_id"] in security_group_ids:
-                        return
-                for remote_cidr in remote_cidrs:
-                    for cidrs in rule["ip_ranges"]:
-                        if ip_network(cidrs["cidr_ip"], strict=False).overlaps(ip_network(remote_cidr, strict=False)):
-                            required_cidrs.remove(remote_cidr)
-                            break
-
-        if len(required_cidrs) > 0:
-            return "Security group {id} is not allowing {protocol} traffic to/from IP ranges {ip_addr} for port(s) {port}.".format(
-                id=security_group.get("group_id"),
-                ip_addr=required_cidrs,
-                port=dest_port,
-                protocol=protocol,
-            )
+        for key in argument_spec:
+            setattr(self, key, self.params.get(key))
 
-    def evaluate_security_group_rules_basedon_ip(self, security_group, security_group_ids):
-        for rule in security_group.get("ip_permissions", []):
-            if (
-                rule["ip_protocol"] == self.params.get("protocol")
-                and self.params.get("dest_port") in range(rule["from_port"], rule["to_port"] + 1)
-            ) or (rule["ip_protocol"] == "-1"):
-                for group in rule["user_id_group_pairs"]:
-                    if group["group_id"] in security_group_ids:
-                        return
-                for cidrs in rule["ip_ranges"]:
-                    if ip_address(self.params.get("src_private_ip")) in ip_network(cidrs["cidr_ip"], strict=False):
-                        return
-
-        return "Security group {id} is not allowing {protocol} traffic to/from IP {ip_addr} for port(s) {port}.".format(
-            id=security_group.get("group_id"),
-            protocol=self.params.get("protocol"),
-            ip_addr=self.params.get("src_private_ip"),
-            port=self.params.get("dest_port"),
-        )
+        with module_timings(self):
+            self.execute_module()
 
     def execute_module(self):
+        verdict = {}
         try:
-            dest_secgroup_ids = [x["group_id"] for x in self.params.get("dest_security_groups")]
-            src_secgroup_ids = [x["group_id"] for x in self.params.get("src_security_groups")]
-
-            # Verify Egress traffic from Source Instance to Destination subnets
-            result = None
-            for sec_group in self.params.get("src_security_groups"):
-                result = self.evaluate_security_group_rules_basedon_cidr(sec_group, dest_secgroup_ids)
-                if result is None:
-                    break
-
-            if result:
-                self.fail_json(
-                    msg="{msg}. Please review security group(s) {ids} for rules allowing egress TCP traffic to port {port}".format(
-                        msg=result,
-                        ids=src_secgroup_ids,
-                        port=self.params.get("dest_port"),
-                    )
-                )
-
-            # Verify Ingress traffic to Destination from Source Instance IP
-            for sec_group in self.params.get("dest_security_groups"):
-                result = self.evaluate_security_group_rules_basedon_ip(sec_group, src_secgroup_ids)
-                if result is None:
-                    break
-
-            if result:
-                self.fail_json(
-                    msg="{msg}.Please review security group(s) {ids} for rules allowing ingress TCP traffic from port {port}".format(
-                        msg=result,
-                        ids=dest_secgroup_ids,
-                        port=self.params.get("dest_port"),
-                    )
-                )
-
-            self.exit_json(result="Security Group validation successful")
-
-        except Exception as e:
-            self.fail_json(msg="Security Group validation failed: {0}".format(e))
+            result = validate_security_group_rules(
+                self.src_security_groups,
+                self.src_private_ip,
+                self.dest_security_groups,
+                self.dest_subnet_cidrs,
+                self.dest_port,
+                protocol=self.protocol,
+                verdict=verdict,
+            )
+            self.exit_json(result=result, **verdict)
+        except ConnectivityError as e:
+            self.fail_json(msg=str(e), **verdict)
 
 
 def main():
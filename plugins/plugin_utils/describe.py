@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import os
+from contextlib import contextmanager
+
+from ansible.errors import AnsibleActionFail
+from ansible.plugins.action import ActionBase
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.timings import (
+    TIMINGS_ARGUMENT_SPEC,
+    Timings,
+    count,
+    phase,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.plugin_utils import describe_cache, describe_memo, snapshot
+
+try:
+    from ansible.executor.module_common import _apply_action_arg_defaults
+except ImportError:
+    # ansible-core < 2.19
+    from ansible.executor.module_common import get_action_args_with_defaults
+
+    _apply_action_arg_defaults = None
+
+
+# Options of the action plugins describing AWS resources through information modules
+DESCRIBE_ARGUMENT_SPEC = dict(
+    snapshot_mode=dict(type="str", default="disabled", choices=["disabled", "capture", "replay"]),
+    snapshot_file=dict(type="path"),
+    cache_ttl=dict(type="int", default=0),
+    cache_dir=dict(type="path", default="~/.ansible/cache/aws_troubleshooting"),
+    cache_invalidate=dict(type="list", elements="str", default=[]),
+    cache_bypass=dict(type="bool", default=False),
+    **TIMINGS_ARGUMENT_SPEC,
+)
+
+# Information modules of this collection calling AWS, which are not members of
+# group/aws: the group/aws module_defaults apply to them as to their amazon.aws
+# counterpart
+AWS_GROUP_MODULES = {
+    "cloud.aws_troubleshooting.transit_gateway_route_table_info": "amazon.aws.ec2_transit_gateway_info",
+}
+
+DESCRIBE_REQUIRED_IF = [
+    ["snapshot_mode", "capture", ["snapshot_file"]],
+    ["snapshot_mode", "replay", ["snapshot_file"]],
+]
+
+
+class DescribeActionBase(ActionBase):
+    """Action plugin running AWS information modules.
+
+    Results are replayed from or captured to a snapshot file, and reused from
+    the describe cache, according to the DESCRIBE_ARGUMENT_SPEC options.
+    """
+
+    TRANSFERS_FILES = False
+
+    @contextmanager
+    def collect_timings(self, result, options, name=None):
+        """Add the timings of the block to result when the collect_timings option is set."""
+        if not options.get("collect_timings"):
+            yield
+            return
+        with Timings(name or self._task.resolved_action or self._task.action) as timings:
+            try:
+                yield
+            finally:
+                result["timings"] = timings.result()
+
+    def _module_defaults(self, module, module_args):
+        if _apply_action_arg_defaults is not None:
+            return _apply_action_arg_defaults(module, self._task, module_args, self._templar)
+        return get_action_args_with_defaults(
+            module,
+            module_args,
+            self._task.module_defaults,
+            self._templar,
+            action_groups=self._task._parent._play._action_groups,
+        )
+
+    def apply_module_defaults(self, module, module_args):
+        # Apply the play module_defaults (e.g. group/aws credentials) to the describe module
+        args = self._module_defaults(module, module_args)
+        if module in AWS_GROUP_MODULES:
+            args = self._module_defaults(AWS_GROUP_MODULES[module], args)
+        return args
+
+    def resolve_module(self, name):
+        context = self._shared_loader_obj.module_loader.find_plugin_with_context(
+            name, collection_list=self._task.collections
+        )
+        if not context.resolved:
+            raise AnsibleActionFail("Could not find module {0}".format(name))
+        return context.resolved_fqcn
+
+    def module_environment(self):
+        """Return the environment the information modules run with.
+
+        None when the modules do not run on the controller, the environment of the
+        remote host is not known.
+        """
+        if self._connection.transport != "local":
+            return None
+        task_environment = {}
+        self._compute_environment_string(task_environment)
+        environment = dict(os.environ)
+        environment.update(task_environment)
+        return environment
+
+    def describe(self, name, module_args, task_vars, options):
+        """Return the result of the information module name."""
+        with phase("describe"):
+            return self._describe(name, module_args, task_vars, options)
+
+    def _describe(self, name, module_args, task_vars, options):
+        module = self.resolve_module(name)
+        args = self.apply_module_defaults(module, dict(module_args))
+        result = {}
+
+        try:
+            if options["snapshot_mode"] == "replay":
+                replayed = snapshot.replay(options["snapshot_file"], module, args)
+                if replayed is None:
+                    raise AnsibleActionFail(
+                        "No result for {0} with arguments {1} in snapshot {2}".format(
+                            module, module_args, options["snapshot_file"]
+                        )
+                    )
+                count("describe_snapshot_replays")
+                result.update(replayed)
+                result["changed"] = False
+                return result
+
+            # A describe call repeated during the run returns the memoized result, the memo is
+            # written to disk and is not used when the cache is bypassed
+            run_id = options.get("run_id") if not options["cache_bypass"] else None
+            host = task_vars.get("inventory_hostname")
+            environment = self.module_environment()
+            memo_key = describe_cache.cache_key(module, args, environment)
+            memoized = describe_memo.get(options["cache_dir"], run_id, host, memo_key) if run_id else None
+            if memoized is not None:
+                count("describe_memo_hits")
+                result.update(memoized)
+                result["changed"] = False
+                return result
+
+            # The cache outlives the run, it is not used when the environment, which may set the
+            # account, region or endpoint of the describe call, is unknown
+            use_cache = options["cache_ttl"] > 0 and not options["cache_bypass"] and environment is not None
+            cached = None
+            if use_cache:
+                cached = describe_cache.get(
+                    options["cache_dir"], module, args, environment, options["cache_ttl"], options["cache_invalidate"]
+                )
+
+            if cached is not None:
+                count("describe_cache_hits")
+                result.update(cached)
+                result["changed"] = False
+            else:
+                count("describe_calls")
+                result.update(self._execute_module(module_name=module, module_args=dict(args), task_vars=task_vars))
+                if use_cache and not result.get("failed"):
+                    describe_cache.put(options["cache_dir"], module, args, environment, result)
+
+            if options["snapshot_mode"] == "capture" and not result.get("failed"):
+                snapshot.capture(options["snapshot_file"], module, args, result)
+
+            if run_id and not result.get("failed"):
+                describe_memo.put(options["cache_dir"], run_id, host, memo_key, snapshot.strip_result(result))
+        except (OSError, ValueError) as e:
+            raise AnsibleActionFail("Failed to access the stored results of {0}: {1}".format(module, e))
+
+        return result
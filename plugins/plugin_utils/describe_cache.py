@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import hashlib
+import json
+import os
+import time
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.plugin_utils.snapshot import (
+    describe_args,
+    get_region,
+    resource_key,
+    strip_result,
+    write_json,
+)
+
+# Connection options identifying the account and the endpoint a describe call is
+# sent to, cached results are not shared between them
+SCOPE_OPTIONS = (
+    "access_key",
+    "aws_access_key",
+    "aws_access_key_id",
+    "ec2_access_key",
+    "profile",
+    "aws_profile",
+    "endpoint_url",
+    "aws_endpoint_url",
+    "ec2_url",
+    "aws_url",
+)
+
+# Environment variables the information modules read the same settings from,
+# including the region and the files defining the profiles
+SCOPE_ENVIRONMENT = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_ACCESS_KEY",
+    "EC2_ACCESS_KEY",
+    "AWS_PROFILE",
+    "AWS_DEFAULT_PROFILE",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "EC2_REGION",
+    "AWS_URL",
+    "EC2_URL",
+    "AWS_ENDPOINT_URL",
+    "AWS_ENDPOINT_URL_EC2",
+    "AWS_CONFIG_FILE",
+    "AWS_SHARED_CREDENTIALS_FILE",
+)
+
+
+def cache_key(module, module_args, environment=None):
+    """Identify a describe call and the account, region and endpoint it is sent to.
+
+    environment is the environment the information module runs with.
+    """
+    scope = [[key, module_args[key]] for key in SCOPE_OPTIONS if module_args.get(key)]
+    environment = environment or {}
+    scope += [[name, environment[name]] for name in SCOPE_ENVIRONMENT if environment.get(name)]
+    payload = json.dumps([resource_key(module, module_args, get_region(module_args)), scope], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_path(cache_dir, module, module_args, environment):
+    return os.path.join(cache_dir, cache_key(module, module_args, environment) + ".json")
+
+
+def matches_module(module, modules):
+    # Resource modules can be listed by FQCN or short name, e.g. ec2_security_group_info
+    return module in modules or module.rsplit(".", 1)[-1] in modules
+
+
+def references(value, resource_ids):
+    # Whether one of the resource IDs is a value of the nested describe arguments or result
+    if isinstance(value, dict):
+        return any(references(item, resource_ids) for item in value.values())
+    if isinstance(value, list):
+        return any(references(item, resource_ids) for item in value)
+    return isinstance(value, str) and value in resource_ids
+
+
+def get(cache_dir, module, module_args, environment, ttl, invalidate=None):
+    """Return the cached result of a describe call, None when it is missing, expired or invalidated.
+
+    invalidate lists information modules, whose cached results are all
+    invalidated, and resource IDs, which invalidate the cached results
+    filtering on them or describing them.
+    """
+    invalidate = set(invalidate or [])
+    if matches_module(module, invalidate):
+        return None
+    path = cache_path(cache_dir, module, module_args, environment)
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+    age = time.time() - entry.get("cached_at", 0)
+    if age < 0 or age >= ttl:
+        return None
+    if invalidate and (references(describe_args(module_args), invalidate) or references(entry["result"], invalidate)):
+        return None
+    return dict(entry["result"])
+
+
+def put(cache_dir, module, module_args, environment, result):
+    if not os.path.isdir(cache_dir):
+        # Describe results expose the account topology, keep them private to the user
+        os.makedirs(cache_dir, mode=0o700)
+    write_json(
+        cache_path(cache_dir, module, module_args, environment),
+        {
+            "module": module,
+            "region": get_region(module_args),
+            "module_args": describe_args(module_args),
+            "cached_at": time.time(),
+            "result": strip_result(result),
+        },
+    )
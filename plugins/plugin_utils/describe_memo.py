@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Describe results memoized for the duration of a run, e.g. of a role: the
+# tasks of a run are executed by separate worker processes, the memo is kept on
+# the controller in a directory of the describe cache per run and host, one
+# file per describe call. The memo of a run is removed when the run finishes,
+# directories of runs older than MEMO_MAX_AGE, which did not finish, are
+# removed when a new run starts.
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.plugin_utils.snapshot import write_json
+
+MEMO_DIR = "memo"
+
+# Seconds after which the memo of a run is removed
+MEMO_MAX_AGE = 86400
+
+
+def run_path(cache_dir, run_id, host):
+    digest = hashlib.sha256(json.dumps([run_id, host]).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, MEMO_DIR, digest)
+
+
+def get(cache_dir, run_id, host, key):
+    """Return the result memoized by run_id for host and cache key, None when there is none."""
+    try:
+        with open(os.path.join(run_path(cache_dir, run_id, host), key + ".json")) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def prune(memo_dir):
+    # Remove the memo of the runs which ended long ago
+    expired = time.time() - MEMO_MAX_AGE
+    for name in os.listdir(memo_dir):
+        path = os.path.join(memo_dir, name)
+        if os.path.getmtime(path) < expired:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def remove(cache_dir, run_id, host):
+    shutil.rmtree(run_path(cache_dir, run_id, host), ignore_errors=True)
+
+
+def put(cache_dir, run_id, host, key, result):
+    path = run_path(cache_dir, run_id, host)
+    if not os.path.isdir(path):
+        memo_dir = os.path.dirname(path)
+        if os.path.isdir(memo_dir):
+            prune(memo_dir)
+        elif not os.path.isdir(cache_dir):
+            # Describe results expose the account topology, keep them private to the user
+            os.makedirs(cache_dir, mode=0o700)
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    write_json(os.path.join(path, key + ".json"), result)
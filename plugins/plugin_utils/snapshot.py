@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Module options that only carry credentials or connection settings, they are
+# not part of the identity of a describe call
+CONNECTION_OPTIONS = frozenset(
+    [
+        "access_key",
+        "aws_access_key",
+        "aws_access_key_id",
+        "ec2_access_key",
+        "secret_key",
+        "aws_secret_key",
+        "aws_secret_access_key",
+        "ec2_secret_key",
+        "session_token",
+        "aws_session_token",
+        "security_token",
+        "aws_security_token",
+        "profile",
+        "aws_profile",
+        "aws_ca_bundle",
+        "validate_certs",
+        "aws_config",
+        "endpoint_url",
+        "aws_endpoint_url",
+        "ec2_url",
+        "aws_url",
+        "debug_botocore_endpoint_logs",
+    ]
+)
+
+REGION_OPTIONS = ("region", "aws_region", "ec2_region")
+
+
+def get_region(module_args):
+    for key in REGION_OPTIONS:
+        if module_args.get(key):
+            return module_args[key]
+    return None
+
+
+def describe_args(module_args):
+    # The module arguments without credentials, connection settings and internal parameters
+    return dict(
+        (key, value)
+        for key, value in module_args.items()
+        if key not in CONNECTION_OPTIONS and not key.startswith("_ansible_") and value is not None
+    )
+
+
+def resource_key(module, module_args, region):
+    # Identify a describe call by the module it runs, its arguments and the region it targets
+    module_args = dict((key, value) for key, value in describe_args(module_args).items() if key not in REGION_OPTIONS)
+    payload = json.dumps([module, region, module_args], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def strip_result(result):
+    # Keep only what a describe call returned
+    return dict((key, value) for key, value in result.items() if key not in ("invocation", "_ansible_no_log"))
+
+
+@contextmanager
+def locked(path):
+    with open(path + ".lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def read_snapshot(path):
+    if not os.path.exists(path):
+        return {"version": SNAPSHOT_FORMAT_VERSION, "resources": {}}
+    with open(path) as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError("Unsupported snapshot format version {0} in {1}".format(snapshot.get("version"), path))
+    return snapshot
+
+
+def write_json(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True, default=str)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def capture(path, module, module_args, result):
+    region = get_region(module_args)
+    with locked(path):
+        snapshot = read_snapshot(path)
+        snapshot["resources"][resource_key(module, module_args, region)] = {
+            "module": module,
+            "region": region,
+            "module_args": describe_args(module_args),
+            "result": strip_result(result),
+        }
+        write_json(path, snapshot)
+
+
+def replay(path, module, module_args):
+    """Return the captured result of a describe call, None when it was not captured.
+
+    A snapshot captured in a single region can be replayed without configuring
+    the region.
+    """
+    if not os.path.exists(path):
+        raise ValueError("Snapshot file {0} not found".format(path))
+
+    snapshot = read_snapshot(path)
+    resources = snapshot["resources"]
+    region = get_region(module_args)
+    entry = resources.get(resource_key(module, module_args, region))
+    if entry is None and region is None:
+        candidates = [
+            resources.get(resource_key(module, module_args, captured_region))
+            for captured_region in set(item["region"] for item in resources.values())
+        ]
+        candidates = [candidate for candidate in candidates if candidate is not None]
+        if len(candidates) == 1:
+            entry = candidates[0]
+    if entry is None:
+        return None
+    return dict(entry["result"])
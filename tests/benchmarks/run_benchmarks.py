@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Offline benchmarks of the evaluation cores.
+
+The module_utils evaluations behind the evaluation modules, e.g.
+eval_security_groups or the RouteTable lookups, run on synthetic topologies
+of growing size, see topology.py, and their median time and peak memory are
+reported per size. The module setup and the JSON output are left out. Each
+flow is evaluated once before it is measured, a flow the evaluation fails
+on, instead of allowing or denying it, stops the run. No AWS access is
+needed.
+
+    python tests/benchmarks/run_benchmarks.py
+    python tests/benchmarks/run_benchmarks.py --benchmark eval_security_groups --sizes 10,100 --output current.json
+    python tests/benchmarks/run_benchmarks.py --baseline main.json --threshold 1.5
+
+The collection must be importable, either installed or checked out in an
+ansible_collections/cloud/aws_troubleshooting directory.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from topology import TopologyGenerator
+
+COLLECTION_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if os.path.basename(os.path.dirname(os.path.dirname(COLLECTION_ROOT))) == "ansible_collections":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(COLLECTION_ROOT))))
+
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (  # noqa: E402
+    ConnectivityError,
+    check,
+    eval_network_acls,
+    eval_security_groups,
+    evaluation,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.route_table import RouteTable  # noqa: E402
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.validation import (  # noqa: E402
+    validate_network_acls,
+    validate_route_tables,
+    validate_security_group_rules,
+)
+
+VPC_ID = "vpc-00000000000000001"
+PEER_VPC_ID = "vpc-00000000000000002"
+
+
+@evaluation("Routes matched", "Route lookup failed")
+def match_routes(routes, dst_ips):
+    # The longest prefix match of get_connection_next_hop, the generated routes include a default route
+    route_table = RouteTable(routes)
+    for dst_ip in dst_ips:
+        if route_table.match_depth(dst_ip)[0] is None:
+            raise ConnectivityError("No route matches {0}".format(dst_ip))
+
+
+def match_routes_args(generator, size):
+    return dict(routes=generator.routes(size), dst_ips=[generator.ip() for _ in range(100)])
+
+
+def validate_route_tables_args(generator, size):
+    src_subnets = generator.subnets(2, VPC_ID, "10.0.0.0/16")
+    dest_subnets = generator.subnets(2, PEER_VPC_ID, "10.1.0.0/16")
+    src_routes = generator.routes(size, "10.0.0.0/16")
+    dest_routes = generator.routes(size, "10.1.0.0/16")
+    return dict(
+        src_subnets=src_subnets,
+        src_private_ips=[generator.ip(subnet["cidr_block"]) for subnet in src_subnets],
+        src_route_tables=[generator.route_table(VPC_ID, [subnet["id"] for subnet in src_subnets], src_routes)],
+        src_vpc_route_tables=[],
+        dest_subnets=dest_subnets,
+        dest_route_tables=[generator.route_table(PEER_VPC_ID, [subnet["id"] for subnet in dest_subnets], dest_routes)],
+        dest_vpc_route_tables=[],
+    )
+
+
+def eval_network_acls_args(generator, size):
+    src_subnet, dst_subnet = generator.subnets(2, VPC_ID)
+    return dict(
+        src_ip=generator.ip(src_subnet["cidr_block"]),
+        src_subnet_id=src_subnet["id"],
+        src_port_range="1024-65535",
+        dst_ip=generator.ip(dst_subnet["cidr_block"]),
+        dst_subnet_id=dst_subnet["id"],
+        dst_port="5432",
+        src_network_acls=[generator.network_acl(VPC_ID, [src_subnet["id"]], entries=size)],
+        dst_network_acls=[generator.network_acl(VPC_ID, [dst_subnet["id"]], entries=size)],
+    )
+
+
+def validate_network_acls_args(generator, size):
+    src_subnet, dst_subnet, other_subnet = generator.subnets(3, VPC_ID)
+    return dict(
+        src_private_ips=[generator.ip(src_subnet["cidr_block"]) for _ in range(4)],
+        src_network_acl_rules=[generator.network_acl(VPC_ID, [src_subnet["id"]], entries=size)],
+        dest_subnet_cidrs=[dst_subnet["cidr_block"], other_subnet["cidr_block"]],
+        dest_network_acl_rules=[generator.network_acl(VPC_ID, [dst_subnet["id"], other_subnet["id"]], entries=size)],
+        dest_ports=["22", "80", "443", "3306", "5432", "6379", "8080", "9200"],
+    )
+
+
+def eval_security_groups_args(generator, size):
+    groups = generator.security_groups(size, VPC_ID)
+    group_ids = [group["group_id"] for group in groups]
+    half = max(size // 2, 1)
+    return dict(
+        src_ip=generator.ip("10.0.1.0/24"),
+        src_security_groups=group_ids[:half],
+        dst_ip=generator.ip("10.0.2.0/24"),
+        dst_port=5432,
+        dst_security_groups=group_ids[half:] or group_ids,
+        security_groups=groups,
+    )
+
+
+def validate_security_group_rules_args(generator, size):
+    groups = generator.security_groups(size, VPC_ID)
+    half = max(size // 2, 1)
+    return dict(
+        src_private_ip=generator.ip("10.0.1.0/24"),
+        src_security_groups=groups[:half],
+        dest_subnet_cidrs=["10.0.2.0/24", "10.0.3.0/24"],
+        dest_security_groups=groups[half:] or groups,
+        dest_ports=["5432"],
+    )
+
+
+# name: (evaluation, keyword arguments builder, unit of the size, default sizes)
+BENCHMARKS = dict(
+    match_routes=(match_routes, match_routes_args, "routes", [100, 1000, 5000]),
+    validate_route_tables=(
+        validate_route_tables,
+        validate_route_tables_args,
+        "routes per route table",
+        [100, 1000, 5000],
+    ),
+    eval_network_acls=(eval_network_acls, eval_network_acls_args, "entries per network ACL", [10, 40, 200]),
+    validate_network_acls=(validate_network_acls, validate_network_acls_args, "entries per network ACL", [10, 40, 200]),
+    eval_security_groups=(eval_security_groups, eval_security_groups_args, "security groups of 60 rules", [4, 16, 64]),
+    validate_security_group_rules=(
+        validate_security_group_rules,
+        validate_security_group_rules_args,
+        "security groups of 60 rules",
+        [4, 16, 64],
+    ),
+)
+
+
+def outcome(function, args):
+    # Evaluate the flow without the evaluation wrapper, which reports any error
+    # as a denial: only ConnectivityError denies the traffic
+    try:
+        function.__wrapped__(**args)
+    except ConnectivityError as e:
+        return "denied: {0}".format(e)
+    return "allowed"
+
+
+def measure(function, args, repeat):
+    result = outcome(function, args)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        check(function, **args)
+        timings.append(time.perf_counter() - start)
+
+    # Separate run, tracing allocations slows the evaluation down
+    tracemalloc.start()
+    try:
+        check(function, **args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return dict(
+        median_ms=round(statistics.median(timings) * 1000, 3),
+        min_ms=round(min(timings) * 1000, 3),
+        peak_kib=round(peak / 1024.0, 1),
+        outcome=result,
+    )
+
+
+def compare(results, baseline, threshold):
+    # Return the results whose median time exceeds threshold times the baseline
+    previous = dict(((item["benchmark"], item["size"]), item) for item in baseline)
+    regressions = []
+    for item in results:
+        reference = previous.get((item["benchmark"], item["size"]))
+        if reference and item["median_ms"] > reference["median_ms"] * threshold:
+            regressions.append(dict(item, baseline_ms=reference["median_ms"]))
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--benchmark", action="append", choices=sorted(BENCHMARKS), help="run this benchmark only")
+    parser.add_argument("--sizes", help="comma separated input sizes, instead of the benchmark defaults")
+    parser.add_argument("--seed", type=int, default=0, help="topology generator seed")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per size")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with the results of a previous --output")
+    parser.add_argument("--threshold", type=float, default=1.5, help="regression ratio against the baseline")
+    return parser.parse_args()
+
+
+def main():
+    options = parse_args()
+    results = []
+    print(
+        "{0:<32} {1:>7}  {2:<28} {3:>11} {4:>11} {5:>11}  {6}".format(
+            "benchmark", "size", "unit", "median ms", "min ms", "peak KiB", "outcome"
+        )
+    )
+    for name in options.benchmark or list(BENCHMARKS):
+        function, builder, unit, sizes = BENCHMARKS[name]
+        if options.sizes:
+            sizes = [int(size) for size in options.sizes.split(",")]
+        for size in sizes:
+            args = builder(TopologyGenerator(options.seed), size)
+            try:
+                item = dict(benchmark=name, size=size, unit=unit, **measure(function, args, options.repeat))
+            except Exception as e:
+                # The generated flow is invalid, its timings would not measure the evaluation
+                sys.exit("{0} size {1} fails to evaluate: {2!r}".format(name, size, e))
+            results.append(item)
+            print(
+                "{benchmark:<32} {size:>7}  {unit:<28} {median_ms:>11} {min_ms:>11} {peak_kib:>11}  {outcome:.60}".format(
+                    **item
+                )
+            )
+
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            regressions = compare(results, json.load(f), options.threshold)
+        for item in regressions:
+            print(
+                "Regression: {benchmark} size {size} takes {median_ms} ms, {baseline_ms} ms in the baseline".format(
+                    **item
+                )
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Seeded generator of synthetic AWS network topologies.
+
+Resources are returned in the format of the amazon.aws information modules, so
+that they can be given as is to the evaluation modules. The same seed always
+generates the same topology.
+"""
+
+import random
+from ipaddress import IPv4Address, IPv4Network
+
+# Network ACL protocols, weighted towards tcp as in real estates
+NACL_PROTOCOLS = ["tcp", "tcp", "tcp", "udp", "all"]
+SECURITY_GROUP_PROTOCOLS = ["tcp", "tcp", "tcp", "udp", "-1"]
+WELL_KNOWN_PORTS = [22, 53, 80, 443, 3306, 5432, 6379, 8080, 9200]
+
+
+class TopologyGenerator:
+    def __init__(self, seed=0, supernet="10.0.0.0/8"):
+        self.random = random.Random(seed)
+        self.supernet = IPv4Network(supernet)
+        self.counters = {}
+
+    def resource_id(self, prefix):
+        self.counters[prefix] = self.counters.get(prefix, 0) + 1
+        return "{0}-{1:017x}".format(prefix, self.counters[prefix])
+
+    def cidr(self, prefix_min=16, prefix_max=28):
+        prefix = self.random.randint(max(prefix_min, self.supernet.prefixlen), prefix_max)
+        size = 2 ** (32 - prefix)
+        offset = self.random.randrange(0, self.supernet.num_addresses, size)
+        return str(IPv4Network((int(self.supernet.network_address) + offset, prefix)))
+
+    def ip(self, network=None):
+        network = IPv4Network(network) if network else self.supernet
+        return str(IPv4Address(int(network.network_address) + self.random.randrange(4, network.num_addresses - 1)))
+
+    def port_range(self):
+        if self.random.random() < 0.5:
+            port = self.random.choice(WELL_KNOWN_PORTS)
+            return port, port
+        port_from = self.random.randint(0, 60000)
+        return port_from, port_from + self.random.randint(0, 5535)
+
+    def routes(self, count, vpc_cidr="10.0.0.0/16"):
+        """Return count routes, as in amazon.aws.ec2_vpc_route_table_info, with a local and a default route."""
+        routes = [dict(destination_cidr_block=vpc_cidr, gateway_id="local", origin="CreateRouteTable", state="active")]
+        targets = [
+            ("gateway_id", "igw"),
+            ("nat_gateway_id", "nat"),
+            ("vpc_peering_connection_id", "pcx"),
+            ("transit_gateway_id", "tgw"),
+            ("network_interface_id", "eni"),
+        ]
+        target_ids = dict((key, self.resource_id(prefix)) for key, prefix in targets)
+        for _ in range(max(count - 2, 0)):
+            key = self.random.choice(targets)[0]
+            routes.append(
+                dict(
+                    destination_cidr_block=self.cidr(16, 28),
+                    origin="CreateRoute",
+                    state=self.random.choice(["active"] * 19 + ["blackhole"]),
+                    **{key: target_ids[key]},
+                )
+            )
+        routes.append(
+            dict(
+                destination_cidr_block="0.0.0.0/0",
+                gateway_id=target_ids["gateway_id"],
+                origin="CreateRoute",
+                state="active",
+            )
+        )
+        return routes[:count]
+
+    def route_table(self, vpc_id, subnet_ids, routes):
+        route_table_id = self.resource_id("rtb")
+        return dict(
+            id=route_table_id,
+            route_table_id=route_table_id,
+            vpc_id=vpc_id,
+            associations=[
+                dict(
+                    main=False,
+                    route_table_id=route_table_id,
+                    subnet_id=subnet_id,
+                    route_table_association_id=self.resource_id("rtbassoc"),
+                )
+                for subnet_id in subnet_ids
+            ],
+            routes=routes,
+            tags={},
+        )
+
+    def subnets(self, count, vpc_id, vpc_cidr="10.0.0.0/16", prefix=24):
+        networks = IPv4Network(vpc_cidr).subnets(new_prefix=prefix)
+        result = []
+        for _ in range(count):
+            subnet_id = self.resource_id("subnet")
+            result.append(dict(id=subnet_id, subnet_id=subnet_id, vpc_id=vpc_id, cidr_block=str(next(networks))))
+        return result
+
+    def network_acl_entries(self, count):
+        """Return count entries, as in amazon.aws.ec2_vpc_nacl_info, mostly allowing traffic."""
+        entries = []
+        for index in range(count):
+            protocol = self.random.choice(NACL_PROTOCOLS)
+            port_from, port_to = (None, None) if protocol == "all" else self.port_range()
+            entries.append(
+                [
+                    100 + index * 10,
+                    protocol,
+                    self.random.choice(["allow"] * 4 + ["deny"]),
+                    self.cidr(8, 28),
+                    None,
+                    None,
+                    port_from,
+                    port_to,
+                ]
+            )
+        return entries
+
+    def network_acl(self, vpc_id, subnet_ids, entries=40):
+        return dict(
+            nacl_id=self.resource_id("acl"),
+            vpc_id=vpc_id,
+            subnets=list(subnet_ids),
+            is_default=False,
+            egress=self.network_acl_entries(entries),
+            ingress=self.network_acl_entries(entries),
+            tags={},
+        )
+
+    def security_group_rule(self, group_ids):
+        protocol = self.random.choice(SECURITY_GROUP_PROTOCOLS)
+        rule = dict(ip_protocol=protocol, ip_ranges=[], ipv6_ranges=[], prefix_list_ids=[], user_id_group_pairs=[])
+        if protocol != "-1":
+            rule["from_port"], rule["to_port"] = self.port_range()
+        if group_ids and self.random.random() < 0.3:
+            rule["user_id_group_pairs"].append(dict(group_id=self.random.choice(group_ids), user_id="000000000000"))
+        else:
+            rule["ip_ranges"] = [dict(cidr_ip=self.cidr(8, 32)) for _ in range(self.random.randint(1, 3))]
+        return rule
+
+    def security_groups(self, count, vpc_id, rules=60, reference_depth=8):
+        """Return count security groups, as in amazon.aws.ec2_security_group_info.
+
+        Each group has rules ingress and rules egress rules. Groups are chained by
+        group references up to reference_depth groups deep, other references
+        target random groups.
+        """
+        group_ids = [self.resource_id("sg") for _ in range(count)]
+        groups = []
+        for index, group_id in enumerate(group_ids):
+            ingress = [self.security_group_rule(group_ids) for _ in range(rules)]
+            egress = [self.security_group_rule(group_ids) for _ in range(rules)]
+            if reference_depth and index % reference_depth and rules:
+                # Reference the previous group of the chain
+                ingress[0]["user_id_group_pairs"] = [dict(group_id=group_ids[index - 1], user_id="000000000000")]
+            groups.append(
+                dict(
+                    group_id=group_id,
+                    group_name="benchmark-{0}".format(index),
+                    description="Benchmark security group",
+                    vpc_id=vpc_id,
+                    owner_id="000000000000",
+                    ip_permissions=ingress,
+                    ip_permissions_egress=egress,
+                    tags={},
+                )
+            )
+        return groups
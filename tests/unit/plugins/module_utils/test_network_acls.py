@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# The vectorised first match evaluation must give the verdict of match_rule,
+# address by address, on seeded random network ACLs.
+
+import random
+from ipaddress import ip_address, ip_network
+
+import pytest
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.network_acls import (
+    first_match_allows,
+    match_rule,
+    parse_network_acl_entries,
+)
+
+np = pytest.importorskip("numpy")
+
+CIDRS = ["10.0.0.0/8", "10.0.1.0/24", "10.0.1.0/26", "10.0.1.7/32", "0.0.0.0/0", "::/0", "2600:1f18::/56"]
+
+
+def network_acl_entries(rng):
+    entries = []
+    for rule_number in range(100, 100 + 10 * rng.randint(1, 6), 10):
+        protocol = rng.choice(["all", "tcp", "tcp", "udp"])
+        port_from = rng.choice([0, 22, 80, 443, 1024])
+        port_to = port_from + rng.choice([0, 100, 64511])
+        if protocol == "all":
+            port_from = port_to = None
+        entries.append(
+            [rule_number, protocol, rng.choice(["allow", "deny"]), rng.choice(CIDRS), None, None, port_from, port_to]
+        )
+    return entries
+
+
+def addresses(*values):
+    return np.array([int(ip_address(value)) for value in values], dtype=np.int64)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_first_match_allows_matches_match_rule(seed):
+    rng = random.Random(seed)
+    rules = parse_network_acl_entries(network_acl_entries(rng))
+    ips = ["10.0.1.{0}".format(rng.randint(0, 255)) for _ in range(6)] + ["10.0.1.7", "10.2.0.1", "192.168.1.1"]
+    ports = [22, 80, 443, 5432]
+    values = addresses(*ips)
+    port_numbers = np.array(ports, dtype=np.int64)
+
+    allowed = first_match_allows(rules, values, values, port_numbers, port_numbers)
+    assert allowed.shape == (len(ips), len(ports))
+    for i, ip in enumerate(ips):
+        for p, port in enumerate(ports):
+            rule = match_rule(rules, ip, port=port)[0]
+            assert allowed[i, p] == (rule is not None and rule.rule_action == "allow"), (ip, port)
+
+    # Port ranges, and the empty one only matched by rules for all protocols
+    allowed = first_match_allows(rules, values, values, np.array([1024, 1]), np.array([65535, 0]))
+    for i, ip in enumerate(ips):
+        rule = match_rule(rules, ip, port_range=(1024, 65535))[0]
+        assert allowed[i, 0] == (rule is not None and rule.rule_action == "allow"), ip
+        rule = match_rule(rules, ip)[0]
+        assert allowed[i, 1] == (rule is not None and rule.rule_action == "allow"), ip
+
+
+def test_first_match_allows_skips_ipv6_entries():
+    # The default network ACL of a dual-stack VPC, behind an IPv6 deny entry
+    rules = parse_network_acl_entries(
+        [
+            [99, "all", "deny", "::/0", None, None, None, None],
+            [100, "all", "allow", "0.0.0.0/0", None, None, None, None],
+            [101, "all", "allow", "::/0", None, None, None, None],
+        ]
+    )
+    values = addresses("10.0.1.7", "172.16.0.1")
+    allowed = first_match_allows(rules, values, values, np.array([22]), np.array([22]))
+    assert allowed.tolist() == [[True], [True]]
+
+    only_ipv6 = [rule for rule in rules if rule.version == 6]
+    assert first_match_allows(only_ipv6, values, values, np.array([22]), np.array([22])).tolist() == [[False], [False]]
+
+
+def test_first_match_allows_blocks():
+    # A block is allowed by the first rule overlapping it when the rule contains the whole block
+    rules = parse_network_acl_entries(
+        [
+            [100, "tcp", "allow", "10.0.1.0/25", None, None, 0, 65535],
+            [110, "all", "deny", "10.0.1.128/25", None, None, None, None],
+            [120, "all", "allow", "0.0.0.0/0", None, None, None, None],
+        ]
+    )
+    blocks = [ip_network(cidr) for cidr in ("10.0.1.0/26", "10.0.1.0/24", "10.0.1.128/26", "10.0.2.0/24")]
+    block_from = addresses(*[block.network_address for block in blocks])
+    block_to = addresses(*[block.broadcast_address for block in blocks])
+    allowed = first_match_allows(rules, block_from, block_to, np.array([443, 1]), np.array([443, 0]))
+    assert allowed.tolist() == [[True, True], [False, False], [False, False], [True, True]]
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# The connectivity matrix must give the verdict of the per-flow evaluations,
+# flow by flow, on seeded random topologies.
+
+import json
+import random
+
+import pytest
+from ansible.module_utils import basic
+from ansible_collections.cloud.aws_troubleshooting.plugins.module_utils.connectivity import (
+    check,
+    eval_network_acls,
+    eval_security_groups,
+    get_next_hop,
+)
+from ansible_collections.cloud.aws_troubleshooting.plugins.modules import eval_connectivity_matrix
+
+try:
+    from ansible.module_utils.testing import patch_module_args
+except ImportError:
+    # ansible-core < 2.19
+    patch_module_args = None
+
+pytest.importorskip("numpy")
+
+SUBNETS = ["subnet-{0}".format(index) for index in range(3)]
+GROUPS = ["sg-{0}".format(index) for index in range(5)]
+PORTS = [22, 80, 443, 5432]
+
+
+def random_cidr(rng):
+    return rng.choice(
+        [
+            "10.0.0.0/8",
+            "10.0.{0}.0/24".format(rng.randint(0, 2)),
+            "10.0.{0}.{1}/32".format(rng.randint(0, 2), rng.randint(1, 8)),
+            "0.0.0.0/0",
+            "192.168.0.0/16",
+        ]
+    )
+
+
+def security_group_rule(rng):
+    port_from = rng.choice([0, 22, 80, 443, 1000])
+    rule = dict(
+        ip_protocol=rng.choice(["-1", "tcp", "tcp", "udp"]),
+        from_port=port_from,
+        to_port=port_from + rng.choice([0, 0, 100, 60000]),
+        ip_ranges=[dict(cidr_ip=random_cidr(rng)) for _ in range(rng.randint(0, 2))],
+        user_id_group_pairs=[dict(group_id=rng.choice(GROUPS)) for _ in range(rng.randint(0, 1))],
+    )
+    if rule["ip_protocol"] == "-1":
+        rule["from_port"] = rule["to_port"] = None
+    return rule
+
+
+def network_acl_entries(rng):
+    entries = []
+    for rule_number in range(100, 100 + 10 * rng.randint(1, 5), 10):
+        protocol = rng.choice(["all", "tcp", "tcp", "udp"])
+        port_from = rng.choice([0, 22, 80, 443, 1024])
+        port_to = port_from + rng.choice([0, 100, 64511])
+        if protocol == "all":
+            port_from = port_to = None
+        entries.append([rule_number, protocol, rng.choice(["allow", "allow", "deny"]), random_cidr(rng)])
+        entries[-1].extend([None, None, port_from, port_to])
+    return entries
+
+
+def topology(seed):
+    rng = random.Random(seed)
+    local_route = dict(destination_cidr_block="10.0.0.0/16", gateway_id="local", state="active")
+    return dict(
+        security_groups=[
+            dict(
+                group_id=group_id,
+                ip_permissions=[security_group_rule(rng) for _ in range(rng.randint(0, 4))],
+                ip_permissions_egress=[security_group_rule(rng) for _ in range(rng.randint(0, 4))],
+            )
+            for group_id in GROUPS
+        ],
+        network_acls=[
+            dict(
+                nacl_id="acl-{0}".format(index),
+                subnets=[subnet_id],
+                egress=network_acl_entries(rng),
+                ingress=network_acl_entries(rng),
+            )
+            for index, subnet_id in enumerate(SUBNETS)
+        ],
+        route_tables=[
+            dict(associations=[dict(main=True)], routes=[local_route]),
+            dict(
+                associations=[dict(main=False, subnet_id="subnet-1")],
+                routes=[local_route, dict(destination_cidr_block="10.0.2.0/24", gateway_id="pcx-1", state="active")],
+            ),
+        ],
+        network_interfaces=[
+            dict(
+                id="eni-{0}".format(index),
+                private_ip_address="10.0.{0}.{1}".format(subnet, index + 1),
+                subnet_id=SUBNETS[subnet],
+                groups=[dict(group_id=group_id) for group_id in rng.sample(GROUPS, rng.randint(1, 2))],
+            )
+            for index, subnet in enumerate(rng.randint(0, 2) for _ in range(8))
+        ],
+        ports=PORTS,
+        src_port_range=rng.choice([None, "1024-65535", "1024-2000"]),
+    )
+
+
+def run_module(args, capsys):
+    if patch_module_args is not None:
+        with patch_module_args(args), pytest.raises(SystemExit):
+            eval_connectivity_matrix.main()
+    else:
+        basic._ANSIBLE_ARGS = json.dumps(dict(ANSIBLE_MODULE_ARGS=args)).encode()
+        with pytest.raises(SystemExit):
+            eval_connectivity_matrix.main()
+    return json.loads(capsys.readouterr().out)
+
+
+def flow_allowed(args, src, dst, port):
+    # The verdict of the per-flow evaluations, in the order of the troubleshooter
+    if src is dst:
+        return False
+    route_tables = dict(
+        (association["subnet_id"], route_table)
+        for route_table in args["route_tables"]
+        for association in route_table["associations"]
+        if association.get("subnet_id")
+    )
+    main_route_table = [
+        route_table
+        for route_table in args["route_tables"]
+        if any(association.get("main") for association in route_table["associations"])
+    ][0]
+    routes = route_tables.get(src["subnet_id"], main_route_table)["routes"]
+    if get_next_hop(routes, dst["private_ip_address"]) != "local":
+        return False
+
+    src_groups = [group["group_id"] for group in src["groups"]]
+    dst_groups = [group["group_id"] for group in dst["groups"]]
+    security_groups = check(
+        eval_security_groups,
+        args["security_groups"],
+        src["private_ip_address"],
+        src_groups,
+        dst["private_ip_address"],
+        port,
+        dst_groups,
+    )
+    if not security_groups["allowed"]:
+        return False
+
+    network_acls = dict((acl["subnets"][0], acl) for acl in args["network_acls"])
+    result = check(
+        eval_network_acls,
+        src["private_ip_address"],
+        src["subnet_id"],
+        dst["private_ip_address"],
+        dst["subnet_id"],
+        port,
+        [network_acls[src["subnet_id"]]],
+        [network_acls[dst["subnet_id"]]],
+        src_port_range=args["src_port_range"],
+    )
+    return result["allowed"]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_matrix_matches_per_flow_evaluations(seed, capsys):
+    args = topology(seed)
+    result = run_module(args, capsys)
+    assert not result.get("failed"), result.get("msg")
+
+    interfaces = args["network_interfaces"]
+    for port in PORTS:
+        for i, src in enumerate(interfaces):
+            for j, dst in enumerate(interfaces):
+                expected = flow_allowed(args, src, dst, port)
+                assert (result["matrix"][str(port)][i][j] == "1") == expected, (src["id"], dst["id"], port)
+
+
+def test_matrix_skips_ipv6_network_acl_entries(capsys):
+    # The default network ACL of a dual-stack VPC, an IPv6 entry first never matches the IPv4 addresses
+    args = topology(0)
+    entries = [
+        [99, "all", "deny", "::/0", None, None, None, None],
+        [100, "all", "allow", "0.0.0.0/0", None, None, None, None],
+        [101, "all", "allow", "::/0", None, None, None, None],
+    ]
+    for acl in args["network_acls"]:
+        acl["egress"] = acl["ingress"] = entries
+    result = run_module(args, capsys)
+    assert not result.get("failed"), result.get("msg")
+
+    interfaces = args["network_interfaces"]
+    for port in PORTS:
+        for i, src in enumerate(interfaces):
+            for j, dst in enumerate(interfaces):
+                expected = flow_allowed(args, src, dst, port)
+                assert (result["matrix"][str(port)][i][j] == "1") == expected, (src["id"], dst["id"], port)
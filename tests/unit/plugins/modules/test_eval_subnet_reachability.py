@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# The route, network ACL and closure matrices of the subnet reachability index,
+# on three VPCs peered in a chain: vpc-a with vpc-b, vpc-b with vpc-c.
+
+import json
+
+import pytest
+from ansible.module_utils import basic
+from ansible_collections.cloud.aws_troubleshooting.plugins.modules import eval_subnet_reachability
+
+try:
+    from ansible.module_utils.testing import patch_module_args
+except ImportError:
+    # ansible-core < 2.19
+    patch_module_args = None
+
+np = pytest.importorskip("numpy")
+
+# The default network ACL of a dual-stack VPC, behind an IPv6 deny entry
+DEFAULT_ENTRIES = [
+    [99, "all", "deny", "::/0", None, None, None, None],
+    [100, "all", "allow", "0.0.0.0/0", None, None, None, None],
+    [101, "all", "allow", "::/0", None, None, None, None],
+]
+
+
+def peering(peering_id, requester, accepter):
+    return dict(
+        vpc_peering_connection_id=peering_id,
+        status=dict(code="active"),
+        requester_vpc_info=dict(vpc_id=requester),
+        accepter_vpc_info=dict(vpc_id=accepter),
+    )
+
+
+def topology():
+    def routes(local_cidr, *peers):
+        return [dict(destination_cidr_block=local_cidr, gateway_id="local")] + [
+            dict(destination_cidr_block=cidr, vpc_peering_connection_id=peering_id) for cidr, peering_id in peers
+        ]
+
+    subnets = [
+        dict(id="subnet-a1", vpc_id="vpc-a", cidr_block="10.0.1.0/24"),
+        dict(id="subnet-a2", vpc_id="vpc-a", cidr_block="10.0.2.0/24"),
+        dict(id="subnet-b1", vpc_id="vpc-b", cidr_block="10.1.1.0/24"),
+        dict(id="subnet-c1", vpc_id="vpc-c", cidr_block="10.2.1.0/24"),
+    ]
+    return dict(
+        subnets=subnets,
+        ports=[443, 5432],
+        src_port_range="1024-65535",
+        network_acls=[
+            dict(subnets=[subnet["id"]], egress=DEFAULT_ENTRIES, ingress=DEFAULT_ENTRIES) for subnet in subnets
+        ],
+        route_tables=[
+            dict(
+                vpc_id="vpc-a", associations=[dict(main=True)], routes=routes("10.0.0.0/16", ("10.1.0.0/16", "pcx-ab"))
+            ),
+            dict(
+                vpc_id="vpc-b",
+                associations=[dict(main=True)],
+                routes=routes("10.1.0.0/16", ("10.0.0.0/16", "pcx-ab"), ("10.2.0.0/16", "pcx-bc")),
+            ),
+            # Peering connections are not transitive, the route towards vpc-a through pcx-bc is not usable
+            dict(
+                vpc_id="vpc-c",
+                associations=[dict(main=True)],
+                routes=routes("10.2.0.0/16", ("10.1.0.0/16", "pcx-bc"), ("10.0.0.0/16", "pcx-bc")),
+            ),
+        ],
+        vpc_peering_connections=[peering("pcx-ab", "vpc-a", "vpc-b"), peering("pcx-bc", "vpc-b", "vpc-c")],
+    )
+
+
+def run_module(args, capsys):
+    if patch_module_args is not None:
+        with patch_module_args(args), pytest.raises(SystemExit):
+            eval_subnet_reachability.main()
+    else:
+        basic._ANSIBLE_ARGS = json.dumps(dict(ANSIBLE_MODULE_ARGS=args)).encode()
+        with pytest.raises(SystemExit):
+            eval_subnet_reachability.main()
+    result = json.loads(capsys.readouterr().out)
+    assert not result.get("failed"), result.get("msg")
+    return result
+
+
+def test_route_matrix(capsys):
+    result = run_module(topology(), capsys)
+    assert result["subnets"] == ["subnet-a1", "subnet-a2", "subnet-b1", "subnet-c1"]
+    routed = ["1110", "1110", "1111", "0011"]
+    assert result["matrix"] == {"443": routed, "5432": routed}
+
+
+def test_route_matrix_needs_an_active_peering(capsys):
+    args = topology()
+    args["vpc_peering_connections"][1]["status"]["code"] = "pending-acceptance"
+    result = run_module(args, capsys)
+    assert result["matrix"]["443"] == ["1110", "1110", "1110", "0001"]
+
+
+def test_network_acl_matrix(capsys):
+    args = topology()
+    # subnet-c1 denies 5432 from vpc-b, subnet-a2 denies the traffic out to vpc-b but the return traffic to 10.1.1.0/25
+    args["network_acls"][3]["ingress"] = [
+        [90, "tcp", "deny", "10.1.0.0/16", None, None, 5432, 5432],
+    ] + DEFAULT_ENTRIES
+    args["network_acls"][1]["egress"] = [
+        [90, "tcp", "allow", "10.1.1.0/25", None, None, 1024, 65535],
+        [95, "tcp", "deny", "10.1.0.0/16", None, None, 0, 65535],
+    ] + DEFAULT_ENTRIES
+    result = run_module(args, capsys)
+    # The return traffic from subnet-a2 is only allowed to a part of subnet-b1, which does not reach it either
+    assert result["matrix"]["443"] == ["1110", "1100", "1011", "0011"]
+    assert result["matrix"]["5432"] == ["1110", "1100", "1010", "0011"]
+
+
+def test_closure_matrix(capsys):
+    args = dict(topology(), transitive=True)
+    args["queries"] = [
+        dict(source_subnet="subnet-a1", destination_subnet="subnet-c1", port=443),
+        dict(source_subnet="subnet-c1", destination_subnet="subnet-b1", port=5432),
+    ]
+    result = run_module(args, capsys)
+    assert result["closure"]["443"] == ["1111", "1111", "1111", "1111"]
+    assert result["answers"] == [
+        dict(args["queries"][0], reachable=False, reachable_through_relays=True),
+        dict(args["queries"][1], reachable=True, reachable_through_relays=True),
+    ]
+
+
+def test_transitive_closure():
+    reachable = np.array(
+        [
+            [True, True, False, False, False],
+            [False, True, True, False, False],
+            [False, False, True, True, False],
+            [False, False, False, True, False],
+            [False, False, False, False, True],
+        ]
+    )
+    closure = eval_subnet_reachability.transitive_closure(reachable)
+    assert closure.astype(int).tolist() == [
+        [1, 1, 1, 1, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 1, 1, 0],
+        [0, 0, 0, 1, 0],
+        [0, 0, 0, 0, 1],
+    ]
+    assert (eval_subnet_reachability.transitive_closure(closure) == closure).all()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# cache_invalidate discards the cached results filtering on or describing the
+# listed resources, or every cached result of the listed information modules.
+
+import pytest
+from ansible_collections.cloud.aws_troubleshooting.plugins.plugin_utils import describe_cache
+
+MODULE = "amazon.aws.ec2_security_group_info"
+ENVIRONMENT = {"AWS_REGION": "us-east-1"}
+
+
+def security_groups(*group_ids):
+    return dict(changed=False, security_groups=[dict(group_id=group_id, ip_permissions=[]) for group_id in group_ids])
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    calls = [
+        (dict(filters={"group-id": ["sg-a", "sg-b"]}), security_groups("sg-a", "sg-b")),
+        (dict(filters={"group-id": ["sg-c"]}), security_groups("sg-c")),
+        (dict(filters={"vpc-id": "vpc-1"}), security_groups("sg-a", "sg-d")),
+    ]
+    for module_args, result in calls:
+        describe_cache.put(cache_dir, MODULE, module_args, ENVIRONMENT, result)
+    return cache_dir
+
+
+def cached_groups(cache_dir, invalidate):
+    # The group IDs of each describe call returned from the cache, None when it is not
+    results = []
+    for module_args in (
+        dict(filters={"group-id": ["sg-a", "sg-b"]}),
+        dict(filters={"group-id": ["sg-c"]}),
+        dict(filters={"vpc-id": "vpc-1"}),
+    ):
+        result = describe_cache.get(cache_dir, MODULE, module_args, ENVIRONMENT, 300, invalidate)
+        results.append(None if result is None else [group["group_id"] for group in result["security_groups"]])
+    return results
+
+
+def test_get_without_invalidation(cache_dir):
+    assert cached_groups(cache_dir, []) == [["sg-a", "sg-b"], ["sg-c"], ["sg-a", "sg-d"]]
+    assert cached_groups(cache_dir, ["sg-0"]) == [["sg-a", "sg-b"], ["sg-c"], ["sg-a", "sg-d"]]
+
+
+def test_invalidate_resource_in_filters(cache_dir):
+    assert cached_groups(cache_dir, ["sg-c"]) == [["sg-a", "sg-b"], None, ["sg-a", "sg-d"]]
+    assert cached_groups(cache_dir, ["vpc-1"]) == [["sg-a", "sg-b"], ["sg-c"], None]
+
+
+def test_invalidate_resource_in_result(cache_dir):
+    assert cached_groups(cache_dir, ["sg-d"]) == [["sg-a", "sg-b"], ["sg-c"], None]
+    assert cached_groups(cache_dir, ["sg-a"]) == [None, ["sg-c"], None]
+
+
+@pytest.mark.parametrize("module", [MODULE, "ec2_security_group_info"])
+def test_invalidate_module(cache_dir, module):
+    assert cached_groups(cache_dir, [module]) == [None, None, None]